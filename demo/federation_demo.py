@@ -200,18 +200,9 @@ def run_demo():
         if stp_sha:
             allele_data = export_allele(reg_a, stp_sha)
             if allele_data:
-                import httpx
-                try:
-                    resp = httpx.post(
-                        f"{peer_b.url}/api/federation/receive",
-                        json=allele_data, timeout=10.0,
-                    )
-                    ok = resp.status_code == 200
-                    print(f"  Push bridge_stp ({stp_sha[:12]}) to Beta: "
-                          f"{'success' if ok else f'FAILED ({resp.status_code}: {resp.text})'}")
-                except Exception as e:
-                    print(f"  Push bridge_stp ({stp_sha[:12]}) to Beta: "
-                          f"FAILED ({type(e).__name__}: {e})")
+                ok = push_allele(peer_b, allele_data)
+                print(f"  Push bridge_stp ({stp_sha[:12]}) to Beta: "
+                      f"{'success' if ok else 'FAILED'}")
         print()
 
         # --- Phase 4: Pull alleles ---
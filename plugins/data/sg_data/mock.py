@@ -23,7 +23,7 @@ class MockDataKernel(DataKernel):
     def __init__(self) -> None:
         self._tables: dict[str, dict[str, TableState]] = {}  # connection -> table_name -> state
         self._http_responses: dict[str, dict] = {}  # url -> response
-        self._tracked: list[tuple[str, str]] = []
+        self._tracked: dict[tuple[str, str], None] = {}
         self._injected_failures: dict[str, str] = {}
 
     def create_shadow(self) -> MockDataKernel:
@@ -56,6 +56,8 @@ class MockDataKernel(DataKernel):
         self._injected_failures[operation] = message
 
     def _check_failure(self, operation: str) -> None:
+        if not self._injected_failures:
+            return
         msg = self._injected_failures.pop(operation, None)
         if msg is not None:
             raise RuntimeError(msg)
@@ -191,14 +193,10 @@ class MockDataKernel(DataKernel):
     # --- Resource tracking ---
 
     def track_resource(self, resource_type: str, name: str) -> None:
-        pair = (resource_type, name)
-        if pair not in self._tracked:
-            self._tracked.append(pair)
+        self._tracked[(resource_type, name)] = None
 
     def untrack_resource(self, resource_type: str, name: str) -> None:
-        pair = (resource_type, name)
-        if pair in self._tracked:
-            self._tracked.remove(pair)
+        self._tracked.pop((resource_type, name), None)
 
     def tracked_resources(self) -> list[tuple[str, str]]:
         return list(self._tracked)
@@ -45,7 +45,7 @@ class ProductionDataKernel(DataKernel):
     ) -> None:
         self._dsn = dsn or os.environ.get("SG_DATA_DSN", _DEFAULT_DSN)
         self._dry_run = dry_run
-        self._tracked: list[tuple[str, str]] = []
+        self._tracked: dict[tuple[str, str], None] = {}
         self._protected = _parse_protected_tables()
         self._http_timeout = int(os.environ.get("SG_HTTP_TIMEOUT", _DEFAULT_HTTP_TIMEOUT))
 
@@ -239,14 +239,10 @@ class ProductionDataKernel(DataKernel):
         self._tracked.clear()
 
     def track_resource(self, resource_type: str, name: str) -> None:
-        pair = (resource_type, name)
-        if pair not in self._tracked:
-            self._tracked.append(pair)
+        self._tracked[(resource_type, name)] = None
 
     def untrack_resource(self, resource_type: str, name: str) -> None:
-        pair = (resource_type, name)
-        if pair in self._tracked:
-            self._tracked.remove(pair)
+        self._tracked.pop((resource_type, name), None)
 
     def tracked_resources(self) -> list[tuple[str, str]]:
         return list(self._tracked)
@@ -8,6 +8,7 @@ from __future__ import annotations
 from abc import abstractmethod
 
 from sg.kernel.base import Kernel, mutating
+from sg_network.mappers import NETWORK_RESOURCE_MAPPERS
 
 
 class NetworkKernel(Kernel):
@@ -21,7 +22,6 @@ class NetworkKernel(Kernel):
 
     def resource_mappers(self) -> dict:
         """Return network topology resource type -> mapper mappings."""
-        from sg_network.mappers import NETWORK_RESOURCE_MAPPERS
         return NETWORK_RESOURCE_MAPPERS
 
     def delete_resource(self, resource_type: str, name: str) -> None:
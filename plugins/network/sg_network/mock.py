@@ -5,40 +5,49 @@ FDB simulation, MAC operations, and anomaly injection.
 """
 from __future__ import annotations
 
+import hashlib
 import time
+from collections import deque
 from dataclasses import dataclass, field
 
 from sg_network.kernel import NetworkKernel
 
+# Per-bridge FDB capacity; like a real bridge, the oldest entries go first.
+MAX_FDB_ENTRIES = 4096
 
-@dataclass
+
+@dataclass(slots=True)
 class BridgeState:
     name: str
     interfaces: list[str]
     stp_enabled: bool = False
     forward_delay: int = 15
+    # Serialized view for the getters; reset by mutators that reassign fields.
+    _view: dict | None = field(default=None, init=False, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class BondState:
     name: str
     mode: str
     members: list[str]
     active: bool = True
+    _view: dict | None = field(default=None, init=False, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class VlanState:
     parent: str
     vlan_id: int
     name: str = ""
+    _view: dict | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if not self.name:
             self.name = f"{self.parent}.{self.vlan_id}"
 
 
-@dataclass
+@dataclass(slots=True)
 class InterfaceState:
     name: str
     mac: str = ""
@@ -47,7 +56,7 @@ class InterfaceState:
     master: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class FdbEntry:
     mac: str
     port: str
@@ -60,7 +69,7 @@ class FdbEntry:
             self.timestamp = time.time()
 
 
-@dataclass
+@dataclass(slots=True)
 class ArpEntry:
     ip: str
     mac: str
@@ -71,25 +80,42 @@ class MockNetworkKernel(NetworkKernel):
     """In-memory network simulation. Injected into genes as `gene_sdk`."""
 
     def create_shadow(self) -> MockNetworkKernel:
-        """Return a copy of this kernel for shadow execution."""
-        import copy
+        """Return a copy of this kernel for shadow execution.
+
+        Only state the kernel mutates in place is copied. VLAN, FDB and
+        ARP records are never modified after creation, so the shadow
+        shares them and just gets its own containers.
+        """
         shadow = MockNetworkKernel()
-        shadow._bridges = copy.deepcopy(self._bridges)
-        shadow._bonds = copy.deepcopy(self._bonds)
-        shadow._vlans = copy.deepcopy(self._vlans)
-        shadow._interfaces = copy.deepcopy(self._interfaces)
-        shadow._fdb = copy.deepcopy(self._fdb)
-        shadow._arp_table = copy.deepcopy(self._arp_table)
+        shadow._bridges = {
+            name: BridgeState(b.name, list(b.interfaces), b.stp_enabled,
+                              b.forward_delay)
+            for name, b in self._bridges.items()
+        }
+        shadow._bonds = {
+            name: BondState(b.name, b.mode, list(b.members), b.active)
+            for name, b in self._bonds.items()
+        }
+        shadow._vlans = dict(self._vlans)
+        shadow._interfaces = {
+            name: InterfaceState(i.name, i.mac, i.carrier, i.operstate, i.master)
+            for name, i in self._interfaces.items()
+        }
+        shadow._fdb = {name: fdb.copy() for name, fdb in self._fdb.items()}
+        shadow._arp_table = list(self._arp_table)
         return shadow
 
     def __init__(self) -> None:
         self._bridges: dict[str, BridgeState] = {}
         self._bonds: dict[str, BondState] = {}
-        self._vlans: dict[str, VlanState] = {}  # keyed by "parent.vlan_id"
+        self._vlans: dict[tuple[str, int], VlanState] = {}  # keyed by (parent, vlan_id)
         self._interfaces: dict[str, InterfaceState] = {}
-        self._fdb: dict[str, list[FdbEntry]] = {}  # keyed by bridge name
+        self._fdb: dict[str, deque[FdbEntry]] = {}  # keyed by bridge name
+        self._fdb_rows: dict[str, list[dict]] = {}  # read_fdb cache, per bridge
         self._arp_table: list[ArpEntry] = []
-        self._tracked: list[tuple[str, str]] = []
+        self._arp_rows: list[dict] | None = None  # get_arp_table cache
+        # Insertion-ordered set: O(1) track/untrack, creation order kept.
+        self._tracked: dict[tuple[str, str], None] = {}
         self._injected_failures: dict[str, str] = {}
         self._fail_at: int | None = None
         self._mutation_count: int = 0
@@ -101,7 +127,9 @@ class MockNetworkKernel(NetworkKernel):
         self._vlans.clear()
         self._interfaces.clear()
         self._fdb.clear()
+        self._fdb_rows.clear()
         self._arp_table.clear()
+        self._arp_rows = None
         self._tracked.clear()
         self._injected_failures.clear()
         self._fail_at = None
@@ -127,16 +155,12 @@ class MockNetworkKernel(NetworkKernel):
         """
         if bridge not in self._bridges:
             raise ValueError(f"bridge '{bridge}' does not exist")
-        if bridge not in self._fdb:
-            self._fdb[bridge] = []
-
+        self._fdb_rows.pop(bridge, None)
         now = time.time()
-        for i, port in enumerate(ports):
-            self._fdb[bridge].append(FdbEntry(
-                mac=mac,
-                port=port,
-                timestamp=now + i * 0.001,
-            ))
+        self._bridge_fdb(bridge).extend([
+            FdbEntry(mac=mac, port=port, timestamp=now + i * 0.001)
+            for i, port in enumerate(ports)
+        ])
 
     def inject_link_failure(self, interface: str) -> None:
         """Simulate a link going down."""
@@ -150,6 +174,8 @@ class MockNetworkKernel(NetworkKernel):
             iface.operstate = "down"
 
     def _check_failure(self, operation: str) -> None:
+        if not self._injected_failures:
+            return
         msg = self._injected_failures.pop(operation, None)
         if msg is not None:
             raise RuntimeError(msg)
@@ -161,6 +187,14 @@ class MockNetworkKernel(NetworkKernel):
                 self._fail_at = None
                 raise RuntimeError(f"simulated failure at mutation #{self._mutation_count}")
 
+    def _bridge_fdb(self, bridge: str) -> deque[FdbEntry]:
+        # One lookup on the common path.  Not setdefault(): that would
+        # allocate a throwaway deque on every call.
+        fdb = self._fdb.get(bridge)
+        if fdb is None:
+            fdb = self._fdb[bridge] = deque(maxlen=MAX_FDB_ENTRIES)
+        return fdb
+
     def _ensure_interface(self, name: str) -> InterfaceState:
         if name not in self._interfaces:
             mac = self._generate_mac(name)
@@ -169,10 +203,11 @@ class MockNetworkKernel(NetworkKernel):
 
     @staticmethod
     def _generate_mac(seed: str) -> str:
-        h = hash(seed) & 0xFFFFFFFFFFFF
-        octets = [(h >> (i * 8)) & 0xFF for i in range(6)]
+        # BLAKE2b rather than hash(): the same name gets the same MAC in
+        # every process, regardless of PYTHONHASHSEED.
+        octets = bytearray(hashlib.blake2b(seed.encode(), digest_size=6).digest())
         octets[0] = (octets[0] & 0xFE) | 0x02  # locally administered, unicast
-        return ":".join(f"{b:02x}" for b in octets)
+        return octets.hex(":")
 
     # --- Bridge operations ---
 
@@ -185,7 +220,8 @@ class MockNetworkKernel(NetworkKernel):
             raise ValueError(f"bridge '{name}' already exists")
         bridge = BridgeState(name=name, interfaces=list(interfaces))
         self._bridges[name] = bridge
-        self._fdb[name] = []
+        self._fdb[name] = deque(maxlen=MAX_FDB_ENTRIES)
+        self._fdb_rows.pop(name, None)
         self._ensure_interface(name)
         for iface in interfaces:
             state = self._ensure_interface(iface)
@@ -203,6 +239,7 @@ class MockNetworkKernel(NetworkKernel):
             if state:
                 state.master = ""
         self._fdb.pop(name, None)
+        self._fdb_rows.pop(name, None)
         self._interfaces.pop(name, None)
 
     def attach_interface(self, bridge: str, interface: str) -> None:
@@ -238,12 +275,15 @@ class MockNetworkKernel(NetworkKernel):
 
     @staticmethod
     def _bridge_dict(bridge: BridgeState) -> dict:
-        return {
-            "name": bridge.name,
-            "interfaces": bridge.interfaces,
-            "stp_enabled": bridge.stp_enabled,
-            "forward_delay": bridge.forward_delay,
-        }
+        view = bridge._view
+        if view is None:
+            view = bridge._view = {
+                "name": bridge.name,
+                "interfaces": bridge.interfaces,
+                "stp_enabled": bridge.stp_enabled,
+                "forward_delay": bridge.forward_delay,
+            }
+        return view.copy()
 
     # --- STP operations ---
 
@@ -257,6 +297,7 @@ class MockNetworkKernel(NetworkKernel):
             raise ValueError(f"forward_delay must be 1-30, got {forward_delay}")
         bridge.stp_enabled = enabled
         bridge.forward_delay = forward_delay
+        bridge._view = None
         return self._bridge_dict(bridge)
 
     def get_stp_state(self, bridge: str) -> dict:
@@ -331,51 +372,55 @@ class MockNetworkKernel(NetworkKernel):
 
     @staticmethod
     def _bond_dict(bond: BondState) -> dict:
-        return {
-            "name": bond.name,
-            "mode": bond.mode,
-            "members": bond.members,
-            "active": bond.active,
-        }
+        view = bond._view
+        if view is None:
+            view = bond._view = {
+                "name": bond.name,
+                "mode": bond.mode,
+                "members": bond.members,
+                "active": bond.active,
+            }
+        return view.copy()
 
     # --- VLAN operations ---
 
     def create_vlan(self, parent: str, vlan_id: int) -> dict:
         self._check_failure("create_vlan")
         self._check_mutation_count()
-        key = f"{parent}.{vlan_id}"
+        key = (parent, vlan_id)
         if key in self._vlans:
             raise ValueError(f"VLAN {vlan_id} already exists on '{parent}'")
         if vlan_id < 1 or vlan_id > 4094:
             raise ValueError(f"VLAN ID must be 1-4094, got {vlan_id}")
         vlan = VlanState(parent=parent, vlan_id=vlan_id)
         self._vlans[key] = vlan
-        self._ensure_interface(key)
+        self._ensure_interface(vlan.name)
         return self._vlan_dict(vlan)
 
     def delete_vlan(self, parent: str, vlan_id: int) -> None:
         self._check_failure("delete_vlan")
         self._check_mutation_count()
-        key = f"{parent}.{vlan_id}"
-        vlan = self._vlans.pop(key, None)
+        vlan = self._vlans.pop((parent, vlan_id), None)
         if vlan is None:
             raise ValueError(f"VLAN {vlan_id} does not exist on '{parent}'")
-        self._interfaces.pop(key, None)
+        self._interfaces.pop(vlan.name, None)
 
     def get_vlan(self, parent: str, vlan_id: int) -> dict | None:
-        key = f"{parent}.{vlan_id}"
-        vlan = self._vlans.get(key)
+        vlan = self._vlans.get((parent, vlan_id))
         if vlan is None:
             return None
         return self._vlan_dict(vlan)
 
     @staticmethod
     def _vlan_dict(vlan: VlanState) -> dict:
-        return {
-            "name": vlan.name,
-            "parent": vlan.parent,
-            "vlan_id": vlan.vlan_id,
-        }
+        view = vlan._view
+        if view is None:
+            view = vlan._view = {
+                "name": vlan.name,
+                "parent": vlan.parent,
+                "vlan_id": vlan.vlan_id,
+            }
+        return view.copy()
 
     # --- Diagnostic reads ---
 
@@ -383,27 +428,29 @@ class MockNetworkKernel(NetworkKernel):
         self._check_failure("read_fdb")
         if bridge not in self._bridges:
             raise ValueError(f"bridge '{bridge}' does not exist")
-        entries = self._fdb.get(bridge, [])
-        return [
-            {
-                "mac": e.mac,
-                "port": e.port,
-                "vlan": e.vlan,
-                "is_local": e.is_local,
-            }
-            for e in entries
-        ]
+        rows = self._fdb_rows.get(bridge)
+        if rows is None:
+            rows = self._fdb_rows[bridge] = [
+                {
+                    "mac": e.mac,
+                    "port": e.port,
+                    "vlan": e.vlan,
+                    "is_local": e.is_local,
+                }
+                for e in self._fdb.get(bridge, ())
+            ]
+        # Genes get their own dicts, so edits can't leak into the cache.
+        return list(map(dict.copy, rows))
 
     def add_fdb_entry(self, bridge: str, mac: str, port: str,
                       vlan: int = 0, is_local: bool = False) -> None:
         """Directly add an FDB entry (for test setup)."""
         if bridge not in self._bridges:
             raise ValueError(f"bridge '{bridge}' does not exist")
-        if bridge not in self._fdb:
-            self._fdb[bridge] = []
-        self._fdb[bridge].append(FdbEntry(
+        self._bridge_fdb(bridge).append(FdbEntry(
             mac=mac, port=port, vlan=vlan, is_local=is_local
         ))
+        self._fdb_rows.pop(bridge, None)
 
     def get_interface_state(self, interface: str) -> dict:
         self._check_failure("get_interface_state")
@@ -420,26 +467,26 @@ class MockNetworkKernel(NetworkKernel):
 
     def get_arp_table(self) -> list[dict]:
         self._check_failure("get_arp_table")
-        return [
-            {"ip": e.ip, "mac": e.mac, "device": e.device}
-            for e in self._arp_table
-        ]
+        rows = self._arp_rows
+        if rows is None:
+            rows = self._arp_rows = [
+                {"ip": e.ip, "mac": e.mac, "device": e.device}
+                for e in self._arp_table
+            ]
+        return list(map(dict.copy, rows))
 
     def add_arp_entry(self, ip: str, mac: str, device: str) -> None:
         """Directly add an ARP entry (for test setup)."""
         self._arp_table.append(ArpEntry(ip=ip, mac=mac, device=device))
+        self._arp_rows = None
 
     # --- Resource tracking ---
 
     def track_resource(self, resource_type: str, name: str) -> None:
-        pair = (resource_type, name)
-        if pair not in self._tracked:
-            self._tracked.append(pair)
+        self._tracked[(resource_type, name)] = None
 
     def untrack_resource(self, resource_type: str, name: str) -> None:
-        pair = (resource_type, name)
-        if pair in self._tracked:
-            self._tracked.remove(pair)
+        self._tracked.pop((resource_type, name), None)
 
     def tracked_resources(self) -> list[tuple[str, str]]:
         return list(self._tracked)
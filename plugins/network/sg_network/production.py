@@ -4,17 +4,26 @@ Executes actual network configuration on a Linux host. All test resources
 are prefixed with 'sg-test-' for safety. The management interface (eth0)
 is never modified.
 
-Requires: Linux, ip, bridge commands, sysfs, sudo access.
+Requires: Linux, ip, bridge commands, sysfs, sudo access.  With
+``backend="netlink"`` (needs pyroute2) link lookups are answered over an
+unprivileged netlink socket instead of spawning ``ip``; changes still go
+through (sudo) ip.
 """
 from __future__ import annotations
 
 import json
 import os
 import subprocess
-from pathlib import Path
+import time
 
+from sg.jsonio import loads as _loads
 from sg_network.kernel import NetworkKernel
 
+try:
+    from pyroute2 import IPRoute
+except ImportError:
+    IPRoute = None  # type: ignore[assignment,misc]
+
 
 SAFETY_PREFIX = "sg-test-"
 _BASE_PROTECTED = {"eth0", "lo"}
@@ -25,27 +34,167 @@ PROTECTED_INTERFACES = _BASE_PROTECTED | {i.strip() for i in _extra.split(",") i
 class ProductionNetworkKernel(NetworkKernel):
     """Real network kernel using ip/bridge/sysfs commands."""
 
+    # How long a sysfs read may be reused, in seconds.  Any command that
+    # changes state drops the cache, so this only bounds how stale values
+    # the kernel changes on its own (carrier, topology_change) can get.
+    SYSFS_TTL = 0.05
+
     def create_shadow(self) -> NetworkKernel:
         """Return a mock kernel for shadow execution."""
         from sg_network.mock import MockNetworkKernel
         return MockNetworkKernel()
 
-    def __init__(self, use_sudo: bool = True, dry_run: bool = False) -> None:
+    def __init__(self, use_sudo: bool = True, dry_run: bool = False,
+                 backend: str = "exec") -> None:
+        if backend not in ("exec", "netlink"):
+            raise ValueError(f"unknown backend '{backend}' (expected exec or netlink)")
+        if backend == "netlink" and IPRoute is None:
+            raise RuntimeError("pyroute2 required for the netlink backend: pip install pyroute2")
         self._use_sudo = use_sudo
         self._dry_run = dry_run
-        self._tracked: list[tuple[str, str]] = []
+        self._backend = backend
+        self._ipr = None  # IPRoute socket, opened on first netlink query
+        self._tracked: dict[tuple[str, str], None] = {}
+        self._sysfs_cache: dict[str, tuple[float, str | None]] = {}
 
-    def _run(self, cmd: list[str], check: bool = True) -> subprocess.CompletedProcess:
+    def _run(self, cmd: list[str], check: bool = True,
+             text: bool = True) -> subprocess.CompletedProcess:
         """Run a command, optionally with sudo."""
+        if "show" not in cmd:
+            self._sysfs_cache.clear()
         if self._use_sudo:
             cmd = ["sudo"] + cmd
         if self._dry_run:
             print(f"  [dry-run] {' '.join(cmd)}")
+            empty = "" if text else b""
+            return subprocess.CompletedProcess(cmd, 0, stdout=empty, stderr=empty)
+        return subprocess.run(
+            cmd, capture_output=True, text=text, check=check, timeout=30,
+        )
+
+    def _run_json(self, cmd: list[str]) -> list | None:
+        """Run an ``ip -j``/``bridge -j`` query and parse its output.
+
+        Returns None if the command fails or prints no valid JSON.  stdout
+        is kept as bytes so orjson (when installed) parses it directly.
+        """
+        result = self._run(cmd, check=False, text=False)
+        if result.returncode != 0:
+            return None
+        try:
+            return _loads(result.stdout)
+        except (json.JSONDecodeError, TypeError):
+            return None
+
+    def _run_batch(self, commands: list[list[str]],
+                   force: bool = False) -> subprocess.CompletedProcess:
+        """Run several ``ip`` commands in one process via ``ip -batch -``.
+
+        Each command is the argument list that would follow ``ip``.  ip
+        stops at the first failing line and exits non-zero, so a failure
+        raises CalledProcessError and skips the rest, like the equivalent
+        sequence of _run calls.  With force=True ip keeps going past
+        failing lines and errors are not raised, like _run(check=False).
+        """
+        lines = []
+        for args in commands:
+            for arg in args:
+                if not self._batch_safe(arg):
+                    raise ValueError(f"unsafe argument for ip batch: {arg!r}")
+            lines.append(" ".join(args))
+        self._sysfs_cache.clear()
+        cmd = ["ip", "-force", "-batch", "-"] if force else ["ip", "-batch", "-"]
+        if self._use_sudo:
+            cmd = ["sudo"] + cmd
+        if self._dry_run:
+            for line in lines:
+                print(f"  [dry-run] {' '.join(cmd)} {line}")
             return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
         return subprocess.run(
-            cmd, capture_output=True, text=True, check=check, timeout=30,
+            cmd, input="\n".join(lines) + "\n",
+            capture_output=True, text=True, check=not force, timeout=30,
         )
 
+    @staticmethod
+    def _batch_safe(arg: str) -> bool:
+        # A batch line is split on whitespace, and quotes and '#' are
+        # special; refuse anything that could change the command.
+        return bool(arg) and not any(c.isspace() or c in "\"'#\\" for c in arg)
+
+    def _delete_links(self, names: list[str]) -> None:
+        """Delete links in one forced batch, ignoring individual failures.
+
+        Deleting one end of a veth pair removes its peer too, so later
+        lines may fail; -force keeps the batch going past them.  Names a
+        batch line cannot carry (interface names may contain quotes, '#'
+        or backslashes) are deleted with their own ip call instead.
+        """
+        batch = [name for name in names if self._batch_safe(name)]
+        if batch:
+            self._run_batch([["link", "del", name] for name in batch], force=True)
+        for name in names:
+            if not self._batch_safe(name):
+                self._run(["ip", "link", "del", name], check=False)
+
+    def _read_sysfs(self, device: str, attr: str) -> str | None:
+        """Read /sys/class/net/<device>/<attr>, stripped; None if absent.
+
+        Results (including absence) are reused for SYSFS_TTL seconds.
+        Other OSErrors propagate and are not cached.
+        """
+        path = f"/sys/class/net/{device}/{attr}"
+        now = time.monotonic()
+        hit = self._sysfs_cache.get(path)
+        if hit is not None and now - hit[0] < self.SYSFS_TTL:
+            return hit[1]
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except FileNotFoundError:
+            value = None
+        else:
+            try:
+                value = os.read(fd, 4096).decode().strip()
+            finally:
+                os.close(fd)
+        self._sysfs_cache[path] = (now, value)
+        return value
+
+    def _netlink(self):
+        if self._ipr is None:
+            self._ipr = IPRoute()
+        return self._ipr
+
+    def _link_exists(self, name: str) -> bool:
+        if self._backend == "netlink":
+            return bool(self._netlink().link_lookup(ifname=name))
+        return self._run(["ip", "link", "show", name], check=False).returncode == 0
+
+    def _link_info(self, name: str) -> dict | None:
+        """Return the `ip -j link show` fields for *name*, or None if absent.
+
+        Only ifname, address, operstate and master (by name, omitted when
+        unset) are relied upon; the netlink backend fills in just those.
+        """
+        if self._backend == "netlink":
+            ipr = self._netlink()
+            indices = ipr.link_lookup(ifname=name)
+            if not indices:
+                return None
+            msg = ipr.get_links(indices[0])[0]
+            info = {
+                "ifname": msg.get_attr("IFLA_IFNAME"),
+                "address": msg.get_attr("IFLA_ADDRESS") or "",
+                "operstate": msg.get_attr("IFLA_OPERSTATE") or "unknown",
+            }
+            master = msg.get_attr("IFLA_MASTER")
+            if master:
+                info["master"] = ipr.get_links(master)[0].get_attr("IFLA_IFNAME")
+            return info
+        data = self._run_json(["ip", "-j", "link", "show", name])
+        if data is None:
+            return None
+        return data[0] if data else None
+
     @staticmethod
     def _safe_name(name: str) -> str:
         """Ensure a resource name has the safety prefix."""
@@ -67,13 +216,20 @@ class ProductionNetworkKernel(NetworkKernel):
     # --- State management ---
 
     def reset(self) -> None:
-        """Clean up all tracked resources."""
-        for rtype, name in reversed(self._tracked):
+        """Clean up all tracked resources and close the netlink socket."""
+        if self._tracked:
             try:
-                self._run(["ip", "link", "del", name], check=False)
+                self._delete_links([name for _, name in reversed(self._tracked)])
             except Exception:
                 pass
         self._tracked.clear()
+        self.close()
+
+    def close(self) -> None:
+        """Close the netlink socket, if open; the next query reopens it."""
+        if self._ipr is not None:
+            self._ipr.close()
+            self._ipr = None
 
     # --- Bridge operations ---
 
@@ -82,14 +238,20 @@ class ProductionNetworkKernel(NetworkKernel):
         for iface in interfaces:
             self._check_protected(iface)
 
-        self._run(["ip", "link", "add", name, "type", "bridge"])
-        self._run(["ip", "link", "set", name, "up"])
+        self._run_batch([
+            ["link", "add", name, "type", "bridge"],
+            ["link", "set", name, "up"],
+        ])
         self.track_resource("bridge", name)
 
         for iface in interfaces:
             self._ensure_interface_exists(iface)
-            self._run(["ip", "link", "set", iface, "master", name])
-            self._run(["ip", "link", "set", iface, "up"])
+        if interfaces:
+            commands = []
+            for iface in interfaces:
+                commands.append(["link", "set", iface, "master", name])
+                commands.append(["link", "set", iface, "up"])
+            self._run_batch(commands)
 
         return self.get_bridge(name)
 
@@ -115,28 +277,19 @@ class ProductionNetworkKernel(NetworkKernel):
         self._run(["ip", "link", "set", interface, "nomaster"])
 
     def get_bridge(self, name: str) -> dict | None:
-        result = self._run(["ip", "-j", "link", "show", name], check=False)
-        if result.returncode != 0:
-            return None
-        try:
-            data = json.loads(result.stdout)
-        except (json.JSONDecodeError, TypeError):
-            return None
-        if not data:
+        if self._link_info(name) is None:
             return None
 
         interfaces = self._get_bridge_interfaces(name)
 
-        stp_path = Path(f"/sys/class/net/{name}/bridge/stp_state")
-        stp_enabled = False
-        if stp_path.exists():
-            stp_enabled = stp_path.read_text().strip() != "0"
+        stp_state = self._read_sysfs(name, "bridge/stp_state")
+        stp_enabled = stp_state is not None and stp_state != "0"
 
-        fd_path = Path(f"/sys/class/net/{name}/bridge/forward_delay")
+        fd_value = self._read_sysfs(name, "bridge/forward_delay")
         forward_delay = 15
-        if fd_path.exists():
+        if fd_value is not None:
             # sysfs stores forward_delay in jiffies (centiseconds)
-            raw = int(fd_path.read_text().strip())
+            raw = int(fd_value)
             forward_delay = raw // 100 if raw >= 100 else raw
 
         return {
@@ -147,27 +300,29 @@ class ProductionNetworkKernel(NetworkKernel):
         }
 
     def _get_bridge_interfaces(self, bridge_name: str) -> list[str]:
-        result = self._run(
-            ["ip", "-j", "link", "show", "master", bridge_name],
-            check=False,
-        )
-        if result.returncode != 0:
-            return []
-        try:
-            data = json.loads(result.stdout)
-        except (json.JSONDecodeError, TypeError):
+        if self._backend == "netlink":
+            ipr = self._netlink()
+            indices = ipr.link_lookup(ifname=bridge_name)
+            if not indices:
+                return []
+            return [
+                link.get_attr("IFLA_IFNAME") for link in ipr.get_links()
+                if link.get_attr("IFLA_MASTER") == indices[0]
+            ]
+        data = self._run_json(["ip", "-j", "link", "show", "master", bridge_name])
+        if data is None:
             return []
         return [iface["ifname"] for iface in data if "ifname" in iface]
 
     def _ensure_interface_exists(self, name: str) -> None:
         """For test interfaces (sg-test-*), auto-create veth pairs."""
-        result = self._run(["ip", "link", "show", name], check=False)
-        if result.returncode != 0 and name.startswith(SAFETY_PREFIX):
+        if name.startswith(SAFETY_PREFIX) and not self._link_exists(name):
             peer = name + "-peer"
-            self._run(["ip", "link", "add", name, "type", "veth",
-                        "peer", "name", peer])
-            self._run(["ip", "link", "set", name, "up"])
-            self._run(["ip", "link", "set", peer, "up"])
+            self._run_batch([
+                ["link", "add", name, "type", "veth", "peer", "name", peer],
+                ["link", "set", name, "up"],
+                ["link", "set", peer, "up"],
+            ])
             self.track_resource("veth", name)
 
     # --- STP operations ---
@@ -194,35 +349,36 @@ class ProductionNetworkKernel(NetworkKernel):
             "topology_change": False,
         }
 
-        root_path = Path(f"/sys/class/net/{bridge}/bridge/root_id")
-        if root_path.exists():
-            result["root_id"] = root_path.read_text().strip()
-        bridge_id_path = Path(f"/sys/class/net/{bridge}/bridge/bridge_id")
-        if bridge_id_path.exists():
-            result["bridge_id"] = bridge_id_path.read_text().strip()
-        tc_path = Path(f"/sys/class/net/{bridge}/bridge/topology_change")
-        if tc_path.exists():
-            result["topology_change"] = tc_path.read_text().strip() != "0"
+        root_id = self._read_sysfs(bridge, "bridge/root_id")
+        if root_id is not None:
+            result["root_id"] = root_id
+        bridge_id = self._read_sysfs(bridge, "bridge/bridge_id")
+        if bridge_id is not None:
+            result["bridge_id"] = bridge_id
+        topology_change = self._read_sysfs(bridge, "bridge/topology_change")
+        if topology_change is not None:
+            result["topology_change"] = topology_change != "0"
 
         return result
 
     # --- MAC operations ---
 
     def get_device_mac(self, device: str) -> str:
-        addr_path = Path(f"/sys/class/net/{device}/address")
-        if addr_path.exists():
-            return addr_path.read_text().strip()
-        result = self._run(["ip", "-j", "link", "show", device])
-        data = json.loads(result.stdout)
-        if data and "address" in data[0]:
-            return data[0]["address"]
+        address = self._read_sysfs(device, "address")
+        if address is not None:
+            return address
+        link = self._link_info(device)
+        if link and link.get("address"):
+            return link["address"]
         raise ValueError(f"device '{device}' does not exist")
 
     def set_device_mac(self, device: str, mac: str) -> None:
         self._check_protected(device)
-        self._run(["ip", "link", "set", device, "down"])
-        self._run(["ip", "link", "set", device, "address", mac])
-        self._run(["ip", "link", "set", device, "up"])
+        self._run_batch([
+            ["link", "set", device, "down"],
+            ["link", "set", device, "address", mac],
+            ["link", "set", device, "up"],
+        ])
 
     def send_gratuitous_arp(self, interface: str, mac: str) -> None:
         self._run(
@@ -244,16 +400,21 @@ class ProductionNetworkKernel(NetworkKernel):
         }
         kernel_mode = mode_map.get(mode, mode)
 
-        self._run(["ip", "link", "add", name, "type", "bond",
-                    "mode", kernel_mode])
-        self._run(["ip", "link", "set", name, "up"])
+        self._run_batch([
+            ["link", "add", name, "type", "bond", "mode", kernel_mode],
+            ["link", "set", name, "up"],
+        ])
         self.track_resource("bond", name)
 
         for member in members:
             self._ensure_interface_exists(member)
-            self._run(["ip", "link", "set", member, "down"])
-            self._run(["ip", "link", "set", member, "master", name])
-            self._run(["ip", "link", "set", member, "up"])
+        if members:
+            commands = []
+            for member in members:
+                commands.append(["link", "set", member, "down"])
+                commands.append(["link", "set", member, "master", name])
+                commands.append(["link", "set", member, "up"])
+            self._run_batch(commands)
 
         return self.get_bond(name)
 
@@ -267,14 +428,8 @@ class ProductionNetworkKernel(NetworkKernel):
         self.untrack_resource("bond", name)
 
     def get_bond(self, name: str) -> dict | None:
-        result = self._run(["ip", "-j", "link", "show", name], check=False)
-        if result.returncode != 0:
-            return None
-        try:
-            data = json.loads(result.stdout)
-        except (json.JSONDecodeError, TypeError):
-            return None
-        if not data:
+        link = self._link_info(name)
+        if link is None:
             return None
 
         members = self._get_bond_members(name)
@@ -284,21 +439,16 @@ class ProductionNetworkKernel(NetworkKernel):
             "name": name,
             "mode": mode,
             "members": members,
-            "active": data[0].get("operstate", "unknown").lower() == "up",
+            "active": link.get("operstate", "unknown").lower() == "up",
         }
 
     def _get_bond_members(self, bond_name: str) -> list[str]:
-        slaves_path = Path(f"/sys/class/net/{bond_name}/bonding/slaves")
-        if slaves_path.exists():
-            content = slaves_path.read_text().strip()
-            return content.split() if content else []
-        return []
+        content = self._read_sysfs(bond_name, "bonding/slaves")
+        return content.split() if content else []
 
     def _get_bond_mode(self, bond_name: str) -> str:
-        mode_path = Path(f"/sys/class/net/{bond_name}/bonding/mode")
-        if mode_path.exists():
-            return mode_path.read_text().strip().split()[0]
-        return "unknown"
+        mode = self._read_sysfs(bond_name, "bonding/mode")
+        return mode.split()[0] if mode is not None else "unknown"
 
     # --- VLAN operations ---
 
@@ -311,9 +461,11 @@ class ProductionNetworkKernel(NetworkKernel):
             raise ValueError(f"VLAN ID must be 1-4094, got {vlan_id}")
 
         vlan_name = f"{parent}.{vlan_id}"
-        self._run(["ip", "link", "add", "link", parent, "name", vlan_name,
-                    "type", "vlan", "id", str(vlan_id)])
-        self._run(["ip", "link", "set", vlan_name, "up"])
+        self._run_batch([
+            ["link", "add", "link", parent, "name", vlan_name,
+             "type", "vlan", "id", str(vlan_id)],
+            ["link", "set", vlan_name, "up"],
+        ])
         self.track_resource("vlan", vlan_name)
 
         return self.get_vlan(parent, vlan_id)
@@ -325,14 +477,7 @@ class ProductionNetworkKernel(NetworkKernel):
 
     def get_vlan(self, parent: str, vlan_id: int) -> dict | None:
         vlan_name = f"{parent}.{vlan_id}"
-        result = self._run(["ip", "-j", "link", "show", vlan_name], check=False)
-        if result.returncode != 0:
-            return None
-        try:
-            data = json.loads(result.stdout)
-        except (json.JSONDecodeError, TypeError):
-            return None
-        if not data:
+        if self._link_info(vlan_name) is None:
             return None
         return {
             "name": vlan_name,
@@ -343,13 +488,8 @@ class ProductionNetworkKernel(NetworkKernel):
     # --- Diagnostic reads ---
 
     def read_fdb(self, bridge: str) -> list[dict]:
-        result = self._run(["bridge", "-j", "fdb", "show", "br", bridge],
-                           check=False)
-        if result.returncode != 0:
-            return []
-        try:
-            data = json.loads(result.stdout)
-        except (json.JSONDecodeError, TypeError):
+        data = self._run_json(["bridge", "-j", "fdb", "show", "br", bridge])
+        if data is None:
             return []
         return [
             {
@@ -362,19 +502,16 @@ class ProductionNetworkKernel(NetworkKernel):
         ]
 
     def get_interface_state(self, interface: str) -> dict:
-        result = self._run(["ip", "-j", "link", "show", interface])
-        data = json.loads(result.stdout)
-        if not data:
+        iface = self._link_info(interface)
+        if iface is None:
             raise ValueError(f"interface '{interface}' does not exist")
-        iface = data[0]
 
-        carrier_path = Path(f"/sys/class/net/{interface}/carrier")
-        carrier = True
-        if carrier_path.exists():
-            try:
-                carrier = carrier_path.read_text().strip() == "1"
-            except OSError:
-                carrier = False
+        try:
+            value = self._read_sysfs(interface, "carrier")
+        except OSError:
+            # carrier reads fail with EINVAL while the device is down
+            value = "0"
+        carrier = value is None or value == "1"
 
         return {
             "name": iface.get("ifname", interface),
@@ -385,12 +522,8 @@ class ProductionNetworkKernel(NetworkKernel):
         }
 
     def get_arp_table(self) -> list[dict]:
-        result = self._run(["ip", "-j", "neigh", "show"], check=False)
-        if result.returncode != 0:
-            return []
-        try:
-            data = json.loads(result.stdout)
-        except (json.JSONDecodeError, TypeError):
+        data = self._run_json(["ip", "-j", "neigh", "show"])
+        if data is None:
             return []
         return [
             {
@@ -405,14 +538,10 @@ class ProductionNetworkKernel(NetworkKernel):
     # --- Resource tracking ---
 
     def track_resource(self, resource_type: str, name: str) -> None:
-        pair = (resource_type, name)
-        if pair not in self._tracked:
-            self._tracked.append(pair)
+        self._tracked[(resource_type, name)] = None
 
     def untrack_resource(self, resource_type: str, name: str) -> None:
-        pair = (resource_type, name)
-        if pair in self._tracked:
-            self._tracked.remove(pair)
+        self._tracked.pop((resource_type, name), None)
 
     def tracked_resources(self) -> list[tuple[str, str]]:
         return list(self._tracked)
@@ -423,23 +552,20 @@ class ProductionNetworkKernel(NetworkKernel):
         """Create a veth pair for testing."""
         self._safe_name(name1)
         self._safe_name(name2)
-        self._run(["ip", "link", "add", name1, "type", "veth",
-                    "peer", "name", name2])
-        self._run(["ip", "link", "set", name1, "up"])
-        self._run(["ip", "link", "set", name2, "up"])
+        self._run_batch([
+            ["link", "add", name1, "type", "veth", "peer", "name", name2],
+            ["link", "set", name1, "up"],
+            ["link", "set", name2, "up"],
+        ])
         self.track_resource("veth", name1)
 
     def cleanup_all_test_resources(self) -> None:
         """Remove ALL sg-test-* interfaces from the system."""
-        result = self._run(["ip", "-j", "link", "show"], check=False)
-        if result.returncode != 0:
+        data = self._run_json(["ip", "-j", "link", "show"])
+        if data is None:
             return
-        try:
-            data = json.loads(result.stdout)
-        except (json.JSONDecodeError, TypeError):
-            return
-        for iface in data:
-            name = iface.get("ifname", "")
-            if name.startswith(SAFETY_PREFIX):
-                self._run(["ip", "link", "del", name], check=False)
+        self._delete_links([
+            name for iface in data
+            if (name := iface.get("ifname", "")).startswith(SAFETY_PREFIX)
+        ])
         self._tracked.clear()
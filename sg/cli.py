@@ -14,6 +14,7 @@ from sg.contracts import ContractStore, validate_output
 from sg.fusion import FusionTracker
 from sg.kernel.discovery import load_kernel, list_kernel_names, KernelNotFoundError, KernelLoadError
 from sg.decomposition import DecompositionDetector
+from sg.filelock import file_signature
 from sg.pathway_fitness import PathwayFitnessTracker
 from sg.mutation import MockMutationEngine, MutationEngine
 from sg.orchestrator import Orchestrator
@@ -442,6 +443,7 @@ def cmd_watch(args: argparse.Namespace) -> None:
     interval = getattr(args, "interval", 300.0)
     max_count = getattr(args, "count", 0)
     iteration = 0
+    phenotype_path = orch.project_root / "phenotype.toml"
 
     print(f"Watching '{args.pathway}' every {interval}s "
           f"({'infinite' if max_count == 0 else max_count} iterations)")
@@ -459,13 +461,16 @@ def cmd_watch(args: argparse.Namespace) -> None:
 
             orch.verify_scheduler.wait()
             orch.save_state()
+            saved = file_signature(phenotype_path)
 
             if max_count == 0 or iteration < max_count:
                 time.sleep(interval)
 
-            # Reload state from disk to pick up changes from other processes
+            # Reload state from disk to pick up changes from other processes;
+            # the phenotype only needs re-parsing if someone rewrote it.
             orch.registry.load_index()
-            orch.phenotype = PhenotypeMap.load(orch.project_root / "phenotype.toml")
+            if file_signature(phenotype_path) != saved:
+                orch.phenotype = PhenotypeMap.load(phenotype_path)
 
     except KeyboardInterrupt:
         print("\nWatch interrupted.")
@@ -485,28 +490,34 @@ def cmd_status(args: argparse.Namespace) -> None:
     from sg.meta_params import MetaParamTracker
     meta_tracker = MetaParamTracker.open(root / ".sg" / "meta_params.json")
 
-    print("=== Software Genome Status ===\n")
+    # Collect lines and write once; large genomes produce thousands of lines.
+    out: list[str] = []
+    out.append("=== Software Genome Status ===\n")
 
     for locus in contract_store.known_loci():
-        alleles = registry.alleles_for_locus(locus)
+        # Score each allele once and reuse it for both ordering and display.
+        params = meta_tracker.get_params(locus)
+        scored = [
+            (arena.compute_fitness(a, params=params), a)
+            for a in registry.alleles_for_locus(locus, sort=False)
+        ]
+        scored.sort(key=lambda pair: pair[0], reverse=True)
         dominant_sha = phenotype.get_dominant(locus)
-        print(f"Locus: {locus}")
-        print(f"  Dominant: {dominant_sha[:12] if dominant_sha else 'none'}")
+        out.append(f"Locus: {locus}")
+        out.append(f"  Dominant: {dominant_sha[:12] if dominant_sha else 'none'}")
         if decomposition_detector.is_decomposed(locus):
             state = decomposition_detector.get_decomposition(locus)
-            print(f"  Decomposed: -> pathway '{state['pathway_name']}'")
-            print(f"    Sub-loci: {', '.join(state['sub_loci'])}")
+            out.append(f"  Decomposed: -> pathway '{state['pathway_name']}'")
+            out.append(f"    Sub-loci: {', '.join(state['sub_loci'])}")
             if state.get("status") == "refined":
-                print(f"    Status: re-fused ({state['fused_sha'][:12]})")
-        print(f"  Alleles ({len(alleles)}):")
-        params = meta_tracker.get_params(locus)
-        for a in alleles:
-            fitness = arena.compute_fitness(a, params=params)
+                out.append(f"    Status: re-fused ({state['fused_sha'][:12]})")
+        out.append(f"  Alleles ({len(scored)}):")
+        for fitness, a in scored:
             marker = " *" if a.sha256 == dominant_sha else ""
-            print(f"    {a.sha256[:12]}  fitness={fitness:.3f}  "
-                  f"invocations={a.total_invocations}  "
-                  f"state={a.state}{marker}")
-        print()
+            out.append(f"    {a.sha256[:12]}  fitness={fitness:.3f}  "
+                       f"invocations={a.total_invocations}  "
+                       f"state={a.state}{marker}")
+        out.append("")
 
     for name in contract_store.known_pathways():
         fusion_config = phenotype.get_fused(name)
@@ -514,45 +525,47 @@ def cmd_status(args: argparse.Namespace) -> None:
         fitness_rec = pathway_fitness_tracker.get_record(name)
         pw_alleles = pathway_registry.get_for_pathway(name)
         pw_dominant_sha = phenotype.get_pathway_dominant(name)
-        print(f"Pathway: {name}")
+        out.append(f"Pathway: {name}")
         if pw_alleles:
-            print(f"  Pathway alleles: {len(pw_alleles)}"
-                  f"  dominant={pw_dominant_sha[:12] if pw_dominant_sha else 'none'}")
+            out.append(f"  Pathway alleles: {len(pw_alleles)}"
+                       f"  dominant={pw_dominant_sha[:12] if pw_dominant_sha else 'none'}")
             for pa in pw_alleles:
                 marker = " *" if pa.structure_sha == pw_dominant_sha else ""
                 op_info = f"  (via {pa.mutation_operator})" if pa.mutation_operator else ""
-                print(f"    {pa.structure_sha[:12]}  "
-                      f"fitness={pa.fitness:.3f}  "
-                      f"execs={pa.total_executions}  "
-                      f"state={pa.state}{marker}{op_info}")
+                out.append(f"    {pa.structure_sha[:12]}  "
+                           f"fitness={pa.fitness:.3f}  "
+                           f"execs={pa.total_executions}  "
+                           f"state={pa.state}{marker}{op_info}")
         if fusion_config and fusion_config.fused_sha:
-            print(f"  Fused: {fusion_config.fused_sha[:12]}")
+            out.append(f"  Fused: {fusion_config.fused_sha[:12]}")
         else:
-            print(f"  Fused: no")
+            out.append(f"  Fused: no")
         if track:
-            print(f"  Reinforcement: {track.reinforcement_count}/{10}")
-            print(f"  Total: {track.total_successes} successes, {track.total_failures} failures")
+            out.append(f"  Reinforcement: {track.reinforcement_count}/{10}")
+            out.append(f"  Total: {track.total_successes} successes, {track.total_failures} failures")
         if fitness_rec:
             fitness = pathway_fitness_tracker.compute_fitness(name)
-            print(f"  Fitness: {fitness:.3f}")
-            print(f"  Executions: {fitness_rec.total_executions} "
-                  f"({fitness_rec.successful_executions}ok/"
-                  f"{fitness_rec.failed_executions}fail)")
-            print(f"  Avg time: {fitness_rec.avg_execution_time_ms:.1f}ms")
+            out.append(f"  Fitness: {fitness:.3f}")
+            out.append(f"  Executions: {fitness_rec.total_executions} "
+                       f"({fitness_rec.successful_executions}ok/"
+                       f"{fitness_rec.failed_executions}fail)")
+            out.append(f"  Avg time: {fitness_rec.avg_execution_time_ms:.1f}ms")
             if fitness_rec.consecutive_failures > 0:
-                print(f"  Consecutive failures: {fitness_rec.consecutive_failures}")
+                out.append(f"  Consecutive failures: {fitness_rec.consecutive_failures}")
             fail_dist = pathway_fitness_tracker.get_failure_distribution(name)
             if fail_dist:
-                print(f"  Failure hotspots:")
+                out.append(f"  Failure hotspots:")
                 for step, prob in sorted(fail_dist.items(), key=lambda x: -x[1]):
-                    print(f"    {step}: {prob:.0%}")
+                    out.append(f"    {step}: {prob:.0%}")
             anomalies = pathway_fitness_tracker.get_timing_anomalies(name)
             if anomalies:
-                print(f"  Timing anomalies:")
+                out.append(f"  Timing anomalies:")
                 for a in anomalies:
-                    print(f"    {a.step_name}: {a.latest_ms:.1f}ms "
-                          f"(avg {a.avg_ms:.1f}ms, {a.ratio:.1f}x)")
-        print()
+                    out.append(f"    {a.step_name}: {a.latest_ms:.1f}ms "
+                               f"(avg {a.avg_ms:.1f}ms, {a.ratio:.1f}x)")
+        out.append("")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def cmd_lineage(args: argparse.Namespace) -> None:
@@ -916,7 +929,7 @@ def _print_proposal(p) -> None:
 
 def cmd_share(args: argparse.Namespace) -> None:
     """Push successful alleles to peers."""
-    from sg.federation import load_peers, export_allele, push_allele
+    from sg.federation import load_peers, export_allele, push_to_peers
 
     root = get_project_root()
     registry = Registry.open(root / ".sg" / "registry")
@@ -945,15 +958,14 @@ def cmd_share(args: argparse.Namespace) -> None:
         print("No peers configured. Create peers.json or use --peer URL")
         return
 
-    for peer in peers:
-        ok = push_allele(peer, allele_data)
+    for peer, ok in zip(peers, push_to_peers(peers, allele_data)):
         status = "ok" if ok else "failed"
         print(f"  {peer.url}: {status}")
 
 
 def cmd_pull(args: argparse.Namespace) -> None:
     """Fetch alleles from peers."""
-    from sg.federation import load_peers, import_allele, pull_alleles
+    from sg.federation import load_peers, import_allele, pull_from_peers
 
     root = get_project_root()
     registry = Registry.open(root / ".sg" / "registry")
@@ -972,8 +984,7 @@ def cmd_pull(args: argparse.Namespace) -> None:
         return
 
     imported = 0
-    for peer in peers:
-        alleles = pull_alleles(peer, locus)
+    for peer, alleles in zip(peers, pull_from_peers(peers, locus)):
         for data in alleles:
             sha = import_allele(registry, data)
             phenotype.add_to_fallback(locus, sha)
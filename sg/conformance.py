@@ -7,9 +7,10 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass, field
-from typing import Union
+from typing import Callable, Union
 
 from sg.contracts import ContractStore, validate_output
+from sg.jsonio import dumps, loads
 from sg.kernel.base import Kernel
 from sg.loader import load_gene, call_gene
 from sg.parser.types import GeneContract, GeneFamily, FieldDef
@@ -17,6 +18,11 @@ from sg.phenotype import PhenotypeMap
 from sg.registry import Registry
 
 
+def _dumps(obj: object) -> str:
+    """Serialize a test input to a JSON string."""
+    return dumps(obj).decode()
+
+
 @dataclass
 class Check:
     name: str
@@ -50,34 +56,36 @@ def _type_matches(value, expected_type: str) -> bool:
     return True  # unknown types pass
 
 
+_INPUT_BUILDERS: dict[str, Callable[[str], object]] = {
+    "string": lambda name: f"test-{name}",
+    "bool": lambda name: True,
+    "int": lambda name: 1,
+    "float": lambda name: 1.0,
+    "string[]": lambda name: [f"test-{name}-1", f"test-{name}-2"],
+    "int[]": lambda name: [1, 2],
+}
+
+
+def _default_input(name: str) -> str:
+    return f"test-{name}"
+
+
 def generate_test_inputs(contract: GeneContract) -> list[str]:
     """Generate basic test inputs from contract's takes schema."""
     # Build one valid input
-    valid = {}
-    for f in contract.takes:
-        if f.type == "string":
-            valid[f.name] = f"test-{f.name}"
-        elif f.type == "bool":
-            valid[f.name] = True
-        elif f.type == "int":
-            valid[f.name] = 1
-        elif f.type == "float":
-            valid[f.name] = 1.0
-        elif f.type == "string[]":
-            valid[f.name] = [f"test-{f.name}-1", f"test-{f.name}-2"]
-        elif f.type == "int[]":
-            valid[f.name] = [1, 2]
-        else:
-            valid[f.name] = f"test-{f.name}"
-
-    inputs = [json.dumps(valid)]
+    valid = {
+        f.name: _INPUT_BUILDERS.get(f.type, _default_input)(f.name)
+        for f in contract.takes
+    }
+
+    inputs = [_dumps(valid)]
 
     # Build one input with missing required field (if any)
     required_fields = [f for f in contract.takes if f.required and not f.optional]
     if len(required_fields) > 1:
         incomplete = dict(valid)
         del incomplete[required_fields[0].name]
-        inputs.append(json.dumps(incomplete))
+        inputs.append(_dumps(incomplete))
 
     return inputs
 
@@ -120,7 +128,7 @@ def check_gene_conformance(
 
         # Check valid JSON
         try:
-            data = json.loads(result)
+            data = loads(result)
         except (json.JSONDecodeError, TypeError):
             checks.append(Check(f"{label}_json", False, "output is not valid JSON"))
             all_passed = False
@@ -177,25 +185,11 @@ class ConformanceSuite:
         phenotype: PhenotypeMap,
         kernel: Kernel,
     ) -> list[ConformanceResult]:
-        results = []
-        for locus in contract_store.known_loci():
-            contract = contract_store.get_gene(locus)
-            if contract is None:
-                continue
-
-            dominant_sha = phenotype.get_dominant(locus)
-            if dominant_sha is None:
-                continue
-
-            source = registry.load_source(dominant_sha)
-            if source is None:
-                continue
-
-            result = check_gene_conformance(
-                source, contract, kernel, sha=dominant_sha[:12],
-            )
-            results.append(result)
-        return results
+        results = (
+            self.run_locus(locus, contract_store, registry, phenotype, kernel)
+            for locus in contract_store.known_loci()
+        )
+        return [r for r in results if r is not None]
 
     def run_locus(
         self,
@@ -5,10 +5,17 @@ The ContractStore replaces all hardcoded contract definitions.
 """
 from __future__ import annotations
 
+import copy
 import json
-from dataclasses import dataclass
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, KeysView, Mapping
 
+from sg.jsonio import loads as _loads
 from sg.log import get_logger
 from sg.parser.parser import parse_sg
 from sg.parser.types import (
@@ -30,20 +37,39 @@ class ContractInfo:
     risk: str = "none"
     domain: str | None = None
     raw: GeneContract | PathwayContract | TopologyContract | None = None
+    takes_summary: list[dict] = field(default_factory=list, repr=False)
+    gives_summary: list[dict] = field(default_factory=list, repr=False)
+    output_validator: Callable[[dict], bool] | None = field(
+        default=None, repr=False, compare=False,
+    )
+
+
+_JSON_TYPES: dict[str, Mapping] = {
+    "string": MappingProxyType({"type": "string"}),
+    "bool": MappingProxyType({"type": "boolean"}),
+    "int": MappingProxyType({"type": "integer"}),
+    "float": MappingProxyType({"type": "number"}),
+}
 
 
-def _field_to_json_type(field_type: str) -> dict:
-    """Convert .sg type notation to JSON schema type."""
+@lru_cache(maxsize=512)
+def _field_to_json_type(field_type: str) -> Mapping:
+    """Convert .sg type notation to JSON schema type.
+
+    Results are cached per type string and returned read-only; use
+    `_json_type_dict` for a mutable copy.
+    """
     if field_type.endswith("[]"):
         base = field_type[:-2]
-        return {"type": "array", "items": _field_to_json_type(base)}
-    type_map = {
-        "string": {"type": "string"},
-        "bool": {"type": "boolean"},
-        "int": {"type": "integer"},
-        "float": {"type": "number"},
-    }
-    return type_map.get(field_type, {"type": "string"})
+        return MappingProxyType(
+            {"type": "array", "items": _field_to_json_type(base)})
+    return _JSON_TYPES.get(field_type, _JSON_TYPES["string"])
+
+
+def _json_type_dict(json_type: Mapping) -> dict:
+    """Copy a cached JSON schema type into plain (mutable) dicts."""
+    return {k: _json_type_dict(v) if isinstance(v, Mapping) else v
+            for k, v in json_type.items()}
 
 
 def _fields_to_schema(fields: list[FieldDef]) -> dict:
@@ -51,7 +77,7 @@ def _fields_to_schema(fields: list[FieldDef]) -> dict:
     properties = {}
     required = []
     for f in fields:
-        properties[f.name] = _field_to_json_type(f.type)
+        properties[f.name] = _json_type_dict(_field_to_json_type(f.type))
         if f.description:
             properties[f.name]["description"] = f.description
         if f.required and not f.optional:
@@ -73,9 +99,87 @@ def _gene_contract_to_info(contract: GeneContract) -> ContractInfo:
         risk=contract.risk.value,
         domain=contract.domain,
         raw=contract,
+        takes_summary=[{"name": f.name, "type": f.type} for f in contract.takes],
+        gives_summary=[{"name": f.name, "type": f.type} for f in contract.gives],
+        output_validator=_compile_fields_validator(contract.gives),
     )
 
 
+# Parsed contracts keyed by absolute path. An entry is reused while the
+# file's (mtime_ns, size) is unchanged, so reopening a store over the same
+# directory skips read + parse for every file that has not been edited.
+# Each store gets shallow copies (see ContractStore.load_file): assigning
+# an attribute stays local to that store, while the field lists and
+# schema dicts are shared between stores and must not be modified.
+_PARSE_CACHE: dict[
+    str,
+    tuple[int, int, GeneContract | PathwayContract | TopologyContract,
+          ContractInfo | None],
+] = {}
+_PARSE_CACHE_MAX = 4096
+
+# Cold directory loads with more uncached files than this parse them on a
+# thread pool; below it the pool costs more than it saves.
+_PARALLEL_PARSE_MIN = 4
+
+
+def forget_parsed(path: Path) -> None:
+    """Drop the cached parse of a contract file that was just rewritten.
+
+    A same-size rewrite can land within the filesystem's mtime
+    granularity, so the (mtime_ns, size) check alone may not notice it.
+    """
+    _PARSE_CACHE.pop(os.path.abspath(path), None)
+
+
+def _is_cached(key: str, st: os.stat_result) -> bool:
+    cached = _PARSE_CACHE.get(key)
+    return (cached is not None and cached[0] == st.st_mtime_ns
+            and cached[1] == st.st_size)
+
+
+def _read_source(path: Path, size: int) -> str:
+    """Read a contract file with one os.read() sized from its stat.
+
+    Skips the buffered text-IO layer; a file that changes after the stat
+    gets a new (mtime_ns, size) and is re-read on the next load.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        buf = os.read(fd, size)
+    finally:
+        os.close(fd)
+    return buf.decode("utf-8")
+
+
+def _parse_cached(
+    path: Path, st: os.stat_result,
+) -> tuple[GeneContract | PathwayContract | TopologyContract,
+           ContractInfo | None]:
+    """Return (contract, info) for a file, parsing only on a cache miss."""
+    key = os.path.abspath(path)
+    if _is_cached(key, st):
+        cached = _PARSE_CACHE[key]
+        return cached[2], cached[3]
+    contract = parse_sg(_read_source(path, st.st_size))
+    info = (_gene_contract_to_info(contract)
+            if isinstance(contract, GeneContract) else None)
+    if len(_PARSE_CACHE) >= _PARSE_CACHE_MAX:
+        _PARSE_CACHE.clear()
+    _PARSE_CACHE[key] = (st.st_mtime_ns, st.st_size, contract, info)
+    return contract, info
+
+
+def iter_contract_files(directory: str):
+    """Yield DirEntry objects for every .sg file below a directory."""
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_contract_files(entry.path)
+            elif entry.name.endswith(".sg"):
+                yield entry
+
+
 class ContractStore:
     """Discovers and loads .sg contract files from a directory tree.
 
@@ -91,21 +195,49 @@ class ContractStore:
         self._file_paths: dict[str, Path] = {}
 
     def load_directory(self, contracts_dir: Path) -> None:
-        """Discover and parse all .sg files in a directory tree."""
+        """Discover and parse all .sg files in a directory tree.
+
+        Files missing from the parse cache are read and parsed on a thread
+        pool; contracts are then registered serially in sorted path order.
+        """
         if not contracts_dir.exists():
             return
-        for sg_file in sorted(contracts_dir.rglob("*.sg")):
-            self.load_file(sg_file)
-
-    def load_file(self, path: Path, kernel_domain: str | None = None) -> None:
-        """Parse a single .sg file and register the contract.
+        entries = sorted(
+            iter_contract_files(str(contracts_dir)),
+            key=lambda e: e.path.split(os.sep),
+        )
+        files = [(Path(e.path), e.stat()) for e in entries]
+        misses = [(p, st) for p, st in files
+                  if not _is_cached(os.path.abspath(p), st)]
+        if len(misses) > _PARALLEL_PARSE_MIN:
+            workers = min(8, os.cpu_count() or 1, len(misses))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(lambda m: _parse_cached(*m), misses))
+        for path, st in files:
+            self.load_file(path, stat_result=st)
+
+    def load_file(
+        self,
+        path: Path,
+        kernel_domain: str | None = None,
+        stat_result: os.stat_result | None = None,
+    ) -> GeneContract | PathwayContract | TopologyContract:
+        """Parse a single .sg file, register the contract and return it.
+
+        Unchanged files are served from the module-level parse cache.
 
         Args:
             kernel_domain: If provided, warn when a contract's domain
                 doesn't match the kernel's domain.
+            stat_result: Stat of `path` if the caller already has one
+                (e.g. from a directory scan).
         """
-        source = path.read_text()
-        contract = parse_sg(source)
+        st = stat_result if stat_result is not None else path.stat()
+        contract, info = _parse_cached(path, st)
+        contract = copy.copy(contract)
+        if info is not None:
+            info = copy.copy(info)
+            info.raw = contract
 
         # Domain validation
         contract_domain = getattr(contract, "domain", None)
@@ -116,7 +248,7 @@ class ContractStore:
 
         if isinstance(contract, GeneContract):
             self.genes[contract.name] = contract
-            self._info_cache[contract.name] = _gene_contract_to_info(contract)
+            self._info_cache[contract.name] = info
             self._file_paths[contract.name] = path
         elif isinstance(contract, PathwayContract):
             self.pathways[contract.name] = contract
@@ -124,6 +256,7 @@ class ContractStore:
         elif isinstance(contract, TopologyContract):
             self.topologies[contract.name] = contract
             self._file_paths[contract.name] = path
+        return contract
 
     def contract_info(self, locus: str) -> ContractInfo:
         """Return runtime contract metadata for a gene locus."""
@@ -140,6 +273,18 @@ class ContractStore:
         """Return all known pathway names."""
         return list(self.pathways.keys())
 
+    def iter_loci(self) -> KeysView[str]:
+        """Return a live view of gene locus names (no list copy)."""
+        return self.genes.keys()
+
+    def iter_pathways(self) -> KeysView[str]:
+        """Return a live view of pathway names (no list copy)."""
+        return self.pathways.keys()
+
+    def iter_topologies(self) -> KeysView[str]:
+        """Return a live view of topology names (no list copy)."""
+        return self.topologies.keys()
+
     def get_gene(self, name: str) -> GeneContract | None:
         return self.genes.get(name)
 
@@ -161,9 +306,8 @@ class ContractStore:
         """Write a contract source to disk and load it. Returns the contract name."""
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text(source)
-        self.load_file(path)
-        contract = parse_sg(source)
-        return contract.name
+        forget_parsed(path)
+        return self.load_file(path).name
 
     @classmethod
     def open(cls, contracts_dir: Path) -> ContractStore:
@@ -176,6 +320,15 @@ class ContractStore:
 # --- Output validation ---
 
 
+_TYPE_CLASSES: dict[str, tuple[type, ...]] = {
+    "string": (str,),
+    "bool": (bool,),
+    "int": (int,),
+    "float": (int, float),
+}
+_REJECT_BOOL = frozenset({"int", "float"})
+
+
 def _check_field_type(value, field_type: str) -> bool:
     """Check if a value matches the expected .sg type."""
     if value is None:
@@ -185,30 +338,56 @@ def _check_field_type(value, field_type: str) -> bool:
             return False
         base = field_type[:-2]
         return all(_check_field_type(item, base) for item in value)
-    type_checks = {
-        "string": lambda v: isinstance(v, str),
-        "bool": lambda v: isinstance(v, bool),
-        "int": lambda v: isinstance(v, int) and not isinstance(v, bool),
-        "float": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
-    }
-    check = type_checks.get(field_type)
-    if check is None:
+    classes = _TYPE_CLASSES.get(field_type)
+    if classes is None:
         return True  # unknown types pass (custom types)
-    return check(value)
+    if not isinstance(value, classes):
+        return False
+    # bool is a subclass of int but is not a valid int/float value
+    return not (field_type in _REJECT_BOOL and isinstance(value, bool))
+
 
+# Python expressions that are true when `v` does NOT match a scalar .sg type.
+_TYPE_MISMATCH_EXPR = {
+    "string": "not isinstance(v, str)",
+    "bool": "not isinstance(v, bool)",
+    "int": "not isinstance(v, int) or isinstance(v, bool)",
+    "float": "not isinstance(v, (int, float)) or isinstance(v, bool)",
+}
 
-def _validate_gives_schema(data: dict, gives: list[FieldDef]) -> bool:
-    """Validate output data against the gives field definitions."""
-    for f in gives:
+
+def _compile_fields_validator(
+    fields: list[FieldDef],
+) -> Callable[[dict], bool]:
+    """Generate a straight-line validator function for a field list.
+
+    Each field's presence and type check is emitted as literal code and
+    compiled once, so validation does no per-field dispatch at call time.
+    'success' is skipped since validate_output checks it before schema
+    enforcement. Array types delegate to _check_field_type.
+    """
+    lines = ["def validate(data):"]
+    for f in fields:
         if f.name == "success":
-            continue  # already validated
+            continue
+        key = repr(f.name)
+        lines.append(f"    if {key} in data:")
+        lines.append(f"        v = data[{key}]")
+        if f.type.endswith("[]"):
+            lines.append(
+                f"        if v is not None and not check(v, {f.type!r}):")
+            lines.append("            return False")
+        elif f.type in _TYPE_MISMATCH_EXPR:
+            lines.append(
+                f"        if v is not None and ({_TYPE_MISMATCH_EXPR[f.type]}):")
+            lines.append("            return False")
         if f.required and not f.optional:
-            if f.name not in data:
-                return False
-        if f.name in data:
-            if not _check_field_type(data[f.name], f.type):
-                return False
-    return True
+            lines.append("    else:")
+            lines.append("        return False")
+    lines.append("    return True")
+    namespace: dict = {"check": _check_field_type}
+    exec(compile("\n".join(lines), "<contract-validator>", "exec"), namespace)
+    return namespace["validate"]
 
 
 def validate_output(
@@ -222,8 +401,16 @@ def validate_output(
     When a contract_store is provided and the output reports success,
     also validates required 'gives' fields and types.
     """
+    # Cheap reject before parsing: a passing output must contain both the
+    # "success" key and a literal `true` somewhere in the text.
+    if isinstance(output_json, str):
+        if '"success"' not in output_json or "true" not in output_json:
+            return False
+    elif isinstance(output_json, (bytes, bytearray)):
+        if b'"success"' not in output_json or b"true" not in output_json:
+            return False
     try:
-        data = json.loads(output_json)
+        data = _loads(output_json)
     except (json.JSONDecodeError, TypeError):
         return False
     if not isinstance(data, dict):
@@ -237,9 +424,12 @@ def validate_output(
 
     # Schema enforcement: when success=True and contract available
     if contract_store is not None:
-        gene = contract_store.get_gene(locus)
-        if gene is not None and gene.gives:
-            if not _validate_gives_schema(data, gene.gives):
+        try:
+            info = contract_store.contract_info(locus)
+        except ValueError:
+            info = None
+        if info is not None and info.output_validator is not None:
+            if not info.output_validator(data):
                 return False
 
     return True
@@ -278,20 +468,18 @@ def contract_to_pool_metadata(store: ContractStore, locus: str) -> dict | None:
 
 
 def _fields_compatible(
-    a_fields: list[FieldDef], b_fields: list[FieldDef],
+    a_fields: list[FieldDef], b_by_name: dict[str, FieldDef],
 ) -> bool:
     """Check if two field lists are structurally compatible.
 
-    Compatible means: every required field in `a` has a matching field in `b`
-    with the same name and type.
+    Compatible means: every required field in `a` has a matching field in
+    `b` (given as a name index) with the same name and type.
     """
-    b_map = {f.name: f for f in b_fields}
     for f in a_fields:
         if not f.required or f.optional:
             continue
-        if f.name not in b_map:
-            return False
-        if f.type != b_map[f.name].type:
+        bf = b_by_name.get(f.name)
+        if bf is None or bf.type != f.type:
             return False
     return True
 
@@ -307,7 +495,10 @@ def contracts_compatible(a: GeneContract, b: GeneContract) -> bool:
     """
     if a.family != b.family:
         return False
-    return (
-        _fields_compatible(a.takes, b.takes)
-        and _fields_compatible(a.gives, b.gives)
-    )
+    # Without required fields on `a` there is nothing to match, so skip
+    # building `b`'s name index.
+    if a.has_required_takes and not _fields_compatible(a.takes, b.takes_by_name):
+        return False
+    if a.has_required_gives and not _fields_compatible(a.gives, b.gives_by_name):
+        return False
+    return True
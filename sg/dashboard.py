@@ -7,19 +7,22 @@ from __future__ import annotations
 
 import asyncio
 import dataclasses
+import itertools
 import json
 import os
+import threading
 import time
 import uuid as _uuid
 from collections import OrderedDict
 from pathlib import Path
 
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, JSONResponse
-from starlette.responses import StreamingResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
+from starlette.responses import Response, StreamingResponse
 
-from sg import arena
-from sg.contracts import ContractStore
+from sg import arena, jsonio
+from sg.contracts import ContractStore, forget_parsed, iter_contract_files
+from sg.filelock import file_signature
 from sg.fusion import FusionTracker
 from sg.log import get_logger
 from sg.pathway_fitness import PathwayFitnessTracker
@@ -27,109 +30,285 @@ from sg.pathway_registry import PathwayRegistry
 from sg.phenotype import PhenotypeMap
 from sg.registry import Registry
 
+try:
+    from watchfiles import awatch
+except ImportError:
+    awatch = None  # type: ignore[assignment]
+
 logger = get_logger("dashboard")
 
 
-app = FastAPI(title="Software Genome Dashboard")
+class _ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    def render(self, content) -> bytes:
+        return jsonio.dumps(content)
+
+
+# Response class for both implicit (returned dicts) and explicit responses.
+_JSONResponse = _ORJSONResponse if jsonio.orjson is not None else JSONResponse
+
+app = FastAPI(
+    title="Software Genome Dashboard",
+    default_response_class=_JSONResponse,
+)
 
 # Project root — set at startup
 _project_root: Path = Path(".")
 _metrics_collector = None  # type: ignore
 
 
-_contract_store_cache = None
-_contract_store_mtime = 0.0
+# State objects served to read-only endpoints, keyed by (project root, name).
+# Each entry holds the stat signature of its backing file(s); the object is
+# rebuilt only when that signature changes.
+_STATE_CACHE: dict[tuple[Path, str], tuple[object, object]] = {}
+_STATE_LOCK = threading.Lock()
 
-def _load_contracts():
-    """Load contracts, with mtime-based caching to auto-reload on file changes."""
-    global _contract_store_cache, _contract_store_mtime
-    root = _project_root
-    contracts_dir = root / "contracts"
+# Every newly built state tuple gets the next generation; ETags embed it
+# together with a per-process id so they never repeat across restarts.
+_STATE_GENERATION = itertools.count(1)
+_PROCESS_ID = _uuid.uuid4().hex[:8]
+
+
+def _contracts_signature(contracts_dir: Path) -> tuple:
+    """Signature of every .sg file, so edits, additions and removals all count."""
     try:
-        current_mtime = max(
-            (f.stat().st_mtime for f in contracts_dir.rglob("*.sg")),
-            default=0.0,
+        return tuple(sorted(
+            (e.path, st.st_mtime_ns, st.st_size)
+            for e in iter_contract_files(str(contracts_dir))
+            for st in (e.stat(),)
+        ))
+    except OSError:
+        return ()
+
+
+def _cached_state(name: str, signature: object, opener):
+    """Return the cached object for name, reopening it if signature changed."""
+    key = (_project_root, name)
+    cached = _STATE_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    obj = opener()
+    _STATE_CACHE[key] = (signature, obj)
+    return obj
+
+
+def _invalidate_state(name: str | None = None) -> None:
+    """Drop cached state for the current project (one entry or all)."""
+    with _STATE_LOCK:
+        for key in list(_STATE_CACHE):
+            if key[0] == _project_root and (
+                    name is None or key[1] in (name, "_state")):
+                del _STATE_CACHE[key]
+
+
+def _load_contracts():
+    """Load contracts, reloading when any .sg file is added, removed or edited."""
+    contracts_dir = _project_root / "contracts"
+    with _STATE_LOCK:
+        return _cached_state(
+            "contracts", _contracts_signature(contracts_dir),
+            lambda: ContractStore.open(contracts_dir),
         )
-    except Exception:
-        current_mtime = 0.0
-    if _contract_store_cache is None or current_mtime > _contract_store_mtime:
-        _contract_store_cache = ContractStore.open(contracts_dir)
-        _contract_store_mtime = current_mtime
-    return _contract_store_cache
 
 
 def _load_state():
-    """Load all state from disk (fresh on each request)."""
+    """Load all state, reusing objects whose backing files are unchanged."""
     root = _project_root
     contract_store = _load_contracts()
-    registry = Registry.open(root / ".sg" / "registry")
-    phenotype = PhenotypeMap.load(root / "phenotype.toml")
-    fusion_tracker = FusionTracker.open(root / "fusion_tracker.json")
-    pathway_fitness = PathwayFitnessTracker.open(root / "pathway_fitness.json")
-    pathway_registry = PathwayRegistry.open(root / ".sg" / "pathway_registry")
     from sg.meta_params import MetaParamTracker
-    meta_tracker = MetaParamTracker.open(root / ".sg" / "meta_params.json")
-    return contract_store, registry, phenotype, fusion_tracker, pathway_fitness, pathway_registry, meta_tracker
+    sources = [
+        ("registry", root / ".sg" / "registry" / "registry.json",
+         lambda: Registry.open(root / ".sg" / "registry")),
+        ("phenotype", root / "phenotype.toml",
+         lambda: PhenotypeMap.load(root / "phenotype.toml")),
+        ("fusion", root / "fusion_tracker.json",
+         lambda: FusionTracker.open(root / "fusion_tracker.json")),
+        ("pathway_fitness", root / "pathway_fitness.json",
+         lambda: PathwayFitnessTracker.open(root / "pathway_fitness.json")),
+        ("pathway_registry",
+         root / ".sg" / "pathway_registry" / "pathway_registry.json",
+         lambda: PathwayRegistry.open(root / ".sg" / "pathway_registry")),
+        ("meta_params", root / ".sg" / "meta_params.json",
+         lambda: MetaParamTracker.open(root / ".sg" / "meta_params.json")),
+    ]
+    signatures = [file_signature(path) for _, path, _ in sources]
+    with _STATE_LOCK:
+        # Fast path: nothing changed since the last call, reuse the tuple.
+        key = (root, "_state")
+        cached = _STATE_CACHE.get(key)
+        if (cached is not None and cached[0] == signatures
+                and cached[1][0] is contract_store):
+            return cached[1]
+        objs = [
+            _cached_state(name, sig, opener)
+            for (name, _, opener), sig in zip(sources, signatures)
+        ]
+        state = (contract_store, *objs)
+        _STATE_CACHE[key] = (signatures, state)
+        _STATE_CACHE[(root, "_etag")] = (
+            state, f'W/"{_PROCESS_ID}-{next(_STATE_GENERATION)}"')
+    return state
+
+
+def _state_etag(state) -> str | None:
+    """ETag for a tuple returned by _load_state, None if it was superseded."""
+    with _STATE_LOCK:
+        cached = _STATE_CACHE.get((_project_root, "_etag"))
+    if cached is not None and cached[0] is state:
+        return cached[1]
+    return None
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = {t.strip().removeprefix("W/") for t in header.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+def _cached_json(request: Request, state, endpoint: str, build) -> Response:
+    """Serve build() for state, memoized per ETag and answered 304 on match.
+
+    The polling endpoints only change when a backing file changes, so every
+    tab and peer polling between changes shares one rendered body.
+    """
+    etag = _state_etag(state)
+    if etag is None:
+        return Response(build(), media_type="application/json")
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    key = (_project_root, f"_response:{endpoint}")
+    with _STATE_LOCK:
+        cached = _STATE_CACHE.get(key)
+    if cached is not None and cached[0] == etag:
+        body = cached[1]
+    else:
+        body = build()
+        with _STATE_LOCK:
+            _STATE_CACHE[key] = (etag, body)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+# sha -> (allele object, counters, params, fitness). Registry objects come
+# from _STATE_CACHE and are replaced when registry.json changes, so an entry
+# is valid only for the same allele object with unchanged counters/params.
+_FITNESS_CACHE: dict[str, tuple] = {}
+_FITNESS_CACHE_MAX = 10_000
+
+
+def _fitness_pair(allele, params) -> tuple[float, float]:
+    """(fitness, fitness rounded for display), memoized across requests."""
+    counters = (allele.successful_invocations, allele.failed_invocations,
+                len(allele.fitness_records))
+    hit = _FITNESS_CACHE.get(allele.sha256)
+    if (hit is not None and hit[0] is allele and hit[1] == counters
+            and hit[2] == params):
+        return hit[3]
+    value = arena.compute_fitness(allele, params=params)
+    pair = (value, round(value, 3))
+    if len(_FITNESS_CACHE) >= _FITNESS_CACHE_MAX:
+        _FITNESS_CACHE.clear()
+    _FITNESS_CACHE[allele.sha256] = (allele, counters, params, pair)
+    return pair
+
+
+def _fitness(allele, params) -> float:
+    """arena.compute_fitness, memoized across requests."""
+    return _fitness_pair(allele, params)[0]
+
+
+def _display_fitness(allele, params) -> float:
+    """Memoized fitness rounded to 3 places, as the API reports it."""
+    return _fitness_pair(allele, params)[1]
 
 
 @app.get("/api/status")
-def api_status():
-    cs, reg, pheno, ft, _pft, _pr, mpt = _load_state()
+async def api_status(request: Request):
+    state = await asyncio.to_thread(_load_state)
+    return await asyncio.to_thread(
+        _cached_json, request, state, "status",
+        lambda: jsonio.dumps(_status_summary(state)))
+
+
+def _status_summary(state) -> dict:
+    """Counts and mean fitness for /api/status, computed once per state tuple.
+
+    _load_state returns the same tuple until a backing file changes, so the
+    summary is keyed on that tuple's identity.
+    """
+    key = (_project_root, "_status")
+    with _STATE_LOCK:
+        cached = _STATE_CACHE.get(key)
+    if cached is not None and cached[0] is state:
+        return cached[1]
+    cs, reg, pheno, _ft, _pft, _pr, mpt = state
     allele_count = len(reg.alleles)
-    loci_count = len(cs.known_loci())
-    pathway_count = len(cs.known_pathways())
-    topology_count = len(cs.known_topologies())
-    fused_count = sum(
-        1 for name in cs.known_pathways()
-        if (f := pheno.get_fused(name)) and f.fused_sha
-    )
-    fitnesses = [arena.compute_fitness(a, params=mpt.get_params(a.locus)) for a in reg.alleles.values()]
-    avg_fitness = sum(fitnesses) / len(fitnesses) if fitnesses else 0.0
-    return {
-        "loci_count": loci_count,
+    total_fitness = 0.0
+    for a in reg.alleles.values():
+        total_fitness += _fitness(a, mpt.get_params(a.locus))
+    avg_fitness = total_fitness / allele_count if allele_count else 0.0
+    summary = {
+        "loci_count": len(cs.iter_loci()),
         "allele_count": allele_count,
-        "pathway_count": pathway_count,
-        "topology_count": topology_count,
-        "fused_count": fused_count,
+        "pathway_count": len(cs.iter_pathways()),
+        "topology_count": len(cs.iter_topologies()),
+        # Only pathways that still have a contract count as fused.
+        "fused_count": sum(
+            1 for name, f in pheno.pathway_fusions.items()
+            if f.fused_sha and cs.get_pathway(name) is not None
+        ) if pheno.fused_count else 0,
         "avg_fitness": round(avg_fitness, 3),
     }
+    with _STATE_LOCK:
+        _STATE_CACHE[key] = (state, summary)
+    return summary
 
 
 @app.get("/api/loci")
-def api_loci():
-    cs, reg, pheno, _, _, _, mpt = _load_state()
-    result = []
-    for locus in cs.known_loci():
-        alleles = reg.alleles_for_locus(locus)
-        dominant_sha = pheno.get_dominant(locus)
-        dominant_fitness = 0.0
-        if dominant_sha:
-            dom = reg.get(dominant_sha)
-            if dom:
-                dominant_fitness = arena.compute_fitness(dom, params=mpt.get_params(locus))
-        result.append({
-            "name": locus,
-            "dominant_sha": dominant_sha[:12] if dominant_sha else None,
-            "allele_count": len(alleles),
-            "dominant_fitness": round(dominant_fitness, 3),
-        })
-    return result
+async def api_loci(request: Request):
+    state = await asyncio.to_thread(_load_state)
+    cs, reg, pheno, _, _, _, mpt = state
+
+    def rows():
+        for locus in cs.iter_loci():
+            alleles = reg.alleles_for_locus(locus, sort=False)
+            dominant_sha = pheno.get_dominant(locus)
+            dominant_fitness = 0.0
+            if dominant_sha:
+                dom = reg.get(dominant_sha)
+                if dom:
+                    dominant_fitness = _display_fitness(dom, mpt.get_params(locus))
+            yield {
+                "name": locus,
+                "dominant_sha": dominant_sha[:12] if dominant_sha else None,
+                "allele_count": len(alleles),
+                "dominant_fitness": dominant_fitness,
+            }
+
+    return await asyncio.to_thread(
+        _cached_json, request, state, "loci",
+        lambda: jsonio.dumps(list(rows())))
 
 
 @app.get("/api/locus/{name}")
-def api_locus(name: str):
-    cs, reg, pheno, _, _, _, mpt = _load_state()
-    alleles = reg.alleles_for_locus(name)
+async def api_locus(name: str):
+    cs, reg, pheno, _, _, _, mpt = await asyncio.to_thread(_load_state)
     dominant_sha = pheno.get_dominant(name)
     params = mpt.get_params(name)
+    scored = [(_fitness_pair(a, params), a)
+              for a in reg.alleles_for_locus(name, sort=False)]
+    scored.sort(key=lambda item: item[0][0], reverse=True)
 
     allele_list = []
-    for a in alleles:
+    for (_, fitness), a in scored:
         allele_list.append({
             "sha": a.sha256[:12],
             "sha_full": a.sha256,
             "generation": a.generation,
-            "fitness": round(arena.compute_fitness(a, params=params), 3),
+            "fitness": fitness,
             "state": a.state,
             "successful_invocations": a.successful_invocations,
             "failed_invocations": a.failed_invocations,
@@ -137,108 +316,121 @@ def api_locus(name: str):
             "is_dominant": a.sha256 == dominant_sha,
         })
 
-    contract = cs.get_gene(name)
     contract_info = None
-    if contract:
+    if cs.get_gene(name) is not None:
+        info = cs.contract_info(name)
         contract_info = {
-            "does": contract.does,
-            "family": contract.family.value,
-            "risk": contract.risk.value,
-            "takes": [{"name": f.name, "type": f.type} for f in contract.takes],
-            "gives": [{"name": f.name, "type": f.type} for f in contract.gives],
+            "does": info.description,
+            "family": info.family,
+            "risk": info.risk,
+            "takes": info.takes_summary,
+            "gives": info.gives_summary,
         }
 
     return {"name": name, "alleles": allele_list, "contract": contract_info}
 
 
 @app.get("/api/pathways")
-def api_pathways():
-    cs, _, pheno, ft, pft, pr, _ = _load_state()
-    result = []
-    for name in cs.known_pathways():
-        fusion = pheno.get_fused(name)
-        track = ft.get_track(name)
-        fitness_rec = pft.get_record(name)
-        pw_alleles = pr.get_for_pathway(name)
-        pw_dominant = pheno.get_pathway_dominant(name)
-        pw_contract = cs.get_pathway(name)
-        defaults = {}
-        if pw_contract:
-            for f in pw_contract.takes:
-                if f.default is not None:
-                    defaults[f.name] = f.default
-        result.append({
-            "name": name,
-            "fused": bool(fusion and fusion.fused_sha),
-            "fused_sha": fusion.fused_sha[:12] if fusion and fusion.fused_sha else None,
-            "reinforcement_count": track.reinforcement_count if track else 0,
-            "total_successes": track.total_successes if track else 0,
-            "total_failures": track.total_failures if track else 0,
-            "fitness": round(pft.compute_fitness(name), 3),
-            "total_executions": fitness_rec.total_executions if fitness_rec else 0,
-            "avg_time_ms": round(fitness_rec.avg_execution_time_ms, 1) if fitness_rec else 0,
-            "consecutive_failures": fitness_rec.consecutive_failures if fitness_rec else 0,
-            "pathway_allele_count": len(pw_alleles),
-            "dominant_pathway_allele": pw_dominant[:12] if pw_dominant else None,
-            "defaults": defaults,
-        })
-    return result
+async def api_pathways(request: Request):
+    state = await asyncio.to_thread(_load_state)
+    cs, _, pheno, ft, pft, pr, _ = state
+
+    def rows():
+        for name in cs.iter_pathways():
+            fusion = pheno.get_fused(name)
+            track = ft.get_track(name)
+            fitness_rec = pft.get_record(name)
+            pw_alleles = pr.get_for_pathway(name)
+            pw_dominant = pheno.get_pathway_dominant(name)
+            pw_contract = cs.get_pathway(name)
+            defaults = {}
+            if pw_contract:
+                for f in pw_contract.takes:
+                    if f.default is not None:
+                        defaults[f.name] = f.default
+            yield {
+                "name": name,
+                "fused": bool(fusion and fusion.fused_sha),
+                "fused_sha": fusion.fused_sha[:12] if fusion and fusion.fused_sha else None,
+                "reinforcement_count": track.reinforcement_count if track else 0,
+                "total_successes": track.total_successes if track else 0,
+                "total_failures": track.total_failures if track else 0,
+                "fitness": round(pft.compute_fitness(name), 3),
+                "total_executions": fitness_rec.total_executions if fitness_rec else 0,
+                "avg_time_ms": round(fitness_rec.avg_execution_time_ms, 1) if fitness_rec else 0,
+                "consecutive_failures": fitness_rec.consecutive_failures if fitness_rec else 0,
+                "pathway_allele_count": len(pw_alleles),
+                "dominant_pathway_allele": pw_dominant[:12] if pw_dominant else None,
+                "defaults": defaults,
+            }
+
+    return await asyncio.to_thread(
+        _cached_json, request, state, "pathways",
+        lambda: jsonio.dumps(list(rows())))
 
 
 @app.get("/api/allele/{sha}/source")
-def api_allele_source(sha: str):
-    _, reg, _, _, _, _, _ = _load_state()
+async def api_allele_source(sha: str, request: Request):
+    """Gene source as {"source": ...}, or the raw file for Accept: text/plain."""
+    _, reg, _, _, _, _, _ = await asyncio.to_thread(_load_state)
     # Try exact match first, then prefix
-    source = reg.load_source(sha)
-    if source is None:
-        for full_sha in reg.alleles:
-            if full_sha.startswith(sha):
-                source = reg.load_source(full_sha)
-                break
-    if source is None:
-        return JSONResponse({"error": "not found"}, status_code=404)
-    return {"source": source}
+    path = reg.source_path(sha)
+    if not await asyncio.to_thread(path.is_file):
+        full_sha = reg.resolve_prefix(sha)
+        path = reg.source_path(full_sha) if full_sha is not None else None
+        if path is None or not await asyncio.to_thread(path.is_file):
+            return _JSONResponse({"error": "not found"}, status_code=404)
+    if "text/plain" in request.headers.get("accept", ""):
+        # Sent straight from disk, no read into memory or JSON escaping.
+        return FileResponse(path, media_type="text/plain; charset=utf-8")
+    return {"source": await asyncio.to_thread(path.read_text)}
+
+
+# Longest chain /api/lineage returns unless ?max_depth= asks for more.
+_LINEAGE_MAX_DEPTH = 64
 
 
 @app.get("/api/lineage/{sha}")
-def api_lineage(sha: str):
-    """Return the lineage chain for an allele (child → parent → ...)."""
-    _, reg, _, _, _, _, mpt = _load_state()
-    # Resolve prefix
-    full_sha = sha
-    if sha not in reg.alleles:
-        for s in reg.alleles:
-            if s.startswith(sha):
-                full_sha = s
-                break
-
-    chain = []
-    current = full_sha
-    seen = set()
-    while current and current not in seen:
-        seen.add(current)
-        allele = reg.get(current)
-        if allele is None:
-            break
-        chain.append({
+async def api_lineage(
+    sha: str, depth: int | None = None, max_depth: int = _LINEAGE_MAX_DEPTH,
+):
+    """Return the lineage chain for an allele (child → parent → ...).
+
+    The chain is cut after max_depth alleles (default 64) and flagged as
+    truncated. With ?depth=N, return only the ancestor N generations up
+    (looked up through the registry's skip-list index rather than a walk).
+    """
+    _, reg, _, _, _, _, mpt = await asyncio.to_thread(_load_state)
+    truncated = False
+    if depth is not None:
+        ancestor = reg.ancestor_at(sha, depth)
+        alleles = [ancestor] if ancestor is not None else []
+    else:
+        max_depth = max(1, max_depth)
+        alleles = reg.lineage(sha, max_depth=max_depth + 1)
+        truncated = len(alleles) > max_depth
+        del alleles[max_depth:]
+    chain = [
+        {
             "sha": allele.sha256[:12],
             "sha_full": allele.sha256,
             "locus": allele.locus,
             "generation": allele.generation,
-            "fitness": round(arena.compute_fitness(allele, params=mpt.get_params(allele.locus)), 3),
+            "fitness": _display_fitness(allele, mpt.get_params(allele.locus)),
             "state": allele.state,
-        })
-        current = allele.parent_sha
-    return {"lineage": chain}
+        }
+        for allele in alleles
+    ]
+    return {"lineage": chain, "truncated": truncated}
 
 
 @app.get("/api/regression")
-def api_regression():
+async def api_regression():
     """Return regression history for all tracked alleles."""
     root = _project_root
     regression_path = root / ".sg" / "regression.json"
     from sg.regression import RegressionDetector
-    det = RegressionDetector.open(regression_path)
+    det = await asyncio.to_thread(RegressionDetector.open, regression_path)
     result = []
     for sha, h in det.history.items():
         result.append({
@@ -302,35 +494,151 @@ def api_pathway_lineage(name: str):
     return {"pathway": name, "alleles": result}
 
 
+def _watched_files(root: Path) -> list[Path]:
+    """State files whose changes trigger an SSE update event."""
+    return [root / "phenotype.toml",
+            root / ".sg" / "registry" / "registry.json",
+            root / "fusion_tracker.json",
+            root / "pathway_fitness.json",
+            root / ".sg" / "pathway_registry" / "pathway_registry.json"]
+
+
+async def _state_changes(root: Path):
+    """Yield once per batch of changes to the watched state files.
+
+    Uses watchfiles (inotify/FSEvents) when installed; otherwise polls
+    file mtimes every 2s.
+    """
+    watched = _watched_files(root)
+    if awatch is not None:
+        paths = [f.resolve() for f in watched]
+        names = {str(f) for f in paths}
+        dirs = sorted({str(f.parent) for f in paths if f.parent.is_dir()})
+        async for _changes in awatch(
+            *dirs,
+            watch_filter=lambda _change, path: path in names,
+            recursive=False,
+            debounce=50,
+        ):
+            yield
+        return
+
+    # One stat per file per tick. Paths are re-stat'ed rather than held
+    # open because state files are replaced by atomic rename, which an
+    # open descriptor would never see.
+    paths = [str(f) for f in watched]
+    last_mtime = 0.0
+    while True:
+        current = 0.0
+        for path in paths:
+            try:
+                mtime = os.stat(path).st_mtime
+            except FileNotFoundError:
+                continue
+            if mtime > current:
+                current = mtime
+        if current > last_mtime and last_mtime > 0:
+            yield
+        last_mtime = current
+        await asyncio.sleep(2)
+
+
+# SSE fan-out: a single watcher task per process broadcasts update events
+# to every connected client's queue. It starts with the first subscriber
+# and is cancelled when the last one disconnects.
+_SSE_DEBOUNCE = 0.5  # seconds
+_SSE_QUEUE_SIZE = 16
+_sse_subscribers: set[asyncio.Queue] = set()
+_sse_watcher: asyncio.Task | None = None
+_sse_watcher_root: Path | None = None
+
+
+def _sse_broadcast(event: str) -> None:
+    for queue in _sse_subscribers:
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            pass  # client is behind; it still has an update queued
+
+
+async def _sse_watch(root: Path) -> None:
+    """Broadcast an update event whenever a watched state file changes.
+
+    The first change is sent immediately; further changes within
+    _SSE_DEBOUNCE seconds are coalesced into one trailing event.
+    """
+    loop = asyncio.get_running_loop()
+    last_sent = float("-inf")
+    trailing: asyncio.TimerHandle | None = None
+
+    def send() -> None:
+        nonlocal last_sent, trailing
+        trailing = None
+        last_sent = loop.time()
+        _sse_broadcast(f"data: {{\"type\": \"update\", \"time\": {time.time()}}}\n\n")
+
+    try:
+        async for _ in _state_changes(root):
+            wait = _SSE_DEBOUNCE - (loop.time() - last_sent)
+            if wait <= 0:
+                send()
+            elif trailing is None:
+                trailing = loop.call_later(wait, send)
+    finally:
+        if trailing is not None:
+            trailing.cancel()
+
+
+def _sse_subscribe(queue: asyncio.Queue) -> None:
+    global _sse_watcher, _sse_watcher_root
+    _sse_subscribers.add(queue)
+    if (_sse_watcher is None or _sse_watcher.done()
+            or _sse_watcher_root != _project_root):
+        if _sse_watcher is not None:
+            _sse_watcher.cancel()
+        _sse_watcher_root = _project_root
+        _sse_watcher = asyncio.create_task(_sse_watch(_project_root))
+
+
+def _sse_unsubscribe(queue: asyncio.Queue) -> None:
+    global _sse_watcher
+    _sse_subscribers.discard(queue)
+    if not _sse_subscribers and _sse_watcher is not None:
+        _sse_watcher.cancel()
+        _sse_watcher = None
+
+
 @app.get("/api/events")
 async def api_events():
-    """SSE stream — yields update events when files change or daemon ticks."""
-    root = _project_root
+    """SSE stream — yields update events when files change or daemon ticks.
 
-    async def event_stream():
-        last_mtime = 0.0
-        last_tick = 0
-        while True:
-            current = 0.0
-            for f in [root / "phenotype.toml",
-                      root / ".sg" / "registry" / "registry.json",
-                      root / "fusion_tracker.json",
-                      root / "pathway_fitness.json",
-                      root / ".sg" / "pathway_registry" / "pathway_registry.json"]:
-                if f.exists():
-                    current = max(current, f.stat().st_mtime)
-            if current > last_mtime and last_mtime > 0:
-                yield f"data: {{\"type\": \"update\", \"time\": {current}}}\n\n"
-            last_mtime = current
+    All clients share one process-wide file watcher (see _sse_watch);
+    daemon ticks are checked at least every 2s.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_SSE_QUEUE_SIZE)
 
-            if _daemon.tick_count != last_tick:
-                last_tick = _daemon.tick_count
-                d = json.dumps({"type": "daemon_tick", **_daemon.to_dict()})
-                yield f"data: {d}\n\n"
+    def _daemon_event(last_tick: int) -> tuple[int, str | None]:
+        if _daemon.tick_count == last_tick:
+            return last_tick, None
+        d = json.dumps({"type": "daemon_tick", **_daemon.to_dict()})
+        return _daemon.tick_count, f"data: {d}\n\n"
 
-            await asyncio.sleep(2)
+    async def stream():
+        last_tick = 0
+        _sse_subscribe(queue)
+        try:
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), timeout=2)
+                except asyncio.TimeoutError:
+                    pass
+                last_tick, event = _daemon_event(last_tick)
+                if event:
+                    yield event
+        finally:
+            _sse_unsubscribe(queue)
 
-    return StreamingResponse(event_stream(), media_type="text/event-stream")
+    return StreamingResponse(stream(), media_type="text/event-stream")
 
 
 # Dashboard analysis endpoints
@@ -341,7 +649,7 @@ def api_feeds():
     cs, _, _, _, _, _, _ = _load_state()
     edges = []
     verify_links = []
-    for locus_name in cs.known_loci():
+    for locus_name in cs.iter_loci():
         gene = cs.get_gene(locus_name)
         if gene is None:
             continue
@@ -389,7 +697,7 @@ def api_contract_raw(name: str):
     cs, _, _, _, _, _, _ = _load_state()
     path = cs.file_path(name)
     if path is None or not path.exists():
-        return JSONResponse({"error": f"contract '{name}' not found"}, status_code=404)
+        return _JSONResponse({"error": f"contract '{name}' not found"}, status_code=404)
     source = path.read_text()
 
     gene = cs.get_gene(name)
@@ -443,7 +751,7 @@ async def api_contract_save(name: str, request: Request):
     data = await request.json()
     source = data.get("source", "")
     if not source.strip():
-        return JSONResponse({"error": "empty contract source"}, status_code=400)
+        return _JSONResponse({"error": "empty contract source"}, status_code=400)
 
     cs, _, _, _, _, _, _ = _load_state()
     path = cs.file_path(name)
@@ -453,7 +761,7 @@ async def api_contract_save(name: str, request: Request):
         from sg.parser.parser import parse_sg
         contract = parse_sg(source)
     except Exception as e:
-        return JSONResponse({"error": f"parse error: {e}"}, status_code=400)
+        return _JSONResponse({"error": f"parse error: {e}"}, status_code=400)
 
     new_name = contract.name
     if path is None:
@@ -469,9 +777,8 @@ async def api_contract_save(name: str, request: Request):
         path.parent.mkdir(parents=True, exist_ok=True)
 
     path.write_text(source)
-    global _contract_store_cache, _contract_store_mtime
-    _contract_store_cache = None
-    _contract_store_mtime = 0.0
+    forget_parsed(path)
+    _invalidate_state("contracts")
     return {"ok": True, "name": new_name, "path": str(path)}
 
 
@@ -484,7 +791,7 @@ async def api_pathway_draft(request: Request):
     kernel_name = data.get("kernel", "data-mock")
 
     if not intent:
-        return JSONResponse({"error": "intent is required"}, status_code=400)
+        return _JSONResponse({"error": "intent is required"}, status_code=400)
 
     job_id = _uuid.uuid4().hex[:12]
     _jobs[job_id] = {"status": "running", "type": "draft_pathway"}
@@ -617,7 +924,7 @@ def api_job(job_id: str):
     """Poll for job result."""
     job = _jobs.get(job_id)
     if job is None:
-        return JSONResponse({"error": "job not found"}, status_code=404)
+        return _JSONResponse({"error": "job not found"}, status_code=404)
     return job
 
 
@@ -736,7 +1043,7 @@ async def api_run(request: Request):
     input_override = data.get("input")
 
     if not pathway_name:
-        return JSONResponse({"error": "pathway is required"}, status_code=400)
+        return _JSONResponse({"error": "pathway is required"}, status_code=400)
 
     job_id = _uuid.uuid4().hex[:12]
     _jobs[job_id] = {"status": "running", "type": "run", "pathway": pathway_name,
@@ -829,7 +1136,7 @@ async def api_generate(request: Request):
     engine_name = data.get("mutation_engine", "mock")
 
     if not locus:
-        return JSONResponse({"error": "locus is required"}, status_code=400)
+        return _JSONResponse({"error": "locus is required"}, status_code=400)
 
     job_id = _uuid.uuid4().hex[:12]
     _jobs[job_id] = {"status": "running", "type": "generate", "locus": locus}
@@ -905,7 +1212,7 @@ async def api_compete(request: Request):
     kernel_name = data.get("kernel", "data-mock")
 
     if not locus:
-        return JSONResponse({"error": "locus is required"}, status_code=400)
+        return _JSONResponse({"error": "locus is required"}, status_code=400)
 
     job_id = _uuid.uuid4().hex[:12]
     _jobs[job_id] = {"status": "running", "type": "compete", "locus": locus}
@@ -1024,13 +1331,9 @@ def api_delete_allele(sha: str):
     registry = Registry.open(root / ".sg" / "registry")
     phenotype = PhenotypeMap.load(root / "phenotype.toml")
 
-    full_sha = None
-    for s in registry.alleles:
-        if s == sha or s.startswith(sha):
-            full_sha = s
-            break
+    full_sha = registry.resolve_prefix(sha)
     if full_sha is None:
-        return JSONResponse({"error": f"allele not found: {sha}"}, status_code=404)
+        return _JSONResponse({"error": f"allele not found: {sha}"}, status_code=404)
 
     meta = registry.get(full_sha)
     locus = meta.locus if meta else "unknown"
@@ -1050,7 +1353,7 @@ def api_delete_locus_alleles(name: str):
 
     count = registry.delete_locus(name)
     if count == 0:
-        return JSONResponse({"error": f"no alleles for locus: {name}"}, status_code=404)
+        return _JSONResponse({"error": f"no alleles for locus: {name}"}, status_code=404)
 
     phenotype.clear_locus(name)
     registry.save_index()
@@ -1343,22 +1646,25 @@ async def api_daemon_configure(request: Request):
 @app.post("/api/federation/receive")
 async def federation_receive(request: Request):
     """Accept an allele from a peer with integrity verification."""
-    data = await request.json()
-    _, reg, pheno, _, _, _, _ = _load_state()
-    from sg.federation import import_allele, verify_allele_integrity
-    if not verify_allele_integrity(data):
-        return JSONResponse({"error": "integrity check failed"}, status_code=400)
+    data = jsonio.loads(await request.body())
+    # Writes go to fresh objects: the cached state is shared with readers.
+    root = _project_root
+    reg = Registry.open(root / ".sg" / "registry")
+    pheno = PhenotypeMap.load(root / "phenotype.toml")
+    from sg.federation import import_allele
     try:
+        # import_allele verifies source_sha256 before registering.
         sha = import_allele(reg, data)
     except ValueError as e:
-        return JSONResponse({"error": str(e)}, status_code=400)
+        return _JSONResponse({"error": str(e)}, status_code=400)
     locus = data.get("locus", "")
     pheno.add_to_fallback(locus, sha)
     allele = reg.get(sha)
     if allele:
         allele.state = "recessive"
     reg.save_index()
-    pheno.save(_project_root / "phenotype.toml")
+    pheno.save(root / "phenotype.toml")
+    _invalidate_state()
     return {"status": "ok", "sha": sha[:12]}
 
 
@@ -1366,39 +1672,39 @@ async def federation_receive(request: Request):
 async def federation_fitness(request: Request):
     """Accept fitness observations from a peer for an allele."""
     data = await request.json()
-    _, reg, _, _, _, _, _ = _load_state()
+    reg = Registry.open(_project_root / ".sg" / "registry")
     sha = data.get("sha256", "")
     peer_name = data.get("peer", "unknown")
 
     # Resolve prefix
-    allele = reg.get(sha)
-    if allele is None:
-        for full_sha in reg.alleles:
-            if full_sha.startswith(sha):
-                allele = reg.get(full_sha)
-                break
+    full_sha = reg.resolve_prefix(sha)
+    allele = reg.get(full_sha) if full_sha else None
 
     if allele is None:
-        return JSONResponse({"error": "allele not found"}, status_code=404)
+        return _JSONResponse({"error": "allele not found"}, status_code=404)
 
     from sg.federation import merge_peer_observation
     merge_peer_observation(allele, peer_name, data)
     reg.save_index()
+    _invalidate_state("registry")
     return {"status": "ok", "peer_observations": len(allele.peer_observations)}
 
 
 @app.get("/api/federation/alleles/{locus}")
-def federation_alleles(locus: str):
+async def federation_alleles(locus: str):
     """Serve alleles for a locus to a peer."""
-    _, reg, _, _, _, _, mpt = _load_state()
+    _, reg, _, _, _, _, mpt = await asyncio.to_thread(_load_state)
     from sg.federation import export_allele
-    alleles = reg.alleles_for_locus(locus)
-    result = []
-    for a in alleles[:5]:  # limit to top 5 by fitness
-        data = export_allele(reg, a.sha256, meta_param_tracker=mpt)
-        if data:
-            result.append(data)
-    return {"alleles": result}
+
+    def export() -> list[dict]:
+        result = []
+        for a in reg.alleles_for_locus(locus)[:5]:  # top 5 by fitness
+            data = export_allele(reg, a.sha256, meta_param_tracker=mpt)
+            if data:
+                result.append(data)
+        return result
+
+    return {"alleles": await asyncio.to_thread(export)}
 
 
 _DASHBOARD_HTML = r"""<!DOCTYPE html>
@@ -2778,9 +3084,12 @@ function closeDetail() {
 // ══════════════════════════════════════════
 async function showSource(sha) {
   if(!sha || sha==='none') return;
-  const d = await fetchJSON('/api/allele/'+sha+'/source');
+  let src = 'not found';
+  try {
+    const resp = await fetch('/api/allele/'+sha+'/source', {headers:{'Accept':'text/plain'}});
+    if(resp.ok) src = await resp.text();
+  } catch(e) {}
   document.getElementById('source-title').textContent = 'Source: ' + sha;
-  const src = d?.source || d?.error || 'not found';
   // Python highlighting — tokenize to avoid corrupting HTML tags
   const escaped = src.replace(/&/g,'&amp;').replace(/</g,'&lt;').replace(/>/g,'&gt;');
   const tokens = [];
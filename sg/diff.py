@@ -45,12 +45,14 @@ def diff_phenotypes(
     """Compare two phenotype maps. Optionally include fitness from registries."""
     diff = PhenotypeDiff()
 
-    old_loci = set(old.loci.keys())
-    new_loci = set(new.loci.keys())
+    old_cfgs = old.loci
+    new_cfgs = new.loci
+    old_loci = old_cfgs.keys()
+    new_loci = new_cfgs.keys()
 
     # Added loci
     for locus in sorted(new_loci - old_loci):
-        new_dom = new.get_dominant(locus)
+        new_dom = new_cfgs[locus].dominant
         fitness = _get_fitness(new_reg, new_dom, meta_param_tracker) if new_dom else 0.0
         diff.loci_changes.append(LocusDiff(
             locus=locus, change="added",
@@ -60,7 +62,7 @@ def diff_phenotypes(
 
     # Removed loci
     for locus in sorted(old_loci - new_loci):
-        old_dom = old.get_dominant(locus)
+        old_dom = old_cfgs[locus].dominant
         fitness = _get_fitness(old_reg, old_dom, meta_param_tracker) if old_dom else 0.0
         diff.loci_changes.append(LocusDiff(
             locus=locus, change="removed",
@@ -68,12 +70,13 @@ def diff_phenotypes(
             old_fitness=fitness,
         ))
 
-    # Changed loci
+    # Changed loci. With equal dominants, the [dominant, *fallback] stacks
+    # differ exactly when the fallback lists do.
     for locus in sorted(old_loci & new_loci):
-        old_dom = old.get_dominant(locus)
-        new_dom = new.get_dominant(locus)
-        old_stack = old.get_stack(locus)
-        new_stack = new.get_stack(locus)
+        old_cfg = old_cfgs[locus]
+        new_cfg = new_cfgs[locus]
+        old_dom = old_cfg.dominant
+        new_dom = new_cfg.dominant
 
         if old_dom != new_dom:
             diff.loci_changes.append(LocusDiff(
@@ -83,7 +86,7 @@ def diff_phenotypes(
                 old_fitness=_get_fitness(old_reg, old_dom, meta_param_tracker) if old_dom else 0.0,
                 new_fitness=_get_fitness(new_reg, new_dom, meta_param_tracker) if new_dom else 0.0,
             ))
-        elif old_stack != new_stack:
+        elif old_cfg.fallback != new_cfg.fallback:
             diff.loci_changes.append(LocusDiff(
                 locus=locus, change="fallback_changed",
                 old_dominant=old_dom[:12] if old_dom else None,
@@ -8,19 +8,44 @@ secret for peer authentication.
 """
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import hmac
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from sg import arena
+from sg.jsonio import read_json
 from sg.registry import Registry, AlleleMetadata
 
-try:
+if TYPE_CHECKING:
     import httpx
-except ImportError:
-    httpx = None  # type: ignore[assignment]
+
+_UNLOADED = object()
+
+
+def _httpx():
+    """httpx, imported on first network use (None if not installed).
+
+    Export/import/verify paths (the dashboard's federation endpoints, for
+    instance) never touch the network and skip the import entirely.
+    """
+    mod = globals().get("httpx", _UNLOADED)
+    if mod is _UNLOADED:
+        try:
+            import httpx as mod
+        except ImportError:
+            mod = None
+        globals()["httpx"] = mod
+    return mod
+
+
+def __getattr__(name: str):
+    if name == "httpx":
+        return _httpx()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @dataclass
@@ -35,7 +60,7 @@ def load_peers(config_path: Path) -> list[PeerConfig]:
     """Load peer list from peers.json."""
     if not config_path.exists():
         return []
-    data = json.loads(config_path.read_text())
+    data = read_json(config_path)
     return [PeerConfig(**p) for p in data.get("peers", [])]
 
 
@@ -44,10 +69,22 @@ def compute_source_sha(source: str) -> str:
     return hashlib.sha256(source.encode()).hexdigest()
 
 
+def _canonical(payload: dict) -> bytes:
+    """Canonical JSON bytes that signatures are computed over.
+
+    This must stay byte-identical to ``json.dumps(payload, sort_keys=True)``
+    so signatures still verify against older peers.
+    """
+    return json.dumps(payload, sort_keys=True).encode()
+
+
+def _sign_canonical(body: bytes, secret: str) -> str:
+    return hmac.digest(secret.encode(), body, "sha256").hex()
+
+
 def sign_payload(payload: dict, secret: str) -> str:
     """HMAC-SHA256 signature over the JSON payload."""
-    body = json.dumps(payload, sort_keys=True).encode()
-    return hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return _sign_canonical(_canonical(payload), secret)
 
 
 def verify_signature(payload: dict, signature: str, secret: str) -> bool:
@@ -70,7 +107,8 @@ def export_allele(registry: Registry, sha: str, meta_param_tracker=None) -> dict
         "locus": allele.locus,
         "generation": allele.generation,
         "source": source,
-        "source_sha256": compute_source_sha(source),
+        # Registry SHAs are SHA-256 of the source, so no need to rehash.
+        "source_sha256": allele.sha256,
         "fitness": arena.compute_fitness(allele, params=params),
         "successful_invocations": allele.successful_invocations,
         "total_invocations": allele.total_invocations,
@@ -78,12 +116,16 @@ def export_allele(registry: Registry, sha: str, meta_param_tracker=None) -> dict
 
 
 def verify_allele_integrity(data: dict) -> bool:
-    """Verify that source_sha256 matches the actual source content."""
-    source = data.get("source", "")
+    """Verify that source_sha256 matches the actual source content.
+
+    The source is always hashed when a digest is claimed: the payload's own
+    sha256/source_sha256 fields come from the sender and prove nothing
+    about the source they travel with.
+    """
     expected = data.get("source_sha256", "")
     if not expected:
         return True  # no hash provided — accept (backwards compat)
-    return compute_source_sha(source) == expected
+    return compute_source_sha(data.get("source", "")) == expected
 
 
 def import_allele(registry: Registry, data: dict) -> str:
@@ -117,16 +159,24 @@ def merge_peer_observation(allele: AlleleMetadata, peer_name: str, data: dict) -
         allele.peer_observations = allele.peer_observations[-MAX_PEER_OBSERVATIONS:]
 
 
+def _signature_headers(
+    peer: PeerConfig, payload: dict, body: bytes | None = None,
+) -> dict[str, str]:
+    """Signature header for *peer*; pass *body* to reuse a canonical form."""
+    if not peer.secret:
+        return {}
+    if body is None:
+        body = _canonical(payload)
+    return {"X-SG-Signature": _sign_canonical(body, peer.secret)}
+
+
 def push_allele(peer: PeerConfig, allele_data: dict) -> bool:
     """Push an allele to a peer. Returns success."""
     try:
-        headers = {}
-        if peer.secret:
-            headers["X-SG-Signature"] = sign_payload(allele_data, peer.secret)
-        resp = httpx.post(
+        resp = _httpx().post(
             f"{peer.url}/api/federation/receive",
             json=allele_data,
-            headers=headers,
+            headers=_signature_headers(peer, allele_data),
             timeout=30.0,
         )
         return resp.status_code == 200
@@ -137,12 +187,9 @@ def push_allele(peer: PeerConfig, allele_data: dict) -> bool:
 def pull_alleles(peer: PeerConfig, locus: str) -> list[dict]:
     """Pull alleles for a locus from a peer."""
     try:
-        headers = {}
-        if peer.secret:
-            headers["X-SG-Signature"] = sign_payload({"locus": locus}, peer.secret)
-        resp = httpx.get(
+        resp = _httpx().get(
             f"{peer.url}/api/federation/alleles/{locus}",
-            headers=headers,
+            headers=_signature_headers(peer, {"locus": locus}),
             timeout=30.0,
         )
         if resp.status_code == 200:
@@ -150,3 +197,73 @@ def pull_alleles(peer: PeerConfig, locus: str) -> list[dict]:
     except Exception:
         pass
     return []
+
+
+# --- Batched transfers: one pooled client, requests to all peers in flight ---
+
+_MAX_KEEPALIVE = 32
+
+
+def _async_client() -> httpx.AsyncClient:
+    client_mod = _httpx()
+    return client_mod.AsyncClient(
+        timeout=30.0,
+        limits=client_mod.Limits(max_keepalive_connections=_MAX_KEEPALIVE),
+    )
+
+
+async def _apush(
+    client, peer: PeerConfig, allele_data: dict, body: bytes | None = None,
+) -> bool:
+    try:
+        resp = await client.post(
+            f"{peer.url}/api/federation/receive",
+            json=allele_data,
+            headers=_signature_headers(peer, allele_data, body),
+        )
+        return resp.status_code == 200
+    except Exception:
+        return False
+
+
+async def _apull(client, peer: PeerConfig, locus: str) -> list[dict]:
+    try:
+        resp = await client.get(
+            f"{peer.url}/api/federation/alleles/{locus}",
+            headers=_signature_headers(peer, {"locus": locus}),
+        )
+        if resp.status_code == 200:
+            return resp.json().get("alleles", [])
+    except Exception:
+        pass
+    return []
+
+
+async def apush_to_peers(
+    peers: list[PeerConfig], allele_data: dict,
+) -> list[bool]:
+    """Push an allele to every peer concurrently. Returns per-peer success."""
+    # Serialize once; each peer only needs an HMAC under its own secret.
+    body = _canonical(allele_data) if any(p.secret for p in peers) else None
+    async with _async_client() as client:
+        return list(await asyncio.gather(
+            *(_apush(client, peer, allele_data, body) for peer in peers)))
+
+
+async def apull_from_peers(
+    peers: list[PeerConfig], locus: str,
+) -> list[list[dict]]:
+    """Pull alleles for a locus from every peer concurrently, in peer order."""
+    async with _async_client() as client:
+        return list(await asyncio.gather(
+            *(_apull(client, peer, locus) for peer in peers)))
+
+
+def push_to_peers(peers: list[PeerConfig], allele_data: dict) -> list[bool]:
+    """Synchronous wrapper around apush_to_peers."""
+    return asyncio.run(apush_to_peers(peers, allele_data))
+
+
+def pull_from_peers(peers: list[PeerConfig], locus: str) -> list[list[dict]]:
+    """Synchronous wrapper around apull_from_peers."""
+    return asyncio.run(apull_from_peers(peers, locus))
@@ -42,6 +42,20 @@ def atomic_write_bytes(path: Path, content: bytes) -> None:
     os.replace(str(tmp), str(path))
 
 
+def file_signature(path: Path) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) of path, or None if it cannot be stat'ed.
+
+    Compared before and after to tell whether another writer changed a
+    state file.  A same-size rewrite within the filesystem's mtime
+    granularity is not detected.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
 @contextmanager
 def file_lock(path: Path, timeout: float = 10.0) -> Generator[None, None, None]:
     """Acquire an exclusive lock on *path* for the duration of the block.
@@ -92,32 +92,6 @@ def _structure_discount(
     return OLD_STRUCTURE_BASE ** max(len(structure_history), 1)
 
 
-def _score_for_timescale(
-    records: list[FitnessRecord],
-    timescale: str,
-    current_structure_hash: str = "",
-    structure_history: tuple[str, ...] | list[str] = (),
-) -> float | None:
-    """Compute score for a single timescale. Returns None if no records.
-
-    When *current_structure_hash* is provided, records from a different
-    structure are discounted progressively using *structure_history*.
-    """
-    relevant = [r for r in records if r.timescale == timescale]
-    if not relevant:
-        return None
-    weighted_successes = 0.0
-    total_weight = 0.0
-    for r in relevant:
-        w = _structure_discount(
-            r.structure_hash, current_structure_hash, structure_history,
-        )
-        total_weight += w
-        if r.success:
-            weighted_successes += w
-    return weighted_successes / total_weight if total_weight > 0 else 0.0
-
-
 def compute_temporal_fitness(
     allele: AlleleMetadata,
     current_structure_hash: str = "",
@@ -139,38 +113,50 @@ def compute_temporal_fitness(
     res_w = params.resilience_weight if params else RESILIENCE_WEIGHT
     decay_f = params.convergence_decay_factor if params else CONVERGENCE_DECAY_FACTOR
 
-    records = [FitnessRecord.from_dict(r) for r in allele.fitness_records]
-
     # Immediate score from invocation counts (existing mechanism)
     total = allele.total_invocations
     if total == 0:
         return 0.0
     immediate = allele.successful_invocations / max(total, 10)
 
-    # Convergence and resilience from diagnostic feedback
-    convergence = _score_for_timescale(
-        records, "convergence", current_structure_hash, structure_history,
-    )
-    resilience = _score_for_timescale(
-        records, "resilience", current_structure_hash, structure_history,
-    )
+    # Per timescale: [total weight, weighted successes, record count,
+    # success count].
+    conv = [0.0, 0.0, 0, 0]
+    res = [0.0, 0.0, 0, 0]
+    discounts: dict[str, float] = {}
+    for r in allele.fitness_records:
+        timescale = r["timescale"]
+        if timescale == "convergence":
+            acc = conv
+        elif timescale == "resilience":
+            acc = res
+        else:
+            continue
+        h = r.get("structure_hash", "")
+        w = discounts.get(h)
+        if w is None:
+            w = discounts[h] = _structure_discount(
+                h, current_structure_hash, structure_history,
+            )
+        acc[0] += w
+        acc[2] += 1
+        if r["success"]:
+            acc[1] += w
+            acc[3] += 1
 
     # If no diagnostic feedback, return simple fitness (backward compat)
-    if convergence is None and resilience is None:
+    if not conv[2] and not res[2]:
         return immediate
 
     # Retroactive decay: convergence failures reduce immediate
-    convergence_failures = sum(
-        1 for r in records
-        if r.timescale == "convergence" and not r.success
-    )
+    convergence_failures = conv[2] - conv[3]
     if convergence_failures > 0:
         decay = max(0.0, 1.0 - decay_f * convergence_failures)
         immediate *= decay
 
     # Default to 1.0 (assume good) for timescales with no data
-    conv_score = convergence if convergence is not None else 1.0
-    res_score = resilience if resilience is not None else 1.0
+    conv_score = (conv[1] / conv[0] if conv[0] > 0 else 0.0) if conv[2] else 1.0
+    res_score = (res[1] / res[0] if res[0] > 0 else 0.0) if res[2] else 1.0
 
     return (
         immediate * imm_w
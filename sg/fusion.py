@@ -8,10 +8,15 @@ from __future__ import annotations
 
 import hashlib
 import json
-from dataclasses import dataclass, field, asdict
+import logging
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import Sequence
 
-from sg.filelock import atomic_write_text, file_lock, file_lock_shared
+from sg.filelock import file_lock, file_lock_shared
+from sg.jsonio import read_json, write_json
 from sg.kernel.base import Kernel
 from sg.loader import load_gene, call_gene
 from sg.log import get_logger
@@ -25,20 +30,41 @@ logger = get_logger("fusion")
 FUSION_THRESHOLD = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class PathwayTrack:
     composition_fingerprint: str | None = None
-    constituent_alleles: list[str] = field(default_factory=list)
+    # An empty tuple until record_success assigns the first composition, so
+    # new tracks don't allocate a list that is replaced straight away.
+    constituent_alleles: Sequence[str] = ()
     reinforcement_count: int = 0
     total_successes: int = 0
     total_failures: int = 0
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Explicit fields instead of asdict(), which deep-copies the allele
+        # list on every save only for it to be serialized straight away.
+        return {
+            "composition_fingerprint": self.composition_fingerprint,
+            "constituent_alleles": self.constituent_alleles,
+            "reinforcement_count": self.reinforcement_count,
+            "total_successes": self.total_successes,
+            "total_failures": self.total_failures,
+        }
 
     @classmethod
     def from_dict(cls, d: dict) -> PathwayTrack:
-        return cls(**{k: v for k, v in d.items() if k in cls.__dataclass_fields__})
+        # Positional, in field order: measurably cheaper than keywords when
+        # a large tracker file is loaded.  Pathways share most of their
+        # alleles, so the SHAs are interned rather than kept once per track.
+        get = d.get
+        alleles = get("constituent_alleles", ())
+        return cls(
+            get("composition_fingerprint"),
+            [sys.intern(sha) for sha in alleles] if alleles else alleles,
+            get("reinforcement_count", 0),
+            get("total_successes", 0),
+            get("total_failures", 0),
+        )
 
 
 class FusionTracker:
@@ -52,17 +78,22 @@ class FusionTracker:
 
         Returns the composition fingerprint if fusion threshold is met.
         """
-        fingerprint = composition_fingerprint(allele_shas)
         track = self.tracks.get(pathway)
 
         if track is None:
             track = PathwayTrack()
             self.tracks[pathway] = track
 
-        if track.composition_fingerprint != fingerprint:
-            track.composition_fingerprint = fingerprint
-            track.constituent_alleles = list(allele_shas)
-            track.reinforcement_count = 0
+        # During a reinforcement streak the composition is unchanged, and the
+        # stored fingerprint was computed from exactly these alleles, so the
+        # common case is just the counter updates below.
+        fingerprint = track.composition_fingerprint
+        if fingerprint is None or track.constituent_alleles != allele_shas:
+            fingerprint = composition_fingerprint(allele_shas)
+            if track.composition_fingerprint != fingerprint:
+                track.composition_fingerprint = fingerprint
+                track.constituent_alleles = [sys.intern(sha) for sha in allele_shas]
+                track.reinforcement_count = 0
 
         track.reinforcement_count += 1
         track.total_successes += 1
@@ -83,13 +114,13 @@ class FusionTracker:
     def save(self, path: Path) -> None:
         data = {name: track.to_dict() for name, track in self.tracks.items()}
         with file_lock(path):
-            atomic_write_text(path, json.dumps(data, indent=2))
+            write_json(path, data)
 
     def load(self, path: Path) -> None:
         if path.exists():
             try:
                 with file_lock_shared(path):
-                    data = json.loads(path.read_text())
+                    data = read_json(path)
             except json.JSONDecodeError:
                 logger.warning("fusion tracker corrupted at %s, starting fresh", path)
                 return
@@ -106,9 +137,23 @@ class FusionTracker:
 
 
 def composition_fingerprint(allele_shas: list[str]) -> str:
-    """SHA-256 of the ordered allele list, used as fusion identity."""
-    combined = ":".join(allele_shas)
-    return hashlib.sha256(combined.encode()).hexdigest()
+    """SHA-256 of the ordered allele list, used as fusion identity.
+
+    The value is persisted (fusion_tracker.json, phenotype.toml and the
+    structure_hash of fitness records), so the hash and its ":"-joined
+    input must not change or existing reinforcement and fitness history
+    would stop matching.
+
+    Memoized: the same composition is fingerprinted by record_success, the
+    pathway executor (as its structure hash) and fuse_pathway.
+    """
+    return _fingerprint(tuple(allele_shas))
+
+
+@lru_cache(maxsize=4096)
+def _fingerprint(allele_shas: tuple[str, ...]) -> str:
+    return hashlib.sha256(
+        ":".join(allele_shas).encode(), usedforsecurity=False).hexdigest()
 
 
 def fuse_pathway(
@@ -121,15 +166,22 @@ def fuse_pathway(
 ) -> str | None:
     """Generate and register a fused gene for a pathway.
 
-    Returns the SHA of the fused gene, or None on failure.
+    Returns the SHA of the fused gene, or None on failure.  A pathway that
+    is already fused for this exact composition keeps its fused gene, so
+    re-crossing the threshold doesn't ask the engine for a new one.
     """
-    sources = []
-    for sha in allele_shas:
-        source = registry.load_source(sha)
+    fingerprint = composition_fingerprint(allele_shas)
+    existing = phenotype.get_fused(pathway_name)
+    if (existing is not None and existing.fused_sha
+            and existing.composition_fingerprint == fingerprint
+            and registry.get(existing.fused_sha) is not None):
+        return existing.fused_sha
+
+    sources = registry.load_sources(allele_shas)
+    for sha, source in zip(allele_shas, sources):
         if source is None:
             logger.warning("cannot load source for %s", sha[:12])
             return None
-        sources.append(source)
 
     try:
         fused_source = mutation_engine.generate_fused(pathway_name, sources, loci)
@@ -138,7 +190,6 @@ def fuse_pathway(
         return None
 
     fused_sha = registry.register(fused_source, loci[0])
-    fingerprint = composition_fingerprint(allele_shas)
     phenotype.set_fused(pathway_name, fused_sha, fingerprint)
 
     logger.info("pathway '%s' fused -> %s", pathway_name, fused_sha[:12],
@@ -171,10 +222,14 @@ def try_fused_execution(
         return None
 
     try:
+        # load_gene reuses the compiled code for an unchanged source; each
+        # call still gets a fresh namespace bound to this kernel.
         execute_fn = load_gene(source, kernel)
         result = call_gene(execute_fn, input_json)
-        logger.info("fused execution succeeded for '%s'", pathway_name,
-                     extra={"pathway": pathway_name})
+        # Runs on every fused call; skip building the extra dict when muted.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("fused execution succeeded for '%s'", pathway_name,
+                        extra={"pathway": pathway_name})
         return result
     except Exception as e:
         logger.warning("fused execution failed: %s", e,
@@ -0,0 +1,70 @@
+"""JSON encoding/decoding for state files and payloads — orjson when installed.
+
+orjson parses straight from bytes, skipping the UTF-8 decode that
+``json.loads(path.read_text())`` performs first, and is several times
+faster on the larger state files (registry index, fitness trackers).
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from sg.filelock import atomic_write_bytes
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: str | bytes):
+    """Parse JSON with orjson when installed, else the stdlib parser.
+
+    orjson is stricter (no NaN/Infinity, 64-bit integers only), so inputs
+    it rejects are retried with json.loads to keep the stdlib's semantics,
+    including raising json.JSONDecodeError for malformed input.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def dumps(obj) -> bytes:
+    """Serialize obj as compact JSON bytes, with orjson when installed.
+
+    Non-string keys are converted to strings as json.dumps does; values
+    orjson refuses (integers beyond 64 bits) fall back to json.dumps.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj).encode()
+
+
+def read_json(path: Path):
+    """Read and parse a JSON file as bytes."""
+    return loads(path.read_bytes())
+
+
+def dumps_indented(obj) -> bytes:
+    """Serialize obj as 2-space indented JSON, the layout of the state files.
+
+    Falls back to json.dumps for values orjson refuses (integers beyond 64
+    bits, non-string keys).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, indent=2).encode()
+
+
+def write_json(path: Path, obj) -> None:
+    """Atomically write obj to path as indented JSON (temp file + rename)."""
+    atomic_write_bytes(path, dumps_indented(obj))
@@ -2,13 +2,13 @@
 from sg.kernel.base import Kernel, UndoSpec, mutating
 from sg.kernel.stub import StubKernel
 from sg.kernel.discovery import (
-    discover_kernels, load_kernel, load_kernel_class,
+    discover_kernels, load_kernel, load_kernel_class, resolve_kernel_entry,
     list_kernel_names, KernelNotFoundError, KernelLoadError,
 )
 
 __all__ = [
     "Kernel", "UndoSpec", "mutating",
     "StubKernel",
-    "discover_kernels", "load_kernel", "load_kernel_class",
+    "discover_kernels", "load_kernel", "load_kernel_class", "resolve_kernel_entry",
     "list_kernel_names", "KernelNotFoundError", "KernelLoadError",
 ]
@@ -8,12 +8,14 @@ Usage::
 
     from sg.kernel.discovery import discover_kernels, load_kernel
 
-    available = discover_kernels()   # {"stub": <EntryPoint>, ...}
-    kernel = load_kernel("stub")     # StubKernel instance
+    available = discover_kernels()     # {"stub": <EntryPoint>, ...}
+    ep = resolve_kernel_entry("stub")  # EntryPoint, nothing imported yet
+    kernel = load_kernel("stub")       # StubKernel instance
 """
 from __future__ import annotations
 
 import importlib.metadata
+from functools import cache
 from typing import Dict, List, Type
 
 from sg.kernel.base import Kernel
@@ -34,12 +36,20 @@ def _get_entry_points(group: str):
     return importlib.metadata.entry_points(group=group)
 
 
+@cache
+def _kernel_entry_points() -> Dict[str, importlib.metadata.EntryPoint]:
+    """Index the ``sg.kernels`` entry points by name.
+
+    Scanning installed distributions' metadata is slow and its result only
+    changes when packages are (un)installed, so it is done once per process.
+    Call ``_kernel_entry_points.cache_clear()`` to rescan.
+    """
+    return {ep.name: ep for ep in _get_entry_points(_ENTRY_POINT_GROUP)}
+
+
 def discover_kernels() -> Dict[str, importlib.metadata.EntryPoint]:
     """Return a mapping of kernel name -> EntryPoint for all registered kernels."""
-    result: Dict[str, importlib.metadata.EntryPoint] = {}
-    for ep in _get_entry_points(_ENTRY_POINT_GROUP):
-        result[ep.name] = ep
-    return result
+    return dict(_kernel_entry_points())
 
 
 def list_kernel_names() -> List[str]:
@@ -47,21 +57,34 @@ def list_kernel_names() -> List[str]:
     return sorted(discover_kernels().keys())
 
 
-def load_kernel_class(name: str) -> Type[Kernel]:
-    """Load and return the kernel class for the given name.
+def resolve_kernel_entry(name: str) -> importlib.metadata.EntryPoint:
+    """Return the entry point registered for *name* without importing it.
 
     Raises:
         KernelNotFoundError: If no kernel is registered with that name.
-        KernelLoadError: If the entry point fails to load.
     """
-    kernels = discover_kernels()
+    kernels = _kernel_entry_points()
     if name not in kernels:
         available = ", ".join(sorted(kernels.keys())) or "(none)"
         raise KernelNotFoundError(
             f"unknown kernel '{name}'. Available: {available}"
         )
+    return kernels[name]
+
 
-    ep = kernels[name]
+@cache
+def load_kernel_class(name: str) -> Type[Kernel]:
+    """Load and return the kernel class for the given name.
+
+    Successful lookups are memoized; ``load_kernel_class.cache_clear()``
+    forgets them (together with ``_kernel_entry_points.cache_clear()`` after
+    installing a new kernel package in-process).
+
+    Raises:
+        KernelNotFoundError: If no kernel is registered with that name.
+        KernelLoadError: If the entry point fails to load.
+    """
+    ep = resolve_kernel_entry(name)
     try:
         cls = ep.load()
     except Exception as e:
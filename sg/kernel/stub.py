@@ -12,20 +12,16 @@ class StubKernel(Kernel):
     """Minimal kernel with no-op resource tracking and no domain operations."""
 
     def __init__(self) -> None:
-        self._tracked: list[tuple[str, str]] = []
+        self._tracked: dict[tuple[str, str], None] = {}
 
     def reset(self) -> None:
         self._tracked.clear()
 
     def track_resource(self, resource_type: str, name: str) -> None:
-        pair = (resource_type, name)
-        if pair not in self._tracked:
-            self._tracked.append(pair)
+        self._tracked[(resource_type, name)] = None
 
     def untrack_resource(self, resource_type: str, name: str) -> None:
-        pair = (resource_type, name)
-        if pair in self._tracked:
-            self._tracked.remove(pair)
+        self._tracked.pop((resource_type, name), None)
 
     def tracked_resources(self) -> list[tuple[str, str]]:
         return list(self._tracked)
@@ -5,6 +5,8 @@ Loading is exec() into a sandboxed namespace with the kernel injected as `gene_s
 """
 from __future__ import annotations
 
+from functools import lru_cache
+from types import CodeType
 from typing import Callable
 
 from sg.kernel.base import Kernel
@@ -19,7 +21,7 @@ def load_gene(source: str, kernel: Kernel) -> Callable[[str], str]:
     (exec, eval, open) are blocked and imports are restricted.
     """
     namespace = make_sandbox_globals(kernel)
-    exec(source, namespace)
+    exec(_compile_gene(source), namespace)
 
     execute_fn = namespace.get("execute")
     if execute_fn is None:
@@ -30,6 +32,16 @@ def load_gene(source: str, kernel: Kernel) -> Callable[[str], str]:
     return execute_fn
 
 
+@lru_cache(maxsize=256)
+def _compile_gene(source: str) -> CodeType:
+    """Compile gene source once; the code object is kernel-independent.
+
+    The same source is loaded repeatedly (fused genes, shadow then real
+    kernel, rollbacks), and each load only needs a fresh namespace.
+    """
+    return compile(source, "<string>", "exec")
+
+
 def call_gene(
     execute_fn: Callable[[str], str],
     input_json: str,
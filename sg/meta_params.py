@@ -12,10 +12,11 @@ from __future__ import annotations
 
 import json
 import time
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, replace
 from pathlib import Path
 
 from sg.filelock import atomic_write_text, file_lock, file_lock_shared
+from sg.jsonio import read_json
 from sg.log import get_logger
 
 logger = get_logger("meta_params")
@@ -137,11 +138,14 @@ class MetaParamTracker:
 
     def get_params(self, entity_name: str) -> EvolutionaryParams:
         """Return effective params for an entity (defaults + overrides)."""
-        if entity_name not in self.overrides:
+        overrides = self.overrides.get(entity_name)
+        if overrides is None:
             return self.defaults
-        params_dict = self.defaults.to_dict()
-        params_dict.update(self.overrides[entity_name])
-        return EvolutionaryParams.from_dict(params_dict)
+        # dataclasses.replace copies the defaults field by field instead of
+        # round-tripping them through asdict() for every lookup.
+        known = EvolutionaryParams.__dataclass_fields__
+        return replace(self.defaults, **{
+            k: v for k, v in overrides.items() if k in known})
 
     def record_snapshot(
         self,
@@ -222,7 +226,7 @@ class MetaParamTracker:
             return
         try:
             with file_lock_shared(path):
-                data = json.loads(path.read_text())
+                data = read_json(path)
         except json.JSONDecodeError:
             logger.warning("meta params data corrupted at %s, starting fresh", path)
             return
@@ -16,6 +16,14 @@ from sg.log import get_logger
 
 logger = get_logger("mutation")
 
+# Patterns for picking apart LLM responses, compiled once at import.
+_PY_BLOCK = re.compile(r"```python\s*\n(.*?)```", re.DOTALL)
+_ANY_BLOCK = re.compile(r"```\s*\n(.*?)```", re.DOTALL)
+_VARIANT_SEPARATOR = re.compile(r"---VARIANT---")
+_SECTION_MARKER = re.compile(r"===(\w+)===")
+_JSON_FENCE_OPEN = re.compile(r"^```(?:json)?\s*\n?")
+_FENCE_CLOSE = re.compile(r"\n?```$")
+
 if TYPE_CHECKING:
     from sg.contracts import ContractStore
     from sg.mutation_cache import MutationCache
@@ -228,11 +236,9 @@ class LLMMutationEngine(MutationEngine):
         return ctx
 
     def _extract_python(self, text: str) -> str:
-        match = re.search(r"```python\s*\n(.*?)```", text, re.DOTALL)
-        if match:
+        if match := _PY_BLOCK.search(text):
             return match.group(1).strip()
-        match = re.search(r"```\s*\n(.*?)```", text, re.DOTALL)
-        if match:
+        if match := _ANY_BLOCK.search(text):
             return match.group(1).strip()
         return text.strip()
 
@@ -380,7 +386,7 @@ Return ONLY Python source code in ```python``` blocks, separated by ---VARIANT--
         text = self._call_api(prompt)
 
         variants = []
-        for chunk in re.split(r"---VARIANT---", text):
+        for chunk in _VARIANT_SEPARATOR.split(text):
             chunk = chunk.strip()
             if not chunk:
                 continue
@@ -435,7 +441,7 @@ Return ONLY Python source code in ```python``` blocks, separated by ---VARIANT--
 
         # Split on variant separator
         variants = []
-        for chunk in re.split(r"---VARIANT---", text):
+        for chunk in _VARIANT_SEPARATOR.split(text):
             chunk = chunk.strip()
             if not chunk:
                 continue
@@ -561,7 +567,7 @@ Each sub-gene must define `execute(input_json: str) -> str` and use `gene_sdk`."
         text = self._call_api(prompt)
 
         # Parse structured response
-        parts = re.split(r"===(\w+)===", text)
+        parts = _SECTION_MARKER.split(text)
         pathway_source = None
         sub_contracts = []
         sub_seeds = []
@@ -647,8 +653,8 @@ Return ONLY the JSON object, no markdown fences."""
 
         text = self._call_api(prompt).strip()
         if text.startswith("```"):
-            text = re.sub(r"^```(?:json)?\s*\n?", "", text)
-            text = re.sub(r"\n?```$", "", text)
+            text = _JSON_FENCE_OPEN.sub("", text)
+            text = _FENCE_CLOSE.sub("", text)
         try:
             return _json.loads(text)
         except _json.JSONDecodeError:
@@ -40,7 +40,8 @@ class MutationCache:
                   parent_sha: str) -> str:
         """Compute a deterministic cache key from mutation inputs."""
         combined = f"{contract_text}|{error_message}|{parent_sha}"
-        return hashlib.sha256(combined.encode()).hexdigest()[:32]
+        return hashlib.sha256(
+            combined.encode(), usedforsecurity=False).hexdigest()[:32]
 
     def get(self, key: str) -> str | None:
         """Return the cached source code, or None on miss/expiry."""
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 
 
 class GeneFamily(str, Enum):
@@ -85,6 +86,24 @@ class GeneContract:
     feeds: list[FeedsDef] = field(default_factory=list)
     connects: list[ConnectsDef] = field(default_factory=list)
 
+    # Name indexes for compatibility checks; contracts are not modified
+    # after parsing, so these are computed once on first use.
+    @cached_property
+    def takes_by_name(self) -> dict[str, FieldDef]:
+        return {f.name: f for f in self.takes}
+
+    @cached_property
+    def gives_by_name(self) -> dict[str, FieldDef]:
+        return {f.name: f for f in self.gives}
+
+    @cached_property
+    def has_required_takes(self) -> bool:
+        return any(f.required and not f.optional for f in self.takes)
+
+    @cached_property
+    def has_required_gives(self) -> bool:
+        return any(f.required and not f.optional for f in self.gives)
+
 
 @dataclass
 class PathwayStep:
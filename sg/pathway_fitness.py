@@ -11,6 +11,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from sg.filelock import atomic_write_text, file_lock, file_lock_shared
+from sg.jsonio import read_json
 from sg.log import get_logger
 
 logger = get_logger("pathway_fitness")
@@ -276,7 +277,7 @@ class PathwayFitnessTracker:
         if path.exists():
             try:
                 with file_lock_shared(path):
-                    data = json.loads(path.read_text())
+                    data = read_json(path)
             except json.JSONDecodeError:
                 logger.warning("pathway fitness data corrupted at %s, starting fresh", path)
                 return
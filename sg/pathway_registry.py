@@ -14,6 +14,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from sg.filelock import atomic_write_text, file_lock, file_lock_shared
+from sg.jsonio import read_json
 from sg.log import get_logger
 
 logger = get_logger("pathway_registry")
@@ -250,7 +251,7 @@ class PathwayRegistry:
         if self.index_path.exists():
             try:
                 with file_lock_shared(self.index_path):
-                    data = json.loads(self.index_path.read_text())
+                    data = read_json(self.index_path)
                 self.alleles = {
                     sha: PathwayAllele.from_dict(a)
                     for sha, a in data.items()
@@ -55,6 +55,7 @@ class PhenotypeMap:
         self.pathway_fusions: dict[str, PathwayFusionConfig] = {}
         self.pathway_alleles: dict[str, PathwayAlleleConfig] = {}
         self.topology_alleles: dict[str, TopologyAlleleConfig] = {}
+        self._fused_count = 0  # pathways with a fused_sha set
 
     def ensure_locus(self, locus: str) -> LocusConfig:
         if locus not in self.loci:
@@ -111,14 +112,25 @@ class PhenotypeMap:
 
     # --- Fusion state ---
 
+    @property
+    def fused_count(self) -> int:
+        """Number of pathways currently fused, maintained on each write."""
+        return self._fused_count
+
+    def _is_fused(self, pathway: str) -> bool:
+        config = self.pathway_fusions.get(pathway)
+        return bool(config and config.fused_sha)
+
     def get_fused(self, pathway: str) -> PathwayFusionConfig | None:
         return self.pathway_fusions.get(pathway)
 
     def set_fused(self, pathway: str, sha: str, fingerprint: str) -> None:
+        self._fused_count -= self._is_fused(pathway)
         self.pathway_fusions[pathway] = PathwayFusionConfig(
             fused_sha=sha,
             composition_fingerprint=fingerprint,
         )
+        self._fused_count += bool(sha)
 
     def set_fused_fallback(self, pathway: str, sha: str) -> None:
         config = self.pathway_fusions.get(pathway)
@@ -126,6 +138,7 @@ class PhenotypeMap:
             config.fused_fallback = sha
 
     def clear_fused(self, pathway: str) -> None:
+        self._fused_count -= self._is_fused(pathway)
         self.pathway_fusions.pop(pathway, None)
 
     # --- Pathway alleles ---
@@ -264,6 +277,8 @@ class PhenotypeMap:
                 fused_fallback=entry.get("fused_fallback"),
                 composition_fingerprint=entry.get("composition_fingerprint"),
             )
+        pm._fused_count = sum(
+            1 for f in pm.pathway_fusions.values() if f.fused_sha)
         for key, entry in data.get("pathway_allele", {}).items():
             pm.pathway_alleles[key] = PathwayAlleleConfig(
                 dominant=entry.get("dominant"),
@@ -5,14 +5,17 @@ source files and a JSON index of metadata (fitness, invocations, lineage, state)
 """
 from __future__ import annotations
 
+import bisect
 import hashlib
 import json
+import sys
 import time
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 from pathlib import Path
 
 from sg.filelock import atomic_write_text, file_lock, file_lock_shared
+from sg.jsonio import read_json
 from sg.log import get_logger
 
 logger = get_logger("registry")
@@ -20,6 +23,20 @@ logger = get_logger("registry")
 MAX_ALLELES_PER_LOCUS = 50
 
 
+def _share_record_strings(records: list[dict]) -> list[dict]:
+    """Intern the string values of loaded fitness records.
+
+    Timescales, source loci and structure hashes repeat across nearly every
+    record of every allele, but json.loads allocates a fresh string for
+    each occurrence; sharing them roughly halves the records' footprint.
+    """
+    intern = sys.intern
+    return [
+        {k: intern(v) if type(v) is str else v for k, v in r.items()}
+        for r in records
+    ]
+
+
 class AlleleState(str, Enum):
     DOMINANT = "dominant"
     CANARY = "canary"
@@ -53,7 +70,10 @@ class AlleleMetadata:
 
     @classmethod
     def from_dict(cls, d: dict) -> AlleleMetadata:
-        return cls(**{k: v for k, v in d.items() if k in cls.__dataclass_fields__})
+        meta = cls(**{k: v for k, v in d.items() if k in cls.__dataclass_fields__})
+        if meta.fitness_records:
+            meta.fitness_records = _share_record_strings(meta.fitness_records)
+        return meta
 
 
 class Registry:
@@ -65,6 +85,14 @@ class Registry:
         self.index_path = root / "registry.json"
         self.alleles: dict[str, AlleleMetadata] = {}
         self._locus_index: dict[str, list[str]] = {}  # locus -> [sha, ...]
+        self._sorted_shas: list[str] | None = None  # for prefix lookup
+        # sha -> ancestors at distance 1, 2, 4, 8, ... (built lazily)
+        self._skip_index: dict[str, list[str]] | None = None
+
+    def _invalidate_indexes(self) -> None:
+        """Drop derived lookup indexes after the allele set changes."""
+        self._sorted_shas = None
+        self._skip_index = None
 
     def ensure_dirs(self) -> None:
         self.root.mkdir(parents=True, exist_ok=True)
@@ -83,6 +111,7 @@ class Registry:
                 generation=generation,
                 parent_sha=parent_sha,
             )
+            self._invalidate_indexes()
             # Update locus index
             self._locus_index.setdefault(locus, [])
             if sha not in self._locus_index[locus]:
@@ -106,27 +135,125 @@ class Registry:
                          if s in self.alleles else 0)
         shas.remove(victim)
         self.alleles.pop(victim, None)
+        self._invalidate_indexes()
 
     def get(self, sha: str) -> AlleleMetadata | None:
         return self.alleles.get(sha)
 
+    def resolve_prefix(self, prefix: str) -> str | None:
+        """Return the full SHA for an exact SHA or unique-enough prefix.
+
+        Uses a sorted key list and bisect instead of scanning every allele.
+        When several SHAs share the prefix, the lowest one is returned.
+        """
+        if prefix in self.alleles:
+            return prefix
+        if not prefix:
+            return None
+        keys = self._sorted_shas
+        if keys is None or len(keys) != len(self.alleles):
+            keys = self._sorted_shas = sorted(self.alleles)
+        i = bisect.bisect_left(keys, prefix)
+        if i < len(keys) and keys[i].startswith(prefix) and keys[i] in self.alleles:
+            return keys[i]
+        return None
+
+    def lineage(
+        self, sha: str, max_depth: int | None = None,
+    ) -> list[AlleleMetadata]:
+        """Return the ancestry chain for an allele (child → parent → ...).
+
+        Accepts a SHA prefix. Stops at the first unknown parent or cycle,
+        or once *max_depth* alleles have been collected.
+        """
+        chain: list[AlleleMetadata] = []
+        current = self.resolve_prefix(sha) or sha
+        seen: set[str] = set()
+        while current and current not in seen and (
+                max_depth is None or len(chain) < max_depth):
+            seen.add(current)
+            allele = self.alleles.get(current)
+            if allele is None:
+                break
+            chain.append(allele)
+            current = allele.parent_sha
+        return chain
+
+    def _skips(self, sha: str) -> list[str]:
+        """Return ancestors of sha at distances 1, 2, 4, ... (skip list).
+
+        Entries are filled in top-down along the parent chain, so each
+        allele's list is built from its already-indexed parent.
+        """
+        table = self._skip_index
+        if table is None:
+            table = self._skip_index = {}
+        pending: list[str] = []
+        seen: set[str] = set()
+        current = sha
+        while (current is not None and current not in table
+               and current in self.alleles and current not in seen):
+            seen.add(current)
+            pending.append(current)
+            current = self.alleles[current].parent_sha
+        for s in reversed(pending):
+            parent = self.alleles[s].parent_sha
+            skips: list[str] = []
+            if parent in self.alleles:
+                skips.append(parent)
+                while True:
+                    up = table.get(skips[-1])
+                    if up is None or len(up) < len(skips):
+                        break
+                    skips.append(up[len(skips) - 1])
+            table[s] = skips
+        return table.get(sha, [])
+
+    def ancestor_at(self, sha: str, depth: int) -> AlleleMetadata | None:
+        """Return the ancestor `depth` generations above sha, in O(log depth).
+
+        Accepts a SHA prefix. depth=0 returns the allele itself. Returns
+        None when the chain ends (or leaves the registry) before `depth`.
+        """
+        current = self.resolve_prefix(sha)
+        if current is None or depth < 0:
+            return None
+        while depth > 0:
+            skips = self._skips(current)
+            if not skips:
+                return None
+            i = min(depth.bit_length() - 1, len(skips) - 1)
+            current = skips[i]
+            depth -= 1 << i
+        return self.alleles.get(current)
+
     def source_path(self, sha: str) -> Path:
         return self.sources_dir / f"{sha}.py"
 
     def load_source(self, sha: str) -> str | None:
-        path = self.source_path(sha)
-        if path.exists():
-            return path.read_text()
-        return None
-
-    def alleles_for_locus(self, locus: str) -> list[AlleleMetadata]:
+        try:
+            return self.source_path(sha).read_text()
+        except FileNotFoundError:
+            return None
+
+    def load_sources(self, shas: list[str]) -> list[str | None]:
+        """Load several sources, in order; None for any that are missing."""
+        return [self.load_source(sha) for sha in shas]
+
+    def alleles_for_locus(
+        self, locus: str, sort: bool = True,
+    ) -> list[AlleleMetadata]:
         """Return alleles for a locus, sorted by fitness descending.
 
         Uses the locus index for O(k) lookup instead of O(n) scan.
+        Pass sort=False to get registration order and skip scoring when
+        the caller computes fitness itself.
         """
         from sg.arena import compute_fitness
         shas = self._locus_index.get(locus, [])
         matching = [self.alleles[s] for s in shas if s in self.alleles]
+        if not sort:
+            return matching
         matching.sort(key=lambda a: compute_fitness(a), reverse=True)
         return matching
 
@@ -137,6 +264,7 @@ class Registry:
 
     def _rebuild_locus_index(self) -> None:
         """Rebuild the locus index from current alleles dict."""
+        self._invalidate_indexes()
         self._locus_index.clear()
         for sha, meta in self.alleles.items():
             self._locus_index.setdefault(meta.locus, [])
@@ -147,7 +275,7 @@ class Registry:
         if self.index_path.exists():
             try:
                 with file_lock_shared(self.index_path):
-                    data = json.loads(self.index_path.read_text())
+                    data = read_json(self.index_path)
                 self.alleles = {
                     sha: AlleleMetadata.from_dict(meta)
                     for sha, meta in data.items()
@@ -190,6 +318,7 @@ class Registry:
         meta = self.alleles.pop(sha, None)
         if meta is None:
             return False
+        self._invalidate_indexes()
         shas = self._locus_index.get(meta.locus, [])
         if sha in shas:
             shas.remove(sha)
@@ -202,6 +331,7 @@ class Registry:
     def delete_locus(self, locus: str) -> int:
         """Remove all alleles for a locus. Returns count deleted."""
         shas = list(self._locus_index.pop(locus, []))
+        self._invalidate_indexes()
         count = 0
         for sha in shas:
             self.alleles.pop(sha, None)
@@ -216,6 +346,7 @@ class Registry:
         """Remove all alleles from all loci. Returns count deleted."""
         count = len(self.alleles)
         self.alleles.clear()
+        self._invalidate_indexes()
         self._locus_index.clear()
         if self.sources_dir.exists():
             for path in self.sources_dir.glob("*.py"):
@@ -11,6 +11,7 @@ from dataclasses import dataclass, field, asdict
 from pathlib import Path
 
 from sg.filelock import atomic_write_text, file_lock, file_lock_shared
+from sg.jsonio import read_json
 from sg.log import get_logger
 
 from sg.registry import AlleleMetadata
@@ -102,7 +103,7 @@ class RegressionDetector:
         if path.exists():
             try:
                 with file_lock_shared(path):
-                    data = json.loads(path.read_text())
+                    data = read_json(path)
             except json.JSONDecodeError:
                 logger.warning("regression history corrupted at %s, starting fresh", path)
                 return
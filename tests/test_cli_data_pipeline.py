@@ -141,3 +141,43 @@ class TestBootstrap:
                        "validate_schema", "clean_records", "transform_records"]:
             dom = phenotype.get_dominant(locus)
             assert dom is not None, f"no dominant for {locus}"
+
+
+class TestWatchReload:
+    def test_watch_reparses_phenotype_only_after_external_write(
+        self, cli_project, monkeypatch,
+    ):
+        import argparse
+        from types import SimpleNamespace
+        import sg.cli as cli
+
+        path = cli_project / "phenotype.toml"
+        orch = SimpleNamespace(
+            project_root=cli_project,
+            phenotype=PhenotypeMap(),
+            registry=Registry.open(cli_project / ".sg" / "registry"),
+            verify_scheduler=SimpleNamespace(wait=lambda: None),
+            run_pathway=lambda name, input_json: [],
+        )
+        orch.save_state = lambda: orch.phenotype.save(path)
+        monkeypatch.setattr(cli, "make_orchestrator", lambda args: orch)
+
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            if len(sleeps) == 2:
+                other = PhenotypeMap()
+                other.promote("check_nulls", "abc123")
+                other.save(path)
+
+        loads = []
+        real_load = PhenotypeMap.load
+        monkeypatch.setattr(cli.time, "sleep", fake_sleep)
+        monkeypatch.setattr(cli.PhenotypeMap, "load", staticmethod(
+            lambda p: loads.append(p) or real_load(p)))
+
+        cli.cmd_watch(argparse.Namespace(
+            pathway="pw", input="{}", interval=0, count=3))
+        assert loads == [path]
+        assert orch.phenotype.get_dominant("check_nulls") == "abc123"
@@ -130,6 +130,22 @@ class TestGenerateInputs:
         data = json.loads(inputs[0])
         assert "interface" in data
 
+    def test_generates_values_per_type(self):
+        """Each .sg type maps to a matching value; unknown types get strings."""
+        from sg.parser.types import GeneContract, FieldDef, GeneFamily, BlastRadius
+        contract = GeneContract(
+            name="typed", does="typed inputs",
+            takes=[
+                FieldDef(name="n", type="int"),
+                FieldDef(name="ratio", type="float"),
+                FieldDef(name="ids", type="int[]"),
+                FieldDef(name="cfg", type="object"),
+            ],
+            gives=[], family=GeneFamily.CONFIGURATION, risk=BlastRadius.LOW,
+        )
+        data = json.loads(generate_test_inputs(contract)[0])
+        assert data == {"n": 1, "ratio": 1.0, "ids": [1, 2], "cfg": "test-cfg"}
+
 
 class TestTypeMatches:
     def test_string(self):
@@ -173,6 +189,17 @@ class TestConformanceSuite:
         for r in results:
             assert isinstance(r, ConformanceResult)
 
+    def test_suite_preserves_locus_order(self, project):
+        """run_all returns results in known_loci() order."""
+        contract_store = ContractStore.open(project / "contracts")
+        registry = Registry.open(project / ".sg" / "registry")
+        phenotype = PhenotypeMap.load(project / "phenotype.toml")
+
+        results = ConformanceSuite().run_all(
+            contract_store, registry, phenotype, MockNetworkKernel())
+        loci = [r.locus for r in results]
+        assert loci == [l for l in contract_store.known_loci() if l in loci]
+
     def test_suite_specific_locus(self, project):
         """ConformanceSuite can test a specific locus."""
         contract_store = ContractStore.open(project / "contracts")
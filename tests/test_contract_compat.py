@@ -142,6 +142,19 @@ class TestContractsCompatible:
         assert contracts_compatible(a, b)
 
 
+    def test_field_indexes_built_once(self):
+        b = _make_gene("y", takes=[FieldDef(name="name", type="string")])
+        assert b.takes_by_name is b.takes_by_name
+        assert b.takes_by_name["name"].type == "string"
+        assert b.gives_by_name == {}
+
+    def test_no_required_fields_skips_index(self):
+        a = _make_gene("x", takes=[FieldDef(name="opt", type="string", optional=True)])
+        b = _make_gene("y", takes=[FieldDef(name="name", type="string")])
+        assert contracts_compatible(a, b)
+        assert "takes_by_name" not in b.__dict__
+
+
 class TestDomainValidation:
     def test_load_file_warns_domain_mismatch(self, tmp_path, caplog):
         """Loading a contract with wrong domain logs a warning."""
@@ -99,3 +99,170 @@ def test_validate_output_not_dict():
 
 def test_validate_output_success_not_bool():
     assert not validate_output("bridge_create", json.dumps({"success": "yes"}))
+
+
+def test_validate_output_success_key_in_value_only():
+    assert not validate_output("bridge_create", json.dumps({"msg": "success", "ok": True}))
+
+
+@pytest.mark.parametrize("output", [
+    '{"success": false}', b'{"success": false}', b'{"ok": true}', '{"ok": true}',
+])
+def test_validate_output_prefilter_skips_parse(monkeypatch, output):
+    import sg.contracts as contracts_mod
+
+    def _fail(data):
+        raise AssertionError("pre-filter did not reject")
+
+    monkeypatch.setattr(contracts_mod, "_loads", _fail)
+    assert not validate_output("bridge_create", output)
+
+
+def test_validate_output_bytes():
+    assert validate_output("bridge_create", b'{"success": true}')
+    assert not validate_output("bridge_create", b'{"success": false}')
+
+
+def test_validate_output_enforces_gives_schema(store):
+    ok = json.dumps({"success": True, "resources_created": ["br0"]})
+    assert validate_output("bridge_create", ok, store)
+    missing = json.dumps({"success": True})
+    assert not validate_output("bridge_create", missing, store)
+    wrong_type = json.dumps({"success": True, "resources_created": "br0"})
+    assert not validate_output("bridge_create", wrong_type, store)
+
+
+def test_contract_info_has_compiled_output_validator(store):
+    info = store.contract_info("bridge_create")
+    assert info.output_validator({"resources_created": [], "error": None})
+
+
+_GENE_SRC = """\
+gene probe_gene
+  is diagnostic
+  risk none
+
+  does:
+    Probe something.
+"""
+
+
+def test_load_directory_reuses_parsed_unchanged_files(tmp_path, monkeypatch):
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "probe.sg").write_text(_GENE_SRC)
+    first = ContractStore.open(tmp_path)
+
+    import sg.contracts as contracts_mod
+
+    def _fail(source):
+        raise AssertionError("unchanged file was re-parsed")
+
+    monkeypatch.setattr(contracts_mod, "parse_sg", _fail)
+    second = ContractStore.open(tmp_path)
+    assert second.known_loci() == ["probe_gene"]
+    # Parsed once: each store gets its own copy over the same field lists.
+    assert second.get_gene("probe_gene") is not first.get_gene("probe_gene")
+    assert second.get_gene("probe_gene").takes is first.get_gene("probe_gene").takes
+
+
+def test_load_directory_reparses_changed_file(tmp_path):
+    sg_file = tmp_path / "probe.sg"
+    sg_file.write_text(_GENE_SRC)
+    ContractStore.open(tmp_path)
+    sg_file.write_text(_GENE_SRC.replace("Probe something.", "Probe a different thing."))
+    store = ContractStore.open(tmp_path)
+    assert store.contract_info("probe_gene").description == "Probe a different thing."
+
+
+def test_load_directory_parallel_parse_keeps_sorted_order(tmp_path):
+    for i in reversed(range(12)):
+        (tmp_path / f"probe_{i:02d}.sg").write_text(
+            _GENE_SRC.replace("probe_gene", f"probe_{i:02d}"))
+    store = ContractStore.open(tmp_path)
+    assert store.known_loci() == [f"probe_{i:02d}" for i in range(12)]
+
+
+def test_compiled_validator_matches_field_rules():
+    from sg.contracts import _compile_fields_validator
+    from sg.parser.types import FieldDef
+    validate = _compile_fields_validator([
+        FieldDef(name="count", type="int"),
+        FieldDef(name="tags", type="string[]", optional=True),
+        FieldDef(name="it's", type="float"),
+        FieldDef(name="blob", type="custom", optional=True),
+    ])
+    assert validate({"count": 1, "it's": 2.0})
+    assert validate({"count": None, "it's": 1, "blob": {"any": 1}})
+    assert validate({"count": 1, "it's": 1, "tags": ["a"]})
+    assert not validate({"count": True, "it's": 1})
+    assert not validate({"count": 1})
+    assert not validate({"count": 1, "it's": 1, "tags": [1]})
+
+
+def test_validate_output_accepts_stdlib_only_json():
+    """Outputs the stdlib accepts (e.g. NaN) stay valid with orjson installed."""
+    assert validate_output("bridge_create", '{"success": true, "ratio": NaN}')
+
+
+def test_field_json_types_are_cached_and_copied():
+    from sg.contracts import _field_to_json_type, _fields_to_schema
+    from sg.parser.types import FieldDef
+    assert _field_to_json_type("string[]") is _field_to_json_type("string[]")
+    with pytest.raises(TypeError):
+        _field_to_json_type("int")["type"] = "string"
+    schema = _fields_to_schema([
+        FieldDef(name="ids", type="int[]", description="ids"),
+        FieldDef(name="more", type="int[]"),
+    ])
+    assert schema["properties"]["ids"] == {
+        "type": "array", "items": {"type": "integer"}, "description": "ids"}
+    assert schema["properties"]["more"] == {
+        "type": "array", "items": {"type": "integer"}}
+    assert type(schema["properties"]["more"]["items"]) is dict
+
+
+def test_parse_cache_is_bounded(tmp_path, monkeypatch):
+    import sg.contracts as contracts_mod
+    monkeypatch.setattr(contracts_mod, "_PARSE_CACHE", {})
+    monkeypatch.setattr(contracts_mod, "_PARSE_CACHE_MAX", 2)
+    for i in range(5):
+        (tmp_path / f"probe{i}.sg").write_text(
+            _GENE_SRC.replace("probe_gene", f"probe_gene{i}"))
+    store = ContractStore.open(tmp_path)
+    assert len(store.known_loci()) == 5
+    assert len(contracts_mod._PARSE_CACHE) <= 2
+
+
+def test_iter_views_match_known_lists(store):
+    assert list(store.iter_loci()) == store.known_loci()
+    assert list(store.iter_pathways()) == store.known_pathways()
+    assert list(store.iter_topologies()) == store.known_topologies()
+    assert "bridge_create" in store.iter_loci()
+
+
+def test_forgotten_path_is_reparsed(tmp_path, monkeypatch):
+    import os
+    import sg.contracts as contracts_mod
+    contracts = tmp_path / "contracts"
+    contracts.mkdir()
+    path = contracts / "probe.sg"
+    path.write_text(_GENE_SRC)
+    monkeypatch.setattr(contracts_mod, "_PARSE_CACHE", {})
+    ContractStore.open(contracts)
+
+    # Same-size rewrite with an unchanged mtime: only forget_parsed can tell.
+    st = path.stat()
+    path.write_text(_GENE_SRC.replace("something", "otherwise"))
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    contracts_mod.forget_parsed(path)
+    store = ContractStore.open(contracts)
+    assert store.contract_info("probe_gene").description == "Probe otherwise."
+
+
+def test_stores_do_not_share_contract_objects(tmp_path):
+    (tmp_path / "probe.sg").write_text(_GENE_SRC)
+    first = ContractStore.open(tmp_path)
+    second = ContractStore.open(tmp_path)
+    first.get_gene("probe_gene").verify_within = "0.01s"
+    assert second.get_gene("probe_gene").verify_within is None
+    assert first.contract_info("probe_gene").raw is first.get_gene("probe_gene")
@@ -66,6 +66,19 @@ class TestStatusEndpoint:
         assert data["allele_count"] > 0
 
 
+class TestStatusFusedCount:
+    def test_fused_count_ignores_pathways_without_contract(self, client, dashboard_project):
+        """fused_count only counts fused pathways the contract store knows."""
+        import sg.dashboard as dash
+        pheno = PhenotypeMap.load(dashboard_project / "phenotype.toml")
+        known = dash._load_state()[0].known_pathways()[0]
+        pheno.set_fused(known, "a" * 64, "fp")
+        pheno.set_fused("retired_pathway", "b" * 64, "fp")
+        pheno.save(dashboard_project / "phenotype.toml")
+        dash._invalidate_state()
+        assert client.get("/api/status").json()["fused_count"] == 1
+
+
 class TestLociEndpoint:
     def test_loci_list(self, client):
         """GET /api/loci returns list of loci."""
@@ -91,6 +104,8 @@ class TestLocusDetail:
         assert len(data["alleles"]) >= 1
         assert data["contract"] is not None
         assert "does" in data["contract"]
+        assert {"name": "bridge_name", "type": "string"} in data["contract"]["takes"]
+        assert data["contract"]["family"] == "configuration"
 
     def test_locus_allele_fields(self, client):
         """Alleles have all expected fields."""
@@ -136,6 +151,17 @@ class TestAlleleSource:
         resp = client.get(f"/api/allele/{sha[:12]}/source")
         assert resp.status_code == 200
 
+    def test_allele_source_plain_text(self, client, dashboard_project):
+        """Accept: text/plain returns the file contents unwrapped."""
+        registry = Registry.open(dashboard_project / ".sg" / "registry")
+        sha = list(registry.alleles.keys())[0]
+
+        resp = client.get(f"/api/allele/{sha[:12]}/source",
+                          headers={"Accept": "text/plain"})
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/plain")
+        assert resp.text == registry.load_source(sha)
+
     def test_allele_source_not_found(self, client):
         """GET /api/allele/{bad_sha}/source returns 404."""
         resp = client.get("/api/allele/nonexistent/source")
@@ -157,6 +183,34 @@ class TestLineageEndpoint:
         assert "generation" in data["lineage"][0]
         assert "fitness" in data["lineage"][0]
 
+    def test_lineage_depth_returns_single_ancestor(self, client, dashboard_project):
+        registry = Registry.open(dashboard_project / ".sg" / "registry")
+        parent = list(registry.alleles.keys())[0]
+        child = registry.register("def execute(x): return 'child'",
+                                  registry.get(parent).locus, parent_sha=parent)
+        registry.save_index()
+
+        data = client.get(f"/api/lineage/{child[:12]}?depth=1").json()
+        assert [e["sha_full"] for e in data["lineage"]] == [parent]
+        data = client.get(f"/api/lineage/{child[:12]}?depth=5").json()
+        assert data["lineage"] == []
+
+    def test_lineage_max_depth_truncates(self, client, dashboard_project):
+        registry = Registry.open(dashboard_project / ".sg" / "registry")
+        shas = [list(registry.alleles.keys())[0]]
+        locus = registry.get(shas[0]).locus
+        for gen in range(1, 5):
+            shas.append(registry.register(f"def execute(x): return {gen}", locus,
+                                          generation=gen, parent_sha=shas[-1]))
+        registry.save_index()
+
+        data = client.get(f"/api/lineage/{shas[-1]}?max_depth=2").json()
+        assert [e["sha_full"] for e in data["lineage"]] == shas[:-3:-1]
+        assert data["truncated"] is True
+        data = client.get(f"/api/lineage/{shas[-1]}").json()
+        assert len(data["lineage"]) == 5
+        assert data["truncated"] is False
+
 
 class TestRegressionEndpoint:
     def test_regression_empty(self, client):
@@ -167,6 +221,109 @@ class TestRegressionEndpoint:
         assert "history" in data
 
 
+class TestStateCache:
+    def test_state_reused_until_file_changes(self, client, dashboard_project):
+        """_load_state returns cached objects until their backing file changes."""
+        import sg.dashboard as dash
+        _, reg1, pheno1, *_ = dash._load_state()
+        _, reg2, pheno2, *_ = dash._load_state()
+        assert reg2 is reg1
+        assert pheno2 is pheno1
+
+        reg = Registry.open(dashboard_project / ".sg" / "registry")
+        reg.register("def execute(x): return x", "bridge_create")
+        reg.save_index()
+        _, reg3, pheno3, *_ = dash._load_state()
+        assert reg3 is not reg1
+        assert pheno3 is pheno1
+        assert len(reg3.alleles) == len(reg1.alleles) + 1
+
+    def test_unchanged_state_returns_same_tuple(self, client, dashboard_project):
+        import sg.dashboard as dash
+        first = dash._load_state()
+        assert dash._load_state() is first
+        dash._invalidate_state("phenotype")
+        second = dash._load_state()
+        assert second is not first
+        assert second[1] is first[1]
+
+    def test_status_summary_reused_until_state_changes(self, client, dashboard_project):
+        import sg.dashboard as dash
+        state = dash._load_state()
+        summary = dash._status_summary(state)
+        assert dash._status_summary(dash._load_state()) is summary
+        dash._invalidate_state("phenotype")
+        assert dash._status_summary(dash._load_state()) is not summary
+        assert client.get("/api/status").json() == summary
+
+    def test_polling_endpoints_answer_304_until_state_changes(
+            self, client, dashboard_project):
+        import sg.dashboard as dash
+        for url in ("/api/status", "/api/pathways", "/api/loci"):
+            first = client.get(url)
+            etag = first.headers["ETag"]
+            again = client.get(url, headers={"If-None-Match": etag})
+            assert again.status_code == 304
+            assert again.content == b""
+        dash._invalidate_state("phenotype")
+        changed = client.get("/api/loci", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+        assert changed.json() == first.json()
+
+    def test_fitness_memo_tracks_counters(self, client, dashboard_project):
+        import sg.dashboard as dash
+        _, reg, *_ = dash._load_state()
+        allele = next(iter(reg.alleles.values()))
+        before = dash._fitness(allele, None)
+        assert dash._fitness(allele, None) == before
+        allele.successful_invocations += 20
+        assert dash._fitness(allele, None) != before
+        pair = dash._fitness_pair(allele, None)
+        assert pair == (dash._fitness(allele, None), round(pair[0], 3))
+        assert dash._fitness_pair(allele, None) is pair
+
+    def test_contract_removal_reloads_store(self, client, dashboard_project):
+        import sg.dashboard as dash
+        before = dash._load_contracts()
+        path = before.file_path("bridge_stp")
+        path.unlink()
+        after = dash._load_contracts()
+        assert after is not before
+        assert "bridge_stp" not in after.known_loci()
+
+
+class TestEventFanOut:
+    def test_one_watcher_debounced_to_all_clients(self, dashboard_project, monkeypatch):
+        """Every subscriber gets the first change at once plus one trailing event."""
+        import asyncio
+        import sg.dashboard as dash
+
+        async def fake_changes(root):
+            for _ in range(3):
+                yield
+            await asyncio.sleep(3600)
+
+        monkeypatch.setattr(dash, "_state_changes", fake_changes)
+        monkeypatch.setattr(dash, "_SSE_DEBOUNCE", 0.05)
+
+        async def run():
+            queues = [asyncio.Queue(), asyncio.Queue()]
+            for q in queues:
+                dash._sse_subscribe(q)
+            watcher = dash._sse_watcher
+            await asyncio.sleep(0.2)
+            for q in queues:
+                dash._sse_unsubscribe(q)
+            await asyncio.sleep(0)
+            return [q.qsize() for q in queues], watcher
+
+        sizes, watcher = asyncio.run(run())
+        assert sizes == [2, 2]
+        assert watcher.cancelled()
+        assert dash._sse_watcher is None
+
+
 class TestDashboardHTML:
     def test_html_serves(self, client):
         """GET / returns HTML page."""
@@ -176,6 +333,22 @@ class TestDashboardHTML:
         assert "<script>" in resp.text
 
 
+class TestContractSave:
+    def test_same_size_rewrite_is_reparsed(self, client):
+        """A save that keeps size and mtime still serves the new parse."""
+        import os
+        client.get("/api/contract/bridge_create/raw")
+        import sg.dashboard as dash
+        path = dash._load_state()[0].file_path("bridge_create")
+        st = path.stat()
+        source = path.read_text().replace("Create a Linux", "Build a  Linux")
+        resp = client.put("/api/contract/bridge_create", json={"source": source})
+        assert resp.status_code == 200
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        parsed = client.get("/api/contract/bridge_create/raw").json()["parsed"]
+        assert parsed["does"].startswith("Build a  Linux")
+
+
 class TestFederationEndpoints:
     def test_receive_allele(self, client, dashboard_project):
         """POST /api/federation/receive registers an allele."""
@@ -189,6 +362,24 @@ class TestFederationEndpoints:
         assert data["status"] == "ok"
         assert "sha" in data
 
+    def test_failed_receive_leaves_cached_state_alone(self, client, monkeypatch):
+        """A receive whose save fails doesn't leak into the shared state."""
+        import sg.dashboard as dash
+        reg = dash._load_state()[1]
+        before = set(reg.alleles)
+
+        def fail(self):
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr(Registry, "save_index", fail)
+        with pytest.raises(RuntimeError):
+            client.post("/api/federation/receive", json={
+                "source": "def execute(i): return '{\"success\": false}'",
+                "locus": "bridge_create",
+            })
+        assert dash._load_state()[1] is reg
+        assert set(reg.alleles) == before
+
     def test_serve_alleles(self, client):
         """GET /api/federation/alleles/{locus} serves alleles."""
         resp = client.get("/api/federation/alleles/bridge_create")
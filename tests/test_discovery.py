@@ -13,6 +13,7 @@ from sg.kernel.discovery import (
     KernelNotFoundError,
     KernelLoadError,
     _get_entry_points,
+    _kernel_entry_points,
 )
 
 
@@ -59,6 +60,17 @@ class TestLoadKernel:
             load_kernel("nonexistent-kernel-xyz")
 
 
+class TestResolveKernelEntry:
+    def test_returns_unloaded_entry_point(self, monkeypatch):
+        from sg.kernel.discovery import resolve_kernel_entry
+        monkeypatch.setattr(importlib.metadata.EntryPoint, "load",
+                            lambda ep: pytest.fail("entry point loaded"))
+        ep = resolve_kernel_entry("data-mock")
+        assert ep.name == "data-mock"
+        with pytest.raises(KernelNotFoundError, match="stub"):
+            resolve_kernel_entry("nonexistent-kernel-xyz")
+
+
 class TestLoadKernelClass:
     def test_returns_class_not_instance(self):
         cls = load_kernel_class("stub")
@@ -122,3 +134,24 @@ class TestGetEntryPoints:
     def test_unknown_group_returns_empty(self):
         eps = _get_entry_points("sg.nonexistent.group.12345")
         assert len(list(eps)) == 0
+
+    def test_kernel_class_resolved_once(self, monkeypatch):
+        load_kernel_class.cache_clear()
+        assert load_kernel_class("stub") is StubKernel
+        monkeypatch.setattr(importlib.metadata.EntryPoint, "load",
+                            lambda ep: pytest.fail("entry point reloaded"))
+        assert isinstance(load_kernel("stub"), StubKernel)
+
+    def test_metadata_scanned_once(self, monkeypatch):
+        calls = []
+        real = importlib.metadata.entry_points
+        monkeypatch.setattr(importlib.metadata, "entry_points",
+                            lambda **kw: calls.append(kw) or real(**kw))
+        _kernel_entry_points.cache_clear()
+        try:
+            load_kernel("stub")
+            assert "stub" in discover_kernels()
+            assert "stub" in list_kernel_names()
+            assert len(calls) == 1
+        finally:
+            _kernel_entry_points.cache_clear()
@@ -157,6 +157,54 @@ class TestNetworkOps:
             assert "X-SG-Signature" in call_kwargs.kwargs.get("headers", {})
 
 
+    def test_httpx_imported_on_first_network_use(self, tmp_path, monkeypatch):
+        import sg.federation as fed
+        monkeypatch.delitem(fed.__dict__, "httpx", raising=False)
+        registry = Registry.open(tmp_path / ".sg" / "registry")
+        sha = registry.register("def execute(i): return '{}'", "bridge_create")
+        import_allele(registry, export_allele(registry, sha))
+        assert "httpx" not in fed.__dict__
+        pytest.importorskip("httpx")
+        assert fed.httpx is fed._httpx() is not None
+
+
+class TestBatchedTransfers:
+    @pytest.fixture
+    def mock_peers(self, monkeypatch):
+        """Route the pooled AsyncClient through an in-process transport."""
+        httpx = pytest.importorskip("httpx")
+        import sg.federation as fed
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            if request.url.host == "down":
+                raise httpx.ConnectError("refused")
+            if request.method == "POST":
+                return httpx.Response(200, json={"ok": True})
+            return httpx.Response(200, json={"alleles": [{"peer": request.url.host}]})
+
+        monkeypatch.setattr(fed, "_async_client", lambda: httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)))
+        return seen
+
+    def test_push_to_peers_reports_each_peer(self, mock_peers):
+        from sg.federation import push_to_peers
+        peers = [PeerConfig(url="http://a:8420", secret="s"),
+                 PeerConfig(url="http://down:8420"),
+                 PeerConfig(url="http://b:8420")]
+        assert push_to_peers(peers, {"source": "x", "locus": "l"}) == [True, False, True]
+        signed = [r for r in mock_peers if r.url.host == "a"]
+        assert "X-SG-Signature" in signed[0].headers
+
+    def test_pull_from_peers_keeps_peer_order(self, mock_peers):
+        from sg.federation import pull_from_peers
+        peers = [PeerConfig(url="http://b:8420"), PeerConfig(url="http://down:8420"),
+                 PeerConfig(url="http://a:8420")]
+        result = pull_from_peers(peers, "bridge_create")
+        assert result == [[{"peer": "b"}], [], [{"peer": "a"}]]
+
+
 class TestIntegrity:
     def test_source_sha_deterministic(self):
         """compute_source_sha is deterministic."""
@@ -177,6 +225,16 @@ class TestIntegrity:
         }
         assert verify_allele_integrity(data) is False
 
+    def test_verify_allele_integrity_ignores_matching_claims(self):
+        """Agreeing sha256/source_sha256 claims don't bypass hashing the source."""
+        claimed = compute_source_sha("def execute(i): return 'ok'")
+        data = {
+            "source": "def execute(i): return 'evil'",
+            "sha256": claimed,
+            "source_sha256": claimed,
+        }
+        assert verify_allele_integrity(data) is False
+
     def test_verify_allele_integrity_no_hash(self):
         """verify_allele_integrity passes when no hash provided (backwards compat)."""
         data = {"source": "anything"}
@@ -215,6 +273,15 @@ class TestSignature:
         payload["locus"] = "evil_locus"
         assert not verify_signature(payload, sig, "secret")
 
+    def test_signature_wire_format_is_stable(self):
+        """Signatures still match peers that hash json.dumps(sort_keys=True)."""
+        import hashlib
+        import hmac
+        payload = {"source": "x = 'é'", "locus": "l", "n": [1, 2.5]}
+        body = json.dumps(payload, sort_keys=True).encode()
+        expected = hmac.new(b"secret", body, hashlib.sha256).hexdigest()
+        assert sign_payload(payload, "secret") == expected
+
     def test_load_peers_with_secret(self, tmp_path):
         """Peers can have a secret field."""
         peers_json = tmp_path / "peers.json"
@@ -6,7 +6,7 @@ import time
 
 import pytest
 
-from sg.filelock import file_lock, FileLockTimeout
+from sg.filelock import atomic_write_text, file_lock, file_signature, FileLockTimeout
 
 
 class TestFileLock:
@@ -75,3 +75,14 @@ class TestFileLock:
         with file_lock(target):
             pass
         assert (tmp_path / "sub" / "deep" / "data.json.lock").exists()
+
+
+class TestFileSignature:
+    def test_changes_on_rewrite_and_none_when_missing(self, tmp_path):
+        target = tmp_path / "state.json"
+        assert file_signature(target) is None
+        atomic_write_text(target, "{}")
+        before = file_signature(target)
+        assert before == (target.stat().st_mtime_ns, 2)
+        atomic_write_text(target, '{"a": 1}')
+        assert file_signature(target) != before
@@ -116,6 +116,25 @@ class TestTemporalFitness:
         assert abs(IMMEDIATE_WEIGHT + CONVERGENCE_WEIGHT + RESILIENCE_WEIGHT - 1.0) < 0.001
 
 
+    def test_fitness_tracks_records_and_counters(self):
+        allele = _make_allele(successful=10, failed=0)
+        record_feedback(allele, "convergence", True, "check_connectivity")
+        first = compute_temporal_fitness(allele)
+        assert compute_temporal_fitness(allele) == first
+
+        record_feedback(allele, "convergence", False, "check_connectivity")
+        second = compute_temporal_fitness(allele)
+        assert second < first
+
+        allele.failed_invocations += 10
+        assert compute_temporal_fitness(allele) < second
+
+        # Records edited in place are picked up without any invalidation.
+        for r in allele.fitness_records:
+            r["success"] = True
+        assert compute_temporal_fitness(allele) > second
+
+
 # --- Arena integration ---
 
 class TestArenaIntegration:
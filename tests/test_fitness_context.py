@@ -15,8 +15,9 @@ from sg import arena
 from sg.contracts import ContractStore
 from sg.fitness import (
     FitnessRecord, record_feedback, compute_temporal_fitness,
-    _score_for_timescale, _structure_discount,
+    _structure_discount,
     OLD_STRUCTURE_WEIGHT, OLD_STRUCTURE_BASE,
+    CONVERGENCE_WEIGHT, RESILIENCE_WEIGHT,
 )
 from sg.fusion import FusionTracker
 from sg_network import MockNetworkKernel
@@ -33,6 +34,19 @@ GENES_DIR = sg_network.genes_path()
 FIXTURES_DIR = sg_network.fixtures_path()
 
 
+def _convergence_score(records, **kwargs) -> float:
+    """Convergence score of *records* as computed by compute_temporal_fitness.
+
+    The allele has no immediate successes and no resilience records, so
+    fitness = convergence * CONVERGENCE_WEIGHT + RESILIENCE_WEIGHT.
+    """
+    allele = AlleleMetadata(sha256="a", locus="test")
+    allele.failed_invocations = 10
+    allele.fitness_records = [r.to_dict() for r in records]
+    fitness = compute_temporal_fitness(allele, **kwargs)
+    return (fitness - RESILIENCE_WEIGHT) / CONVERGENCE_WEIGHT
+
+
 class TestFitnessRecordStructureHash:
     """FitnessRecord stores and round-trips structure_hash."""
 
@@ -82,7 +96,7 @@ class TestRecordFeedback:
 class TestStructureWeightedFitness:
     """compute_temporal_fitness weights old-structure records lower."""
 
-    def test_score_for_timescale_weights_old_structure_lower(self):
+    def test_convergence_score_weights_old_structure_lower(self):
         """Records with mismatched structure_hash get weight 0.5."""
         records = [
             FitnessRecord("convergence", True, "x", structure_hash="new"),
@@ -91,14 +105,14 @@ class TestStructureWeightedFitness:
             FitnessRecord("convergence", False, "x", structure_hash="old"),
         ]
         # Without structure weighting: 2/4 = 0.5
-        score_unweighted = _score_for_timescale(records, "convergence")
+        score_unweighted = _convergence_score(records)
         assert abs(score_unweighted - 0.5) < 0.01
 
         # With structure weighting: successes=2*1.0, failures=2*0.5
         # total_weight = 2 + 1 = 3, weighted_success = 2
         # score = 2/3 = 0.667
-        score_weighted = _score_for_timescale(
-            records, "convergence", current_structure_hash="new",
+        score_weighted = _convergence_score(
+            records, current_structure_hash="new",
         )
         assert score_weighted > score_unweighted
         assert abs(score_weighted - 2.0 / 3.0) < 0.01
@@ -251,15 +265,15 @@ class TestProgressiveDecay:
         assert _structure_discount("old", "", ["old"]) == 1.0
 
     def test_score_with_history(self):
-        """_score_for_timescale uses progressive decay with history."""
+        """Convergence scoring uses progressive decay with history."""
         records = [
             FitnessRecord("convergence", True, "x", structure_hash="current"),
             FitnessRecord("convergence", False, "x", structure_hash="old"),
         ]
         # With history: success weight=1.0, failure weight=0.7
         # score = 1.0 / (1.0 + 0.7) = 0.588
-        score = _score_for_timescale(
-            records, "convergence",
+        score = _convergence_score(
+            records,
             current_structure_hash="current",
             structure_history=["old"],
         )
@@ -15,6 +15,12 @@ def test_composition_fingerprint_order_matters():
     assert fp1 != fp2
 
 
+def test_composition_fingerprint_format_is_stable():
+    """Persisted fingerprints must keep matching across releases."""
+    import hashlib
+    assert composition_fingerprint(["aa", "bb"]) == hashlib.sha256(b"aa:bb").hexdigest()
+
+
 def test_reinforcement_counting():
     tracker = FusionTracker()
     alleles = ["sha1", "sha2"]
@@ -27,6 +33,22 @@ def test_reinforcement_counting():
     assert result == composition_fingerprint(alleles)
 
 
+def test_unchanged_composition_is_not_rehashed(monkeypatch):
+    import sg.fusion as fusion_mod
+    calls = []
+    real = fusion_mod.composition_fingerprint
+    monkeypatch.setattr(fusion_mod, "composition_fingerprint",
+                        lambda shas: calls.append(shas) or real(shas))
+    tracker = FusionTracker()
+    for _ in range(FUSION_THRESHOLD):
+        result = tracker.record_success("pathway1", ["sha1", "sha2"])
+    assert result == real(["sha1", "sha2"])
+    assert len(calls) == 1
+    tracker.record_success("pathway1", ["sha1", "sha3"])
+    assert len(calls) == 2
+    assert tracker.get_track("pathway1").reinforcement_count == 1
+
+
 def test_composition_change_resets_reinforcement():
     tracker = FusionTracker()
     for i in range(5):
@@ -63,3 +85,129 @@ def test_save_and_load(tmp_path):
     assert track is not None
     assert track.reinforcement_count == 5
     assert track.total_successes == 5
+
+
+def test_track_dict_round_trip_matches_fields():
+    from dataclasses import asdict
+    from sg.fusion import PathwayTrack
+    track = PathwayTrack("fp", ["a", "b"], 3, 7, 1)
+    assert track.to_dict() == asdict(track)
+    assert PathwayTrack.from_dict(track.to_dict()) == track
+    assert PathwayTrack.from_dict({"reinforcement_count": 2, "legacy": 1}) == \
+        PathwayTrack(reinforcement_count=2)
+
+
+def test_composition_fingerprint_is_memoized():
+    from sg.fusion import _fingerprint
+    _fingerprint.cache_clear()
+    fp = composition_fingerprint(["m1", "m2"])
+    assert composition_fingerprint(("m1", "m2")) == fp
+    assert _fingerprint.cache_info().hits == 1
+
+
+def test_fused_execution_reuses_compiled_code_only(tmp_path):
+    import sg.fusion as fusion_mod
+    from sg.kernel.stub import StubKernel
+    from sg.loader import _compile_gene
+    from sg.phenotype import PhenotypeMap
+    from sg.registry import Registry
+
+    registry = Registry.open(tmp_path / "registry")
+    sha = registry.register(
+        "calls = []\n"
+        "def execute(input_json):\n"
+        "    calls.append(input_json)\n"
+        "    return '{\"calls\": %d}' % len(calls)\n",
+        "fused_probe")
+    pheno = PhenotypeMap()
+    tracker = FusionTracker()
+
+    def run():
+        return fusion_mod.try_fused_execution(
+            "pw", "{}", registry, pheno, tracker, StubKernel())
+
+    pheno.set_fused("pw", sha, "fp")
+    _compile_gene.cache_clear()
+    assert run() == '{"calls": 1}'
+    # Module-level gene state does not carry over between calls.
+    assert run() == '{"calls": 1}'
+    assert _compile_gene.cache_info().hits == 1
+
+    # A fused source that disappeared is noticed on the next call.
+    registry.source_path(sha).unlink()
+    assert run() is None
+    assert pheno.get_fused("pw") is None
+
+
+def test_fused_execution_logs_success_only_when_enabled(tmp_path, caplog):
+    import logging
+    from sg.fusion import try_fused_execution
+    from sg.kernel.stub import StubKernel
+    from sg.phenotype import PhenotypeMap
+    from sg.registry import Registry
+
+    registry = Registry.open(tmp_path / "registry")
+    sha = registry.register(
+        "def execute(input_json):\n    return '{\"success\": true}'\n", "fused_log")
+    pheno = PhenotypeMap()
+    pheno.set_fused("pw_log", sha, "fp")
+
+    def run():
+        return try_fused_execution(
+            "pw_log", "{}", registry, pheno, FusionTracker(), StubKernel())
+
+    with caplog.at_level(logging.WARNING, logger="sg.fusion"):
+        run()
+    assert "fused execution succeeded" not in caplog.text
+    with caplog.at_level(logging.INFO, logger="sg.fusion"):
+        run()
+    assert "fused execution succeeded for 'pw_log'" in caplog.text
+
+
+def test_track_is_slotted_and_starts_without_alleles():
+    from sg.fusion import PathwayTrack
+    track = PathwayTrack()
+    assert not hasattr(track, "__dict__")
+    assert track.constituent_alleles == ()
+    ft = FusionTracker()
+    ft.record_success("pw", ["a", "b"])
+    assert ft.get_track("pw").constituent_alleles == ["a", "b"]
+
+
+def test_loaded_tracks_share_allele_strings(tmp_path):
+    path = tmp_path / "fusion_tracker.json"
+    ft = FusionTracker()
+    ft.record_success("pw1", ["a" * 64, "b" * 64])
+    ft.record_success("pw2", ["b" * 64, "c" * 64])
+    ft.save(path)
+    loaded = FusionTracker.open(path)
+    assert loaded.get_track("pw1").constituent_alleles[1] is \
+        loaded.get_track("pw2").constituent_alleles[0]
+
+
+def test_fuse_pathway_keeps_fused_gene_for_same_composition(tmp_path):
+    from sg.fusion import fuse_pathway
+    from sg.mutation import MutationEngine
+    from sg.phenotype import PhenotypeMap
+    from sg.registry import Registry
+
+    class CountingEngine(MutationEngine):
+        calls = 0
+
+        def mutate(self, ctx):
+            raise NotImplementedError
+
+        def generate_fused(self, pathway_name, gene_sources, loci):
+            CountingEngine.calls += 1
+            return f"def execute(i):\n    return '{{}}'  # {CountingEngine.calls}\n"
+
+    registry = Registry.open(tmp_path / "registry")
+    shas = [registry.register(f"def execute(i): return '{n}'", "l") for n in "ab"]
+    pheno = PhenotypeMap()
+    engine = CountingEngine()
+
+    first = fuse_pathway("pw", shas, ["l", "l"], registry, pheno, engine)
+    assert fuse_pathway("pw", shas, ["l", "l"], registry, pheno, engine) == first
+    assert CountingEngine.calls == 1
+    fuse_pathway("pw", shas[::-1], ["l", "l"], registry, pheno, engine)
+    assert CountingEngine.calls == 2
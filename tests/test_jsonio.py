@@ -0,0 +1,58 @@
+"""Tests for jsonio: orjson-backed JSON reading with stdlib semantics."""
+import json
+
+import pytest
+
+from sg.jsonio import dumps, dumps_indented, loads, read_json, write_json
+
+
+def test_read_json_parses_bytes(tmp_path):
+    path = tmp_path / "state.json"
+    path.write_text(json.dumps({"locus": "bridge_créate", "n": [1, 2.5]}, indent=2))
+    assert read_json(path) == {"locus": "bridge_créate", "n": [1, 2.5]}
+
+
+def test_loads_accepts_stdlib_only_values():
+    data = loads(b'{"ratio": NaN, "big": 123456789012345678901234567890}')
+    assert data["ratio"] != data["ratio"]
+    assert data["big"] == 123456789012345678901234567890
+
+
+def test_corrupt_file_raises_stdlib_decode_error(tmp_path):
+    """State loaders catch json.JSONDecodeError to recover from corruption."""
+    path = tmp_path / "state.json"
+    path.write_bytes(b'{"truncated": ')
+    with pytest.raises(json.JSONDecodeError):
+        read_json(path)
+
+
+def test_dumps_indented_round_trips_and_falls_back():
+    data = {"track": {"constituent_alleles": ["a", "b"], "count": 3}}
+    out = dumps_indented(data)
+    assert out.startswith(b'{\n  "track"')
+    assert loads(out) == data
+    big = {"n": 2 ** 70}
+    assert loads(dumps_indented(big)) == big
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_json_replaces_atomically(tmp_path, monkeypatch, use_orjson):
+    import sg.jsonio as jsonio
+    if not use_orjson:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    path = tmp_path / "fusion_tracker.json"
+    path.write_text("{}")
+    write_json(path, {"pw": {"count": 2 ** 70}})
+    assert read_json(path) == {"pw": {"count": 2 ** 70}}
+    assert path.read_text().startswith('{\n  "pw"')
+    assert not path.with_suffix(".json.tmp").exists()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_matches_stdlib_key_handling(monkeypatch, use_orjson):
+    import json
+    from sg import jsonio
+    if not use_orjson:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    obj = {1: "a", "big": 2 ** 70, "list": [True, None]}
+    assert json.loads(dumps(obj)) == json.loads(json.dumps(obj))
@@ -85,6 +85,16 @@ class TestSTP:
         assert result["stp_enabled"] is True
         assert result["forward_delay"] == 15
 
+    def test_bridge_view_tracks_mutations(self, kernel):
+        kernel.create_bridge("br0", ["eth0"])
+        kernel.get_bridge("br0")["stp_enabled"] = "tampered"
+        assert kernel.get_bridge("br0")["stp_enabled"] is False
+        kernel.set_stp("br0", True, 20)
+        kernel.attach_interface("br0", "eth1")
+        bridge = kernel.get_bridge("br0")
+        assert (bridge["stp_enabled"], bridge["forward_delay"]) == (True, 20)
+        assert bridge["interfaces"] == ["eth0", "eth1"]
+
     def test_set_stp_nonexistent(self, kernel):
         with pytest.raises(ValueError, match="does not exist"):
             kernel.set_stp("br0", True, 15)
@@ -116,6 +126,14 @@ class TestMAC:
         assert isinstance(mac, str)
         assert len(mac.split(":")) == 6
 
+    def test_generated_mac_is_stable_local_unicast(self, kernel):
+        import hashlib
+        kernel.create_bridge("br0", ["eth0"])
+        mac = kernel.get_device_mac("eth0")
+        first = int(mac[:2], 16)
+        assert first & 0x03 == 0x02
+        assert mac[2:] == hashlib.blake2b(b"eth0", digest_size=6).digest().hex(":")[2:]
+
     def test_get_device_mac_nonexistent(self, kernel):
         with pytest.raises(ValueError, match="does not exist"):
             kernel.get_device_mac("eth99")
@@ -195,6 +213,13 @@ class TestVLAN:
         kernel.delete_vlan("eth0", 100)
         assert kernel.get_vlan("eth0", 100) is None
 
+    def test_vlan_interface_follows_vlan(self, kernel):
+        kernel.create_vlan("eth0", 100)
+        assert kernel.get_interface_state("eth0.100")["name"] == "eth0.100"
+        kernel.delete_vlan("eth0", 100)
+        with pytest.raises(ValueError, match="does not exist"):
+            kernel.get_interface_state("eth0.100")
+
     def test_delete_vlan_nonexistent(self, kernel):
         with pytest.raises(ValueError, match="does not exist"):
             kernel.delete_vlan("eth0", 100)
@@ -228,6 +253,25 @@ class TestDiagnostics:
         assert fdb[0]["mac"] == "aa:bb:cc:dd:ee:ff"
         assert fdb[0]["port"] == "eth0"
 
+    def test_fdb_is_bounded_oldest_first(self, kernel, monkeypatch):
+        import sg_network.mock as mock_mod
+        monkeypatch.setattr(mock_mod, "MAX_FDB_ENTRIES", 3)
+        kernel.create_bridge("br0", ["eth0", "eth1"])
+        kernel.inject_mac_flapping("br0", "aa:bb:cc:dd:ee:ff",
+                                   ["eth0", "eth1", "eth0", "eth1"])
+        assert [e["port"] for e in kernel.read_fdb("br0")] == ["eth1", "eth0", "eth1"]
+
+    def test_read_fdb_cache_follows_writes_and_isolates_callers(self, kernel):
+        kernel.create_bridge("br0", ["eth0", "eth1"])
+        kernel.add_fdb_entry("br0", "aa:bb:cc:dd:ee:ff", "eth0")
+        kernel.read_fdb("br0")[0]["port"] = "tampered"
+        assert kernel.read_fdb("br0")[0]["port"] == "eth0"
+        kernel.inject_mac_flapping("br0", "aa:bb:cc:dd:ee:ff", ["eth1"])
+        assert [e["port"] for e in kernel.read_fdb("br0")] == ["eth0", "eth1"]
+        kernel.delete_bridge("br0")
+        kernel.create_bridge("br0", [])
+        assert kernel.read_fdb("br0") == []
+
     def test_get_interface_state(self, kernel):
         kernel.create_bridge("br0", ["eth0"])
         state = kernel.get_interface_state("eth0")
@@ -249,6 +293,15 @@ class TestDiagnostics:
         assert len(table) == 1
         assert table[0]["ip"] == "192.168.1.1"
 
+    def test_arp_table_cache_follows_writes(self, kernel):
+        kernel.add_arp_entry("192.168.1.1", "aa:bb:cc:dd:ee:ff", "eth0")
+        kernel.get_arp_table()[0]["ip"] = "tampered"
+        assert kernel.get_arp_table()[0]["ip"] == "192.168.1.1"
+        kernel.add_arp_entry("192.168.1.2", "aa:bb:cc:dd:ee:01", "eth1")
+        assert len(kernel.get_arp_table()) == 2
+        kernel.reset()
+        assert kernel.get_arp_table() == []
+
 
 # --- Anomaly injection ---
 
@@ -310,6 +363,50 @@ class TestAnomalies:
 
 # --- Resource tracking ---
 
+class TestStateObjects:
+    def test_state_dataclasses_are_slotted(self):
+        from sg_network.mock import (
+            ArpEntry, BondState, BridgeState, FdbEntry, InterfaceState, VlanState,
+        )
+        for obj in (BridgeState("br0", []), BondState("bond0", "802.3ad", []),
+                    VlanState("eth0", 100), InterfaceState("eth0"),
+                    FdbEntry("aa:bb:cc:dd:ee:ff", "eth0"),
+                    ArpEntry("10.0.0.1", "aa:bb:cc:dd:ee:ff", "eth0")):
+            assert not hasattr(obj, "__dict__")
+
+    def test_shadow_copies_slotted_state(self, kernel):
+        kernel.create_bridge("br0", ["eth0"])
+        shadow = kernel.create_shadow()
+        shadow.attach_interface("br0", "eth1")
+        assert kernel.get_bridge("br0")["interfaces"] == ["eth0"]
+
+    def test_shadow_mutations_stay_in_shadow(self, kernel):
+        kernel.create_bridge("br0", ["eth0"])
+        kernel.create_bond("bond0", "802.3ad", ["eth2"])
+        kernel.create_vlan("eth0", 100)
+        kernel.add_fdb_entry("br0", "aa:bb:cc:dd:ee:ff", "eth0")
+        kernel.add_arp_entry("10.0.0.1", "aa:bb:cc:dd:ee:ff", "eth0")
+        shadow = kernel.create_shadow()
+        assert shadow.get_vlan("eth0", 100) == kernel.get_vlan("eth0", 100)
+
+        shadow.set_stp("br0", True, 20)
+        shadow.delete_bond("bond0")
+        shadow.delete_vlan("eth0", 100)
+        shadow.inject_link_failure("eth0")
+        shadow.set_device_mac("eth0", "02:00:00:00:00:01")
+        shadow.add_fdb_entry("br0", "aa:bb:cc:dd:ee:01", "eth0")
+        shadow.add_arp_entry("10.0.0.2", "aa:bb:cc:dd:ee:01", "eth0")
+
+        assert kernel.get_bridge("br0")["stp_enabled"] is False
+        assert kernel.get_bond("bond0")["members"] == ["eth2"]
+        assert kernel.get_interface_state("eth2")["master"] == "bond0"
+        assert kernel.get_vlan("eth0", 100) is not None
+        eth0 = kernel.get_interface_state("eth0")
+        assert eth0["carrier"] is True and eth0["mac"] != "02:00:00:00:00:01"
+        assert len(kernel.read_fdb("br0")) == 1
+        assert len(kernel.get_arp_table()) == 1
+
+
 class TestResourceTracking:
     def test_track_resource(self, kernel):
         kernel.track_resource("bridge", "br0")
@@ -328,3 +425,10 @@ class TestResourceTracking:
     def test_untrack_nonexistent(self, kernel):
         # Should not raise
         kernel.untrack_resource("bridge", "br0")
+
+    def test_tracking_keeps_first_insertion_order(self, kernel):
+        for name in ("br0", "bond0", "br1"):
+            kernel.track_resource("bridge", name)
+        kernel.track_resource("bridge", "br0")
+        kernel.untrack_resource("bridge", "bond0")
+        assert kernel.tracked_resources() == [("bridge", "br0"), ("bridge", "br1")]
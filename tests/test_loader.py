@@ -66,3 +66,16 @@ def execute(input_json):
     fn = load_gene(source, kernel)
     with pytest.raises(RuntimeError, match="expected str"):
         call_gene(fn, '{}')
+
+
+def test_reloading_source_reuses_code_but_binds_kernel(kernel):
+    source = '''
+def execute(input_json):
+    return str(id(gene_sdk))
+'''
+    other = MockNetworkKernel()
+    fn_a = load_gene(source, kernel)
+    fn_b = load_gene(source, other)
+    assert fn_a.__code__ is fn_b.__code__
+    assert call_gene(fn_a, "{}") == str(id(kernel))
+    assert call_gene(fn_b, "{}") == str(id(other))
@@ -103,6 +103,14 @@ class TestMetaParamTracker:
         # Other fields still default
         assert params.immediate_weight == 0.30
 
+    def test_overrides_ignore_unknown_keys_and_copy_defaults(self):
+        tracker = MetaParamTracker()
+        tracker.overrides["bridge_create"] = {"retired_param": 1, "fusion_threshold": 4}
+        params = tracker.get_params("bridge_create")
+        assert params.fusion_threshold == 4
+        assert params is not tracker.defaults
+        assert tracker.defaults.fusion_threshold == 10
+
     def test_record_and_retrieve_snapshot(self):
         tracker = MetaParamTracker()
         tracker.record_snapshot(
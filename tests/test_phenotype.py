@@ -66,3 +66,18 @@ def test_save_and_load(pm, tmp_path):
     config = pm2.get_fused("test_pathway")
     assert config.fused_sha == "fused_sha"
     assert config.composition_fingerprint == "fp123"
+
+
+def test_fused_count_tracks_writes(pm, tmp_path):
+    assert pm.fused_count == 0
+    pm.set_fused("a", "sha_a", "fp")
+    pm.set_fused("a", "sha_a2", "fp2")
+    pm.set_fused("b", "sha_b", "fp")
+    assert pm.fused_count == 2
+    pm.clear_fused("a")
+    pm.clear_fused("missing")
+    assert pm.fused_count == 1
+
+    path = tmp_path / "phenotype.toml"
+    pm.save(path)
+    assert PhenotypeMap.load(path).fused_count == 1
@@ -156,3 +156,11 @@ class TestResourceTracking:
         assert ("table", "events") in kernel.tracked_resources()
         kernel.untrack_resource("table", "events")
         assert ("table", "events") not in kernel.tracked_resources()
+
+    def test_tracking_dedupes_and_keeps_order(self, kernel):
+        kernel.track_resource("table", "a")
+        kernel.track_resource("table", "b")
+        kernel.track_resource("table", "a")
+        assert kernel.tracked_resources() == [("table", "a"), ("table", "b")]
+        kernel.untrack_resource("table", "missing")
+        assert len(kernel.tracked_resources()) == 2
@@ -90,3 +90,185 @@ class TestDryRun:
         assert result.returncode == 0
         captured = capsys.readouterr()
         assert "[dry-run]" in captured.out
+
+
+class TestBatchedCommands:
+    @pytest.fixture
+    def calls(self, monkeypatch):
+        import subprocess
+        import sg_network.production as prod
+        seen = []
+
+        def fake_run(cmd, **kwargs):
+            seen.append((cmd, kwargs.get("input")))
+            return subprocess.CompletedProcess(cmd, 0, stdout="[]", stderr="")
+
+        monkeypatch.setattr(prod.subprocess, "run", fake_run)
+        return seen
+
+    def test_create_bond_uses_two_batches(self, calls):
+        from sg_network.production import ProductionNetworkKernel
+        kernel = ProductionNetworkKernel(use_sudo=False)
+        kernel.create_bond("sg-test-bond0", "802.3ad", ["sg-test-v0", "sg-test-v1"])
+        batches = [stdin for cmd, stdin in calls if cmd == ["ip", "-batch", "-"]]
+        assert batches == [
+            "link add sg-test-bond0 type bond mode 4\nlink set sg-test-bond0 up\n",
+            "link set sg-test-v0 down\nlink set sg-test-v0 master sg-test-bond0\n"
+            "link set sg-test-v0 up\nlink set sg-test-v1 down\n"
+            "link set sg-test-v1 master sg-test-bond0\nlink set sg-test-v1 up\n",
+        ]
+        assert kernel.tracked_resources() == [("bond", "sg-test-bond0")]
+
+    @pytest.mark.parametrize("mac", ["aa:bb\nlink del eth0", "aa bb", "#", ""])
+    def test_batch_rejects_unsafe_arguments(self, calls, mac):
+        from sg_network.production import ProductionNetworkKernel
+        kernel = ProductionNetworkKernel(use_sudo=False)
+        with pytest.raises(ValueError, match="unsafe argument"):
+            kernel.set_device_mac("sg-test-v0", mac)
+        assert calls == []
+
+    @pytest.mark.parametrize("stdout,expected", [
+        (b'[{"dst": "10.0.0.1", "lladdr": "02:00:00:00:00:01", "dev": "sg-test-v0"}]',
+         ["10.0.0.1"]),
+        (b"not json", []),
+    ])
+    def test_json_queries_parse_bytes(self, monkeypatch, stdout, expected):
+        import subprocess
+        import sg_network.production as prod
+
+        def fake_run(cmd, **kwargs):
+            assert kwargs["text"] is False
+            return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr=b"")
+
+        monkeypatch.setattr(prod.subprocess, "run", fake_run)
+        kernel = prod.ProductionNetworkKernel(use_sudo=False)
+        assert [e["ip"] for e in kernel.get_arp_table()] == expected
+
+    def test_cleanup_deletes_in_one_forced_batch(self, monkeypatch):
+        import json
+        import subprocess
+        import sg_network.production as prod
+        seen = []
+        links = [{"ifname": "eth0"}, {"ifname": "sg-test-v0"}, {"ifname": "sg-test-#1"},
+                 {"ifname": "sg-test-v0-peer"}]
+
+        def fake_run(cmd, **kwargs):
+            seen.append((cmd, kwargs.get("input"), kwargs.get("check")))
+            return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(links), stderr="")
+
+        monkeypatch.setattr(prod.subprocess, "run", fake_run)
+        kernel = prod.ProductionNetworkKernel(use_sudo=False)
+        kernel.cleanup_all_test_resources()
+        assert seen[1:] == [
+            (["ip", "-force", "-batch", "-"],
+             "link del sg-test-v0\nlink del sg-test-v0-peer\n", False),
+            (["ip", "link", "del", "sg-test-#1"], None, False),
+        ]
+
+
+class _FakeLink:
+    def __init__(self, **attrs):
+        self._attrs = attrs
+
+    def get_attr(self, name):
+        return self._attrs.get(name)
+
+
+class _FakeIPRoute:
+    LINKS = {
+        1: _FakeLink(IFLA_IFNAME="sg-test-br0", IFLA_ADDRESS="02:00:00:00:00:01",
+                     IFLA_OPERSTATE="UP"),
+        2: _FakeLink(IFLA_IFNAME="sg-test-v0", IFLA_ADDRESS="02:00:00:00:00:02",
+                     IFLA_OPERSTATE="UP", IFLA_MASTER=1),
+        3: _FakeLink(IFLA_IFNAME="sg-test-v1", IFLA_ADDRESS="02:00:00:00:00:03",
+                     IFLA_OPERSTATE="DOWN"),
+    }
+
+    def link_lookup(self, ifname):
+        return [i for i, link in self.LINKS.items()
+                if link.get_attr("IFLA_IFNAME") == ifname]
+
+    def get_links(self, *indices):
+        if not indices:
+            return list(self.LINKS.values())
+        return [self.LINKS[i] for i in indices]
+
+    def close(self):
+        self.closed = True
+
+
+class TestNetlinkBackend:
+    @pytest.fixture
+    def kernel(self, monkeypatch):
+        import sg_network.production as prod
+
+        def no_exec(cmd, **kwargs):
+            raise AssertionError(f"unexpected exec: {cmd}")
+
+        monkeypatch.setattr(prod, "IPRoute", _FakeIPRoute)
+        monkeypatch.setattr(prod.subprocess, "run", no_exec)
+        return prod.ProductionNetworkKernel(use_sudo=False, backend="netlink")
+
+    def test_link_queries_do_not_exec(self, kernel):
+        state = kernel.get_interface_state("sg-test-v0")
+        assert state["mac"] == "02:00:00:00:00:02"
+        assert state["master"] == "sg-test-br0"
+        assert kernel.get_interface_state("sg-test-v1")["master"] == ""
+        assert kernel.get_bridge("sg-test-br0")["interfaces"] == ["sg-test-v0"]
+        assert kernel.get_bridge("sg-test-missing") is None
+        with pytest.raises(ValueError, match="does not exist"):
+            kernel.get_interface_state("sg-test-missing")
+
+    def test_reset_closes_socket(self, kernel):
+        kernel.get_interface_state("sg-test-v0")
+        ipr = kernel._ipr
+        kernel.reset()
+        assert ipr.closed and kernel._ipr is None
+        kernel.close()  # already closed: no-op
+        kernel.get_interface_state("sg-test-v0")
+        assert kernel._ipr is not ipr
+
+    def test_netlink_requires_pyroute2(self, monkeypatch):
+        import sg_network.production as prod
+        monkeypatch.setattr(prod, "IPRoute", None)
+        with pytest.raises(RuntimeError, match="pyroute2"):
+            prod.ProductionNetworkKernel(backend="netlink")
+        with pytest.raises(ValueError, match="unknown backend"):
+            prod.ProductionNetworkKernel(backend="socket")
+
+
+class TestSysfsCache:
+    @pytest.fixture
+    def opens(self, monkeypatch):
+        import sg_network.production as prod
+        if not os.path.exists("/sys/class/net/lo/address"):
+            pytest.skip("sysfs not available")
+        seen = []
+        real_open = os.open
+
+        def counting_open(path, *args, **kwargs):
+            seen.append(path)
+            return real_open(path, *args, **kwargs)
+
+        monkeypatch.setattr(prod.os, "open", counting_open)
+        return seen
+
+    def test_reads_reused_until_a_change(self, opens, capsys):
+        from sg_network.production import ProductionNetworkKernel
+        kernel = ProductionNetworkKernel(use_sudo=False, dry_run=True)
+        kernel.SYSFS_TTL = 60.0
+        mac = kernel.get_device_mac("lo")
+        assert kernel.get_device_mac("lo") == mac
+        assert opens == ["/sys/class/net/lo/address"]
+        kernel._run(["ip", "link", "show", "lo"])
+        kernel.get_device_mac("lo")
+        assert len(opens) == 1
+        kernel._run(["ip", "link", "set", "sg-test-v0", "up"])
+        kernel.get_device_mac("lo")
+        assert len(opens) == 2
+
+    def test_missing_files_read_as_none(self, opens):
+        from sg_network.production import ProductionNetworkKernel
+        kernel = ProductionNetworkKernel(use_sudo=False, dry_run=True)
+        assert kernel._read_sysfs("sg-test-missing", "bonding/mode") is None
+        assert kernel._get_bond_mode("sg-test-missing") == "unknown"
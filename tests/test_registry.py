@@ -42,6 +42,13 @@ def test_source_not_found(registry):
     assert registry.load_source("nonexistent") is None
 
 
+def test_load_sources_keeps_order(registry):
+    a = registry.register("def execute(x): return 'a'", "bridge_create")
+    b = registry.register("def execute(x): return 'b'", "bridge_create")
+    assert registry.load_sources([b, "missing", a]) == [
+        "def execute(x): return 'b'", None, "def execute(x): return 'a'"]
+
+
 def test_alleles_for_locus(registry):
     sha1 = registry.register("def execute(x): return 'a'", "bridge_create")
     sha2 = registry.register("def execute(x): return 'b'", "bridge_create")
@@ -53,6 +60,15 @@ def test_alleles_for_locus(registry):
     assert sha3 not in shas
 
 
+def test_alleles_for_locus_unsorted_keeps_registration_order(registry):
+    sha1 = registry.register("def execute(x): return 'a'", "bridge_create")
+    sha2 = registry.register("def execute(x): return 'b'", "bridge_create")
+    registry.get(sha2).successful_invocations = 20
+    assert [a.sha256 for a in registry.alleles_for_locus("bridge_create")] == [sha2, sha1]
+    unsorted = registry.alleles_for_locus("bridge_create", sort=False)
+    assert [a.sha256 for a in unsorted] == [sha1, sha2]
+
+
 def test_save_and_load_index(registry):
     sha = registry.register("def execute(x): return x", "bridge_create")
     allele = registry.get(sha)
@@ -74,3 +90,64 @@ def test_lineage(registry):
     child = registry.get(child_sha)
     assert child.generation == 1
     assert child.parent_sha == parent_sha
+
+
+def test_resolve_prefix(registry):
+    sha1 = registry.register("def execute(x): return 'a'", "bridge_create")
+    sha2 = registry.register("def execute(x): return 'b'", "bridge_create")
+    assert registry.resolve_prefix(sha1) == sha1
+    assert registry.resolve_prefix(sha2[:12]) == sha2
+    assert registry.resolve_prefix("zz") is None
+    assert registry.resolve_prefix("") is None
+
+
+def test_resolve_prefix_after_delete(registry):
+    sha = registry.register("def execute(x): return 'a'", "bridge_create")
+    assert registry.resolve_prefix(sha[:8]) == sha
+    registry.delete_allele(sha)
+    assert registry.resolve_prefix(sha[:8]) is None
+    sha2 = registry.register("def execute(x): return 'b'", "bridge_create")
+    assert registry.resolve_prefix(sha2[:8]) == sha2
+
+
+def test_lineage_follows_parents(registry):
+    root = registry.register("def execute(x): return 0", "bridge_create")
+    child = registry.register("def execute(x): return 1", "bridge_create",
+                              generation=1, parent_sha=root)
+    grandchild = registry.register("def execute(x): return 2", "bridge_create",
+                                   generation=2, parent_sha=child)
+    chain = registry.lineage(grandchild[:10])
+    assert [a.sha256 for a in chain] == [grandchild, child, root]
+    assert registry.lineage("nope") == []
+
+
+def test_ancestor_at_matches_parent_walk(registry):
+    shas = [registry.register("def execute(x): return 0", "bridge_create")]
+    for gen in range(1, 40):
+        shas.append(registry.register(
+            f"def execute(x): return {gen}", "bridge_create",
+            generation=gen, parent_sha=shas[-1]))
+    tip = shas[-1]
+    for depth in range(len(shas)):
+        assert registry.ancestor_at(tip, depth).sha256 == shas[-1 - depth]
+    assert registry.ancestor_at(tip, len(shas)) is None
+    assert registry.ancestor_at(shas[5][:10], 5).sha256 == shas[0]
+
+    # New alleles invalidate the index.
+    child = registry.register("def execute(x): return 'c'", "bridge_create",
+                              parent_sha=tip)
+    assert registry.ancestor_at(child, 40).sha256 == shas[0]
+
+
+def test_loaded_fitness_records_share_strings(registry):
+    from sg.fitness import record_feedback
+    sha = registry.register("def execute(x): return 0", "bridge_create")
+    for ok in (True, False, True):
+        record_feedback(registry.get(sha), "convergence", ok, "check_health", "ab" * 32)
+    registry.save_index()
+
+    from sg.registry import Registry
+    records = Registry.open(registry.root).get(sha).fitness_records
+    assert [r["success"] for r in records] == [True, False, True]
+    assert records[0]["structure_hash"] is records[2]["structure_hash"]
+    assert records[0]["source"] is records[1]["source"]